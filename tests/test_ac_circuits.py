@@ -0,0 +1,31 @@
+"""utils.ac_circuits 的回归测试"""
+
+import numpy as np
+import pytest
+
+from utils.ac_circuits import transient
+from utils.circuits import Circuit
+
+
+def test_transient_rc_initial_frame_is_consistent():
+    c = Circuit.from_netlist("V1 a 0 5\nR1 a b 1k\nC1 b 0 100u")
+    res = transient(c, 0.5, 1e-4)
+    assert res["node_voltages"]["a"][0] == pytest.approx(5.0)
+    assert res["node_voltages"]["b"][0] == pytest.approx(0.0, abs=1e-12)
+    assert res["currents"]["R1"][0] == pytest.approx(5e-3)
+    tau = 1e3 * 100e-6
+    np.testing.assert_allclose(res["voltages"]["C1"], 5 * (1 - np.exp(-res["t"] / tau)), atol=1e-3)
+
+
+def test_transient_rl_initial_frame_is_consistent():
+    c = Circuit.from_netlist("V1 a 0 5\nR1 a b 10\nL1 b 0 1m")
+    res = transient(c, 1e-3, 1e-6, save_every=10)
+    assert res["node_voltages"]["b"][0] == pytest.approx(5.0)
+    assert res["currents"]["L1"][0] == pytest.approx(0.0, abs=1e-12)
+    np.testing.assert_allclose(res["currents"]["L1"], 0.5 * (1 - np.exp(-res["t"] / 1e-4)), atol=1e-4)
+
+
+def test_transient_time_varying_source_at_t0():
+    c = Circuit.from_netlist("V1 a 0 5\nR1 a b 1k\nC1 b 0 100u")
+    res = transient(c, 0.1, 1e-4, sources={"V1": lambda t: 2 + np.sin(100 * t)})
+    assert res["node_voltages"]["a"][0] == pytest.approx(2.0)
@@ -0,0 +1,34 @@
+"""utils.atomic_spectra 的回归测试"""
+
+import numpy as np
+import pytest
+
+from utils.atomic_spectra import SpectralTable, hydrogen_spectrum
+
+
+def test_transition_matches_table():
+    table = hydrogen_spectrum()
+    res = table.transition([3, 4, 5], 2)
+    balmer = table.series("Balmer")
+    np.testing.assert_allclose(res["wavelength"], balmer["wavelength"][::-1][:3])
+    assert res["wavelength"][0] == pytest.approx(656.1e-9, rel=1e-3)
+
+
+@pytest.mark.parametrize("n_upper, n_lower", [
+    (2, 2),            # 同一能级
+    (2, 3),            # 上下颠倒
+    (3, 0),            # 下能级越界
+    (11, 1),           # 超过 n_max
+    ([3, 11], [2, 2]),  # 数组中有一个越界
+])
+def test_transition_rejects_invalid_levels(n_upper, n_lower):
+    with pytest.raises(ValueError):
+        SpectralTable(n_max=10).transition(n_upper, n_lower)
+
+
+def test_series_rejects_levels_outside_table():
+    table = SpectralTable(n_max=5)
+    assert len(table.series(4)["wavelength"]) == 1
+    for m in (0, 5, 6, "Humphreys"):
+        with pytest.raises(ValueError):
+            table.series(m)
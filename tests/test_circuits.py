@@ -0,0 +1,87 @@
+"""utils.circuits 的回归测试"""
+
+import numpy as np
+import pytest
+
+from utils.circuits import Circuit
+
+
+def _solve_each(netlist, name, key, values):
+    """逐个取值重新求解，作为 sweep 的参照"""
+    results = []
+    for value in values:
+        c = Circuit.from_netlist(netlist)
+        c.set_value(name, **{key: value})
+        results.append(c.solve())
+    return results
+
+
+def _assert_sweep_matches(sweep, reference):
+    for group in ("node_voltages", "currents", "voltages", "power", "readings"):
+        for name, values in sweep[group].items():
+            expected = [r[group][name] for r in reference]
+            np.testing.assert_allclose(values, expected, rtol=1e-10, atol=1e-12, err_msg=f"{group}[{name}]")
+
+
+def test_sweep_current_source():
+    netlist = """
+        I1 a 0 1
+        R1 a 0 10
+    """
+    sw = Circuit.from_netlist(netlist).sweep({"I1": [1.0, 2.0, 3.0]})
+    np.testing.assert_allclose(sw["currents"]["I1"], [1.0, 2.0, 3.0])
+    np.testing.assert_allclose(sw["power"]["I1"], [-10.0, -40.0, -90.0])
+    np.testing.assert_allclose(sw["power"]["R1"], [10.0, 40.0, 90.0])
+
+
+@pytest.mark.parametrize("name, key, values", [
+    ("I1", "I", [0.0, 0.01, 0.05]),
+    ("V1", "E", [1.0, 6.0, 12.0]),
+    ("R1", "R", [1.0, 47.0, 1e3]),
+    ("VM1", "r", [100.0, 3e3, np.inf]),
+    ("AM1", "r", [0.0, 0.1, 5.0]),
+    ("V1", "r", [0.0, 0.5, 2.0]),
+])
+def test_sweep_matches_repeated_solves(name, key, values):
+    netlist = """
+        V1 a 0 6 r=1
+        I1 b 0 0.02
+        R1 a b 10
+        R2 b 0 20
+        AM1 b c r=0.5
+        R3 c 0 30
+        VM1 c 0 r=3k
+    """
+    sw = Circuit.from_netlist(netlist).sweep({name: values}, parameter={name: key})
+    _assert_sweep_matches(sw, _solve_each(netlist, name, key, values))
+
+
+# ============================================
+# 网表解析
+# ============================================
+
+def test_netlist_meter_prefix_requires_digit():
+    c = Circuit.from_netlist("VMAIN a 0 5\nR1 a b 10\nAM1 b c\nVM1 a 0\nR2 c 0 5")
+    assert c.elements["VMAIN"]["kind"] == "V"
+    assert c.elements["VMAIN"]["E"] == 5.0
+    assert c.elements["AM1"]["kind"] == "AM"
+    assert c.elements["VM1"]["kind"] == "VM"
+    assert c.solve()["readings"]["AM1"] == pytest.approx(5 / 15)
+
+
+def test_netlist_meter_with_value_is_rejected():
+    with pytest.raises(ValueError):
+        Circuit.from_netlist("V1 a 0 5\nVM1 a 0 5")
+
+
+@pytest.mark.parametrize("line", ["R1 a b", "V1 a 0 r=1", "I1 a 0", "C1 a 0", "R1 a"])
+def test_netlist_missing_value_is_rejected(line):
+    with pytest.raises(ValueError, match="格式错误"):
+        Circuit.from_netlist(line)
+
+
+def test_sweep_rejects_nonpositive_resistance():
+    c = Circuit.from_netlist("V1 a 0 5\nR1 a b 10\nR2 b 0 10\nVM1 b 0")
+    for name in ("R1", "VM1"):
+        with pytest.raises(ValueError, match="阻值必须为正"):
+            c.sweep({name: [5.0, 0.0]})
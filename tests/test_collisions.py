@@ -0,0 +1,42 @@
+"""utils.collisions 的回归测试"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from utils.collisions import simulate_collisions_1d
+
+
+def test_counting_pi():
+    r = simulate_collisions_1d([1, 2], [0, -1], [1, 100**4], walls=(0, None))
+    assert r["n_collisions"] == 31415
+    assert np.isfinite(r["t"])
+    assert np.all(np.isfinite(r["x"]))
+
+
+def test_elastic_collisions_conserve_energy_and_momentum():
+    m = np.array([1.0, 2.0, 3.0])
+    v0 = np.array([1.0, 0.0, -1.0])
+    r = simulate_collisions_1d([1, 3, 5], v0, m, widths=0.5, t_end=20.0)
+    assert r["n_block_collisions"] > 0
+    assert m @ r["v"] == pytest.approx(m @ v0)
+    assert m @ r["v"]**2 == pytest.approx(m @ v0**2)
+
+
+@pytest.mark.parametrize("args, kwargs", [
+    (([1], [1], [1]), dict(walls=(0, 10), wall_restitution=0.5)),
+    (([1, 3], [1, -1], [1, 1]), dict(restitution=0.5, walls=(0, 10))),
+    (([1, 3, 5], [1, 0, -1], [1, 2, 3]), dict(widths=0.5, restitution=[1, 0.5], walls=(0, 10))),
+])
+def test_inelastic_collapse_comes_to_rest(args, kwargs):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        r = simulate_collisions_1d(*args, max_events=10**5, **kwargs)
+    assert r["n_collisions"] < 10**4
+    assert np.isfinite(r["t"])
+    assert np.all(np.isfinite(r["x"]))
+    np.testing.assert_array_equal(r["v"], 0.0)
+    # 滑块仍在墙内且互不重叠
+    assert np.all(r["x"] >= 0) and np.all(r["x"] <= 10)
+    assert np.all(np.diff(r["x"]) >= 0)
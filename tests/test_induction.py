@@ -0,0 +1,46 @@
+"""utils.induction 的回归测试"""
+
+import numpy as np
+import pytest
+
+from utils.induction import rod_on_rails
+
+
+def _reference(t_end, B, L, R, m, v0, F, incline, mu, g=9.8, dt=1e-4):
+    """小步长逐步积分 (含静摩擦)，作为参照"""
+    theta = np.radians(incline)
+    drive = F + m * g * np.sin(theta)
+    friction = mu * m * g * np.cos(theta)
+    k = B**2 * L**2 / R
+    v, x = v0, 0.0
+    for _ in range(int(round(t_end / dt))):
+        if v == 0 and abs(drive) <= friction:
+            continue
+        direction = np.sign(v) if v != 0 else np.sign(drive)
+        v_new = v + dt * (drive - k * v - friction * direction) / m
+        if v != 0 and np.sign(v_new) != np.sign(v):
+            v_new = 0.0
+        x += 0.5 * (v + v_new) * dt
+        v = v_new
+    return v, x
+
+
+def test_rod_held_by_static_friction_stays_at_rest():
+    res = rod_on_rails(np.linspace(0, 5, 11), B=1, L=1, R=1, m=1, v0=0, incline=10, mu=0.5)
+    np.testing.assert_array_equal(res["v"], 0.0)
+    np.testing.assert_array_equal(res["x"], 0.0)
+    assert res["v_terminal"] == 0.0
+
+
+@pytest.mark.parametrize("v0, F, incline, mu", [
+    (3.0, 0.0, 10.0, 0.5),    # 沿斜面上滑后停住
+    (-3.0, 0.0, 30.0, 0.1),   # 先上滑，停下后再下滑
+    (2.0, -5.0, 0.0, 0.1),    # 外力使棒反向
+    (0.0, 2.0, 0.0, 0.1),     # 从静止被拉动
+    (0.0, 0.0, 40.0, 0.2),
+])
+def test_rod_matches_step_integration(v0, F, incline, mu):
+    res = rod_on_rails(3.0, B=1, L=1, R=1, m=1, v0=v0, F=F, incline=incline, mu=mu)
+    v_ref, x_ref = _reference(3.0, 1, 1, 1, 1, v0, F, incline, mu)
+    assert float(res["v"]) == pytest.approx(v_ref, abs=1e-3)
+    assert float(res["x"]) == pytest.approx(x_ref, abs=1e-3)
@@ -0,0 +1,47 @@
+"""utils.integrators 的回归测试"""
+
+import numpy as np
+import pytest
+
+from utils.integrators import dormand_prince, rk4, velocity_verlet
+
+
+def _oscillator(t, y):
+    return np.stack([y[:, 1], -y[:, 0]], axis=1)
+
+
+@pytest.mark.parametrize("rtol", [1e-6, 1e-8, 1e-10])
+def test_dense_output_as_accurate_as_step_ends(rtol):
+    y0 = np.array([[1.0, 0.0]])
+    t_eval = np.linspace(0, 20, 2001)
+    dense = dormand_prince(_oscillator, y0, (0, 20), t_eval=t_eval, rtol=rtol, atol=1e-3 * rtol)
+    ends = dormand_prince(_oscillator, y0, (0, 20), rtol=rtol, atol=1e-3 * rtol)
+    err_dense = np.abs(dense["y"][0, :, 0] - np.cos(t_eval)).max()
+    err_end = abs(ends["y"][0, -1, 0] - np.cos(20))
+    assert err_dense <= 5 * max(err_end, 10 * rtol)
+
+
+def test_event_located_on_dense_output():
+    sol = dormand_prince(_oscillator, np.array([[1.0, 0.0], [2.0, 0.0]]), (0, 10),
+                         event=lambda t, y: y[:, 0], event_direction=-1, rtol=1e-8)
+    np.testing.assert_allclose(sol["t_event"], np.pi / 2, atol=1e-8)
+    np.testing.assert_array_equal(sol["status"], 1)
+
+
+def test_velocity_verlet_uses_batched_time_and_args():
+    seen = []
+
+    def accel(t, x, p):
+        seen.append(np.shape(t))
+        return -p * x
+
+    omega2 = np.array([[1.0], [4.0]])
+    sol = velocity_verlet(accel, np.ones((2, 1)), np.zeros((2, 1)), 1e-3, 1000, args=omega2)
+    assert all(shape == (2,) for shape in seen)
+    np.testing.assert_allclose(sol["x"][:, -1, 0], np.cos([1.0, 2.0]), atol=1e-5)
+
+
+def test_rk4_matches_analytic_solution():
+    t = np.linspace(0, 5, 501)
+    y = rk4(_oscillator, np.array([[1.0, 0.0]]), t)
+    np.testing.assert_allclose(y[0, :, 0], np.cos(t), atol=1e-8)
@@ -0,0 +1,38 @@
+"""utils.nbody 的回归测试"""
+
+import numpy as np
+import pytest
+
+from utils import nbody
+from utils.nbody import nbody_energy, nbody_simulate
+
+
+def _energy_pairwise(pos, vel, mass, G, softening):
+    """逐对求和的参照值"""
+    E = 0.5 * np.sum(mass * np.sum(vel**2, axis=1))
+    for i in range(len(pos)):
+        for j in range(i + 1, len(pos)):
+            E -= G * mass[i] * mass[j] / np.sqrt(np.sum((pos[i] - pos[j])**2) + softening**2)
+    return E
+
+
+@pytest.mark.parametrize("d, softening", [(2, 0.0), (3, 0.05)])
+def test_energy_matches_pairwise_sum_across_chunks(monkeypatch, d, softening):
+    monkeypatch.setattr(nbody, "_DIRECT_CHUNK", 7)
+    rng = np.random.default_rng(1)
+    pos, vel = rng.normal(size=(2, 30, d))
+    mass = rng.uniform(1, 2, 30)
+    assert nbody_energy(pos, vel, mass, 1.0, softening) == pytest.approx(
+        _energy_pairwise(pos, vel, mass, 1.0, softening), rel=1e-12)
+
+
+def test_conservation_tracking_defaults_by_method():
+    rng = np.random.default_rng(2)
+    pos, vel = rng.normal(size=(2, 40, 2))
+    mass = np.full(40, 1 / 40)
+    kw = dict(G=1.0, softening=0.1, save_every=5)
+    assert "energy" in nbody_simulate(pos, vel, mass, 1e-3, 10, method="direct", **kw)
+    assert "energy" not in nbody_simulate(pos, vel, mass, 1e-3, 10, method="barnes_hut", **kw)
+    res = nbody_simulate(pos, vel, mass, 1e-3, 10, method="barnes_hut", track_conservation=True, **kw)
+    assert res["energy"].shape == res["t"].shape
+    assert res["energy_drift"].max() < 1e-3
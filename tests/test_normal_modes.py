@@ -0,0 +1,39 @@
+"""utils.normal_modes 的回归测试"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from utils.normal_modes import NormalModes
+
+
+def test_frequency_response_matches_direct_solve():
+    chain = NormalModes.chain(5, masses=0.5, springs=[1, 2, 3, 2, 1, 4], damping=0.1)
+    force = np.array([1.0, 0.0, -0.5, 0.0, 2.0])
+    f = np.array([0.0, 0.2, 0.7])
+    X = chain.frequency_response(f, force)["X"]
+    for Xi, fi in zip(X, f):
+        W = 2 * np.pi * fi
+        D = chain.K - W**2 * chain.M + 1j * W * chain.damping * chain.M
+        np.testing.assert_allclose(Xi, np.linalg.solve(D, force), atol=1e-12)
+
+
+def test_free_chain_static_balanced_force_has_no_rigid_mode_nan():
+    chain = NormalModes.chain(4, left="free", right="free")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        res = chain.frequency_response([0.0, 0.05], np.array([1.0, 0.0, 0.0, -1.0]))
+    assert np.all(np.isfinite(res["X"]))
+    # 两端各受 1 N 拉力: 三根 k = 1 的弹簧各伸长 1 m，质心不动
+    np.testing.assert_allclose(res["X"][0].real, [1.5, 0.5, -0.5, -1.5], atol=1e-12)
+
+
+def test_free_chain_static_net_force_is_unbounded():
+    chain = NormalModes.chain(4, left="free", right="free")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        res = chain.frequency_response([0.0, 0.05], np.array([1.0, 0.0, 0.0, 0.0]))
+    assert np.all(np.isinf(res["amplitude"][0]))
+    assert np.all(np.isfinite(res["amplitude"][1]))
+    assert not np.any(np.isnan(res["phase"]))
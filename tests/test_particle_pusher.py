@@ -0,0 +1,29 @@
+"""utils.particle_pusher 的回归测试"""
+
+import numpy as np
+
+from utils.particle_pusher import boris_push
+
+
+def test_final_velocity_synchronised_with_final_time():
+    # 匀强电场中 v(t) = v0 + (q/m) E t，Boris 格式对匀强场精确
+    res = boris_push(np.zeros((1, 3)), [[0.0, 1.0, 0.0]], 2.0, 0.01, 100, E=[1.0, 0.0, 0.0])
+    np.testing.assert_allclose(res["v"], [[2.0, 1.0, 0.0]], atol=1e-12)
+
+
+def test_energy_conserved_in_static_fields():
+    # 能量 v²/2 - (q/m) E·x 守恒，输出的 x、v 同步时误差为 O(dt²)
+    q_m, E = 1.0, np.array([0.3, 0.0, 0.0])
+    x0, v0 = np.zeros((1, 3)), np.array([[0.0, 1.0, 0.0]])
+    res = boris_push(x0, v0, q_m, 1e-3, 5000, E=E, B=[0.0, 0.0, 1.0])
+    energy0 = 0.5 * np.sum(v0**2)
+    energy = 0.5 * np.sum(res["v"]**2) - q_m * res["x"][0, -1] @ E
+    assert abs(energy - energy0) < 1e-5
+
+
+def test_absorbed_particle_velocity_at_absorption_time():
+    res = boris_push(np.zeros((1, 3)), [[1.0, 0.0, 0.0]], 1.0, 0.01, 200, E=[1.0, 0.0, 0.0],
+                     absorb=lambda x: x[:, 0] > 1.0)
+    # 匀加速: v² = v0² + 2 a x
+    expected = np.sqrt(1.0 + 2 * res["x_absorb"][0, 0])
+    np.testing.assert_allclose(res["v"][0], [expected, 0.0, 0.0], atol=1e-12)
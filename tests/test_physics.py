@@ -0,0 +1,146 @@
+"""utils.physics 的回归测试"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from utils.physics import (
+    compose_forces,
+    kepler_propagate,
+    momentum,
+    momentum_vector,
+    orbit_properties,
+    projectile_motion_drag,
+    uniform_circular_motion,
+    ProjectileTrajectory,
+    Trajectory,
+)
+
+
+# ============================================
+# 开普勒传播
+# ============================================
+
+def _energy_and_momentum(r, v, mu=1.0):
+    energy = 0.5 * np.sum(v**2, axis=-1) - mu / np.linalg.norm(r, axis=-1)
+    h = r[..., 0] * v[..., 1] - r[..., 1] * v[..., 0]
+    return energy, h
+
+
+@pytest.mark.parametrize("vy", [
+    1.0,                      # 圆
+    1.41,                     # 近抛物线椭圆 (e ≈ 0.988)
+    np.sqrt(2) - 1e-9,        # 刚低于抛物线阈值
+    np.sqrt(2),               # 抛物线
+    np.sqrt(2) + 1e-9,        # 刚越过抛物线阈值的双曲线
+    2.0,                      # 双曲线
+])
+def test_kepler_conserves_energy_and_angular_momentum(vy):
+    r0, v0 = np.array([1.0, 0.0]), np.array([0.0, vy])
+    period = orbit_properties(r0, v0, 1.0)["period"]
+    t = np.linspace(-min(period, 20.0), min(period, 20.0), 2001)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        r, v = kepler_propagate(r0, v0, t, 1.0)
+    energy, h = _energy_and_momentum(r, v)
+    assert np.all(np.isfinite(r))
+    np.testing.assert_allclose(energy, 0.5 * vy**2 - 1, atol=1e-10)
+    np.testing.assert_allclose(h, vy, atol=1e-9)
+
+
+@pytest.mark.parametrize("vy", [1.41, np.sqrt(2), np.sqrt(2) + 1e-9, 3.0])
+def test_kepler_propagation_composes(vy):
+    r0, v0 = np.array([1.0, 0.0]), np.array([0.0, vy])
+    r_direct, v_direct = kepler_propagate(r0, v0, 100.0, 1.0)
+    r_half, v_half = kepler_propagate(r0, v0, 60.0, 1.0)
+    r_two, v_two = kepler_propagate(r_half, v_half, 40.0, 1.0)
+    np.testing.assert_allclose(r_two, r_direct, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(v_two, v_direct, rtol=1e-9, atol=1e-9)
+
+
+def test_kepler_near_parabolic_stays_on_orbit():
+    # e ≈ 0.988: 半长轴 a = 1 / (2 - 1.41²)，远日点约 167
+    r, _ = kepler_propagate([1.0, 0.0], [0.0, 1.41], np.linspace(0, 1e4, 50), 1.0)
+    a = 1 / (2 - 1.41**2)
+    rn = np.linalg.norm(r, axis=-1)
+    assert np.all(rn >= 1.0 - 1e-9)
+    assert np.all(rn <= 2 * a - 1.0 + 1e-6)
+
+
+def test_kepler_warns_when_not_converged():
+    with pytest.warns(RuntimeWarning):
+        kepler_propagate([1.0, 0.0], [0.0, 1.41], np.linspace(0, 50, 11), 1.0, max_iter=1)
+
+
+# ============================================
+# 广播与边界情况
+# ============================================
+
+def test_compose_forces_empty_list():
+    F, theta = compose_forces([])
+    assert F == 0.0 and theta == 0.0
+
+
+def test_compose_forces_batched():
+    forces = np.array([[(1.0, 0.0), (1.0, 90.0)], [(2.0, 0.0), (2.0, 180.0)]])
+    F, theta = compose_forces(forces)
+    np.testing.assert_allclose(F, [np.sqrt(2), 0.0], atol=1e-12)
+    np.testing.assert_allclose(theta[0], 45.0)
+
+
+def test_momentum_broadcasts_like_numpy():
+    m = np.array([1.0, 2.0, 3.0])
+    v = np.arange(5.0)[:, None]
+    np.testing.assert_allclose(momentum(m, v), m * v)
+
+
+def test_momentum_vector_uses_trailing_axis():
+    p = momentum_vector([1.0, 2.0], [[3.0, 4.0], [5.0, 6.0]])
+    np.testing.assert_allclose(p, [[3.0, 4.0], [10.0, 12.0]])
+
+
+def test_uniform_circular_motion_broadcasts_over_period():
+    x, y, omega, a_c = uniform_circular_motion(2.0, np.array([1.0, 2.0, 4.0]), num_points=50)
+    assert x.shape == y.shape == (3, 50)
+    np.testing.assert_allclose(omega, 2 * np.pi / np.array([1.0, 2.0, 4.0]))
+
+
+# ============================================
+# 阻力抛体
+# ============================================
+
+def test_drag_apex_without_drag_matches_analytic():
+    res = projectile_motion_drag([10.0, 20.0, 5.0], [30.0, 60.0, -10.0], h0=[0.0, 0.0, 3.0],
+                                 k=0.0, num_points=7)
+    v0y = np.array([10.0 * np.sin(np.radians(30)), 20.0 * np.sin(np.radians(60)), 0.0])
+    np.testing.assert_allclose(res["h_max"], [0.0, 0.0, 3.0] + v0y**2 / (2 * 9.8), rtol=1e-8)
+
+
+def test_drag_apex_independent_of_output_grid():
+    coarse = projectile_motion_drag(30.0, 50.0, k=0.02, num_points=5)
+    fine = projectile_motion_drag(30.0, 50.0, k=0.02, num_points=4000)
+    assert float(coarse["h_max"]) == pytest.approx(float(fine["h_max"]), rel=1e-8)
+    assert float(coarse["h_max"]) >= np.nanmax(fine["y"]) - 1e-6
+
+
+# ============================================
+# 解析轨迹
+# ============================================
+
+def test_incomplete_trajectory_subclass_fails_at_construction():
+    class PositionOnly(Trajectory):
+        def position(self, t):
+            return t, t
+
+    with pytest.raises(TypeError):
+        PositionOnly()
+    with pytest.raises(TypeError):
+        Trajectory()
+
+
+def test_projectile_trajectory_sample():
+    traj = ProjectileTrajectory(20, 45)
+    t, x, y = traj.sample(50)
+    assert t[-1] == pytest.approx(traj.t_flight)
+    assert y[-1] == pytest.approx(0.0, abs=1e-9)
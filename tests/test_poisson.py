@@ -0,0 +1,58 @@
+"""utils.poisson 的回归测试"""
+
+import numpy as np
+import pytest
+
+from utils.poisson import solve_poisson
+
+
+def _plates(ny, nx):
+    """两块平行电极 (+1 V、-1 V)"""
+    mask = np.zeros((ny, nx), dtype=bool)
+    values = np.zeros((ny, nx))
+    for row, v in ((ny // 3, 1.0), (2 * ny // 3, -1.0)):
+        mask[row, nx // 4:3 * nx // 4] = True
+        values[row, nx // 4:3 * nx // 4] = v
+    return mask, values
+
+
+def _direct_solution(mask, values, rho, h, eps0):
+    """稠密矩阵直接求解五点差分方程，作为参照"""
+    ny, nx = mask.shape
+    fixed = mask.copy()
+    fixed[[0, -1], :] = True
+    fixed[:, [0, -1]] = True
+    idx = -np.ones((ny, nx), dtype=int)
+    free = np.argwhere(~fixed)
+    idx[~fixed] = np.arange(len(free))
+    A = np.zeros((len(free), len(free)))
+    b = -rho[~fixed] / eps0 * h**2
+    for k, (i, j) in enumerate(free):
+        A[k, k] = -4.0
+        for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if fixed[i + di, j + dj]:
+                b[k] -= values[i + di, j + dj]
+            else:
+                A[k, idx[i + di, j + dj]] = 1.0
+    V = np.where(fixed, values, 0.0)
+    V[~fixed] = np.linalg.solve(A, b)
+    return V
+
+
+@pytest.mark.parametrize("shape", [(17, 17), (16, 16), (20, 13), (24, 31)])
+def test_matches_direct_solve_for_any_grid_size(shape):
+    mask, values = _plates(*shape)
+    rng = np.random.default_rng(0)
+    rho = 1e-9 * rng.standard_normal(shape)
+    res = solve_poisson(mask, values, rho=rho, h=1e-3, eps0=8.854e-12, tol=1e-12, max_cycles=100)
+    expected = _direct_solution(mask, values, rho, 1e-3, 8.854e-12)
+    assert res["V"].shape == shape
+    np.testing.assert_allclose(res["V"], expected, atol=1e-9)
+
+
+@pytest.mark.parametrize("n", [512, 513])
+def test_multigrid_convergence_independent_of_parity(n):
+    mask, values = _plates(n, n)
+    res = solve_poisson(mask, values, h=1e-3)
+    assert res["residual"] <= 1e-6
+    assert res["cycles"] <= 20
@@ -0,0 +1,36 @@
+"""utils.ray_optics 的回归测试"""
+
+import numpy as np
+import pytest
+
+from utils.ray_optics import OpticalSurface, parallel_rays, screen, thin_lens, trace_rays
+
+
+def test_incomplete_surface_subclass_fails_at_construction():
+    class NoNormal(OpticalSurface):
+        def intersect(self, p, d):
+            return np.full(len(p), np.inf)
+
+        def center(self):
+            return np.zeros(2)
+
+    with pytest.raises(TypeError):
+        NoNormal(kind="absorb")
+    with pytest.raises(TypeError):
+        OpticalSurface()
+
+
+def test_thin_lens_focuses_parallel_rays():
+    res = trace_rays(thin_lens(0.0, 2.0, 1.0) + screen(5.0, 3.0), *parallel_rays(11, (-0.5, 0.5), x0=-1))
+    hit = np.abs(res["paths"][:, 0, 1]) > 1e-12
+    assert res["absorbed"].all()
+    np.testing.assert_allclose(res["axis_crossing"][hit], 2.0, rtol=1e-9)
+
+
+def test_axis_crossing_uses_offset_axis():
+    y0 = 3.0
+    system = thin_lens(0.0, 2.0, 1.0, y_axis=y0) + screen(5.0, 3.0, y_axis=y0)
+    origins, directions, wavelengths = parallel_rays(11, (y0 - 0.5, y0 + 0.5), x0=-1)
+    res = trace_rays(system, origins, directions, wavelengths, y_axis=y0)
+    hit = np.abs(origins[:, 1] - y0) > 1e-12
+    np.testing.assert_allclose(res["axis_crossing"][hit], 2.0, rtol=1e-9)
@@ -3,6 +3,25 @@
 """
 
 from .physics import *
+from .integrators import *
+from .nbody import *
+from .particle_pusher import *
+from .electrostatics import *
+from .poisson import *
+from .field_lines import *
+from .collisions import *
+from .hard_disk_gas import *
+from .circuits import *
+from .ac_circuits import *
+from .induction import *
+from .biot_savart import *
+from .ray_optics import *
+from .wave_optics import *
+from .radioactive_decay import *
+from .atomic_spectra import *
+from .oscillations import *
+from .normal_modes import *
+from .wave_equation import *
 from .visualization import *
 from .components import *
 
@@ -0,0 +1,369 @@
+"""
+ QuantPhysics - 交流电路
+相量法稳态分析 (谐振曲线、阻抗、功率因数)、暂态过程数值积分、波形频谱，
+以及变压器和远距离输电损耗模型。
+
+电路沿用 circuits.Circuit 的网表 (含 L、C 元件)。相量分析时电源的 E、I 取作幅值，
+对整个频率数组组装一批复数矩阵 (n_f, n, n)，一次 np.linalg.solve 求出全部频率。
+"""
+
+import numpy as np
+from typing import Callable, Dict, Optional
+
+from .circuits import Circuit
+from .physics import ArrayLike
+
+
+# ============================================
+# 相量法稳态分析
+# ============================================
+
+def _reactive_matrices(circuit: Circuit):
+    """
+    电容、电感对 MNA 矩阵的贡献: A(ω) = A₀ + jω (Cm - Lm)
+
+    Cm 为电容按电导方式组装的矩阵，Lm 在电感支路方程对角元上为 L
+    (支路方程 V_a - V_b - jωL I = 0)。
+    """
+    A0, b = circuit._assemble()
+    Cm = np.zeros_like(A0)
+    Lm = np.zeros_like(A0)
+    branches = circuit._branches()
+    for name, e in circuit.elements.items():
+        if e["kind"] == "C":
+            u = circuit._incidence(name)
+            Cm += e["C"] * np.outer(u, u)
+        elif e["kind"] == "L":
+            k = len(circuit.nodes) + branches.index(name)
+            Lm[k, k] = e["L"]
+    return A0, Cm, Lm, b
+
+
+def ac_analysis(circuit: Circuit, f: ArrayLike) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    交流稳态分析 (相量法)，所有频率一次求解
+
+    电压源的 E、电流源的 I 作为幅值 (初相为 0)，各元件参数同直流电路。
+
+    Args:
+        circuit: 含 R、L、C、电源、电表的电路
+        f: 频率 (Hz)，标量或数组 (n_f,)
+
+    Returns:
+        字典，包含 (各项为 (n_f,) 数组):
+            node_voltages, currents, voltages: 复数相量 (幅值与初相)
+            power: 各元件吸收的平均功率 ½ Re(V I*) (电源为负值) (W)
+            readings: 电表读数 (有效值)
+            impedance: 各电压源看到的外电路阻抗 Z = U / I (Ω)
+            power_factor: 各电压源输出的功率因数 cos φ
+
+    Usage:
+        c = Circuit.from_netlist("V1 a 0 10\\nR1 a b 10\\nL1 b c 0.1\\nC1 c 0 10u")
+        res = ac_analysis(c, np.linspace(10, 500, 10000))
+        np.abs(res["currents"]["V1"])  # 谐振曲线
+    """
+    omega = 2 * np.pi * np.atleast_1d(np.asarray(f, dtype=float))
+    A0, Cm, Lm, b = _reactive_matrices(circuit)
+    A = A0[None] + 1j * omega[:, None, None] * (Cm - Lm)[None]
+    try:
+        x = np.linalg.solve(A, np.broadcast_to(b.astype(complex), (len(omega), len(b)))[:, :, None])[:, :, 0]
+    except np.linalg.LinAlgError:
+        raise ValueError("电路方程奇异 (可能在 f = 0 处电容断路形成悬空节点)") from None
+
+    result = circuit._unpack(
+        x.T, capacitor_current=lambda name, v: 1j * omega * circuit.elements[name]["C"] * v)
+    voltages, currents = result["voltages"], result["currents"]
+    for name, e in circuit.elements.items():
+        p = 0.5 * np.real(voltages[name] * np.conj(currents[name]))
+        result["power"][name] = -p if e["kind"] in ("V", "I") else p
+    result["readings"] = {name: np.abs(v) / np.sqrt(2) for name, v in result["readings"].items()}
+
+    sources = [name for name, e in circuit.elements.items() if e["kind"] == "V"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result["impedance"] = {name: voltages[name] / currents[name] for name in sources}
+    result["power_factor"] = {name: np.cos(np.angle(z)) for name, z in result["impedance"].items()}
+    return result
+
+
+def rlc_series(
+    R: ArrayLike,
+    L: ArrayLike,
+    C: ArrayLike,
+    f: ArrayLike,
+    U: ArrayLike = 1.0
+) -> Dict[str, ArrayLike]:
+    """
+    RLC 串联电路的稳态响应 (解析式，参数按 NumPy 规则广播)
+
+    Args:
+        R: 电阻 (Ω)
+        L: 电感 (H)
+        C: 电容 (F)
+        f: 电源频率 (Hz)
+        U: 电源电压有效值 (V)
+
+    Returns:
+        字典，包含:
+            Z: 复阻抗 (Ω)
+            I: 电流有效值 (A)
+            phi: 电压超前电流的相位差 (度)
+            power_factor: 功率因数 cos φ
+            P: 有功功率 (W)
+            U_R, U_L, U_C: 各元件电压有效值 (V)
+            f0: 谐振频率 (Hz)
+            Q: 品质因数
+            bandwidth: 通频带宽度 f0 / Q (Hz)
+    """
+    R = np.asarray(R, dtype=float)
+    L = np.asarray(L, dtype=float)
+    C = np.asarray(C, dtype=float)
+    omega = 2 * np.pi * np.asarray(f, dtype=float)
+    X_L = omega * L
+    with np.errstate(divide="ignore"):
+        X_C = 1 / (omega * C)
+    Z = R + 1j * (X_L - X_C)
+    I = U / np.abs(Z)
+    phi = np.angle(Z)
+    f0 = 1 / (2 * np.pi * np.sqrt(L * C))
+    Q = np.sqrt(L / C) / R
+    return {
+        "Z": Z,
+        "I": I,
+        "phi": np.degrees(phi),
+        "power_factor": np.cos(phi),
+        "P": I**2 * R,
+        "U_R": I * R,
+        "U_L": I * X_L,
+        "U_C": I * X_C,
+        "f0": f0,
+        "Q": Q,
+        "bandwidth": f0 / Q,
+    }
+
+
+# ============================================
+# 暂态过程
+# ============================================
+
+def _initial_state(circuit: Circuit, A: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    t = 0 时与电路约束相容的初始状态 (电容电压、电感电流为零)
+
+    约束 G x = 0 (G 的各行为电容的 e_a - e_b 与电感的支路向量 e_k)，x = N y，N 为 G 的零空间基。
+    G 的行空间正是 M 的值域，只有与之正交的方程 Nᵀ (A x - b) = 0 不含导数项，
+    在 t = 0 必须成立: (Nᵀ A N) y = Nᵀ b。
+    初值与约束矛盾 (如理想电压源直接并联电容，电容电压必须跳变) 时返回零状态。
+    """
+    rows = [circuit._incidence(name) for name, e in circuit.elements.items() if e["kind"] in ("C", "L")]
+    if rows:
+        _, s, Vt = np.linalg.svd(np.array(rows))
+        N = Vt[int(np.sum(s > 1e-12 * s[0])):].T
+    else:
+        N = np.eye(len(b))
+    try:
+        return N @ np.linalg.solve(N.T @ A @ N, N.T @ b)
+    except np.linalg.LinAlgError:
+        return np.zeros(len(b))
+
+
+def transient(
+    circuit: Circuit,
+    t_end: float,
+    dt: float,
+    sources: Optional[Dict[str, Callable[[np.ndarray], np.ndarray]]] = None,
+    save_every: int = 1
+) -> Dict[str, np.ndarray]:
+    """
+    电路暂态过程 (如 RC 充放电、LC 振荡、RLC 阻尼振荡)
+
+    MNA 方程写成 M dx/dt + A x = b(t)，用梯形法 (A 稳定，适合时间常数相差悬殊的刚性电路) 积分，
+    第一步用后向欧拉法使代数变量满足约束，避免梯形法在初值不相容时振荡。
+    步长固定，两个迭代矩阵只求逆一次，每步只做一次矩阵-向量乘法。
+    初始状态: 电容不带电，电感无电流；t = 0 帧的其余节点电势、支路电流由此解出 (电源已接通)，
+    电压源所在节点在 t = 0 即为电源电压。
+
+    Args:
+        circuit: 电路
+        t_end: 结束时间 (s)
+        dt: 时间步长 (s)
+        sources: 随时间变化的电源 {元件名: 函数 t -> E 或 I}，函数需支持数组输入；
+                 未列出的电源保持其恒定值
+        save_every: 每隔多少步保存一次
+
+    Returns:
+        字典，包含:
+            t: 时刻 (n_saved,)
+            node_voltages, currents, voltages: 各节点电势、元件电流和电压 (n_saved,)
+                (电容电流由电压对时间的差分得到)
+
+    Usage:
+        c = Circuit.from_netlist("V1 a 0 5\\nR1 a b 1k\\nC1 b 0 100u")
+        res = transient(c, 0.5, 1e-4)
+        res["voltages"]["C1"]  # 充电曲线
+    """
+    A, Cm, Lm, b0 = _reactive_matrices(circuit)
+    M = Cm - Lm
+    n = len(b0)
+    n_steps = int(np.ceil(t_end / dt))
+    t = np.arange(n_steps + 1) * dt
+
+    # 各时刻的 b(t): 恒定部分 + 随时间变化的电源 (叠加)
+    sources = sources or {}
+    b = np.repeat(b0[:, None], n_steps + 1, axis=1)
+    source_values = {}
+    for name, func in sources.items():
+        e = circuit.elements[name]
+        key = "E" if e["kind"] == "V" else "I"
+        values = np.broadcast_to(np.asarray(func(t), dtype=float), t.shape)
+        b += np.outer(circuit._rhs_vector(name), values - e[key])
+        if e["kind"] == "I":
+            source_values[name] = values[::save_every]
+
+    try:
+        be = np.linalg.inv(M / dt + A)
+        tr = np.linalg.inv(M / dt + A / 2)
+    except np.linalg.LinAlgError:
+        raise ValueError("电路方程奇异: 存在悬空节点或由理想电压源/电流表/电感构成的回路") from None
+    step = tr @ (M / dt - A / 2)
+    # 电源项与状态无关，所有时刻一次算出
+    forcing = tr @ (0.5 * (b[:, :-1] + b[:, 1:]))
+
+    x = _initial_state(circuit, A, b[:, 0])
+    saved = np.empty((n, n_steps // save_every + 1))
+    saved[:, 0] = x
+    for i in range(n_steps):
+        if i == 0:
+            x = be @ (M @ x / dt + b[:, 1])
+        else:
+            x = step @ x + forcing[:, i]
+        if (i + 1) % save_every == 0:
+            saved[:, (i + 1) // save_every] = x
+
+    t_saved = t[::save_every][:saved.shape[1]]
+    result = circuit._unpack(
+        saved,
+        capacitor_current=lambda name, v: circuit.elements[name]["C"] * np.gradient(v, t_saved),
+        source_values=source_values)
+    del result["readings"]
+    result["t"] = t_saved
+    return result
+
+
+# ============================================
+# 频谱
+# ============================================
+
+def fft_spectrum(signal: np.ndarray, dt: float, window: Optional[str] = "hann"):
+    """
+    单边幅度谱 (沿最后一维，可批量处理多条波形)
+
+    加窗后按窗函数的平均值修正幅度，正弦分量的谱峰高度约等于其幅值。
+
+    Args:
+        signal: 等间隔采样的波形 (..., n)
+        dt: 采样间隔 (s)
+        window: "hann" 或 None (矩形窗)
+
+    Returns:
+        (freq, amplitude): 频率 (n//2+1,) (Hz) 与幅度 (..., n//2+1)
+    """
+    signal = np.asarray(signal, dtype=float)
+    n = signal.shape[-1]
+    w = np.hanning(n) if window == "hann" else np.ones(n)
+    spectrum = np.fft.rfft((signal - signal.mean(axis=-1, keepdims=True)) * w, axis=-1)
+    amplitude = 2 * np.abs(spectrum) / w.sum()
+    amplitude[..., 0] = np.abs(signal.mean(axis=-1))
+    return np.fft.rfftfreq(n, dt), amplitude
+
+
+# ============================================
+# 变压器与输电
+# ============================================
+
+def transformer(
+    U1: ArrayLike,
+    n1: ArrayLike,
+    n2: ArrayLike,
+    Z_load: ArrayLike,
+    R1: ArrayLike = 0.0,
+    R2: ArrayLike = 0.0,
+    X1: ArrayLike = 0.0,
+    X2: ArrayLike = 0.0,
+    Xm: ArrayLike = np.inf
+) -> Dict[str, ArrayLike]:
+    """
+    变压器 (T 型等效电路)，默认参数即理想变压器 U1/U2 = n1/n2，I1/I2 = n2/n1
+
+    Args:
+        U1: 原线圈电压有效值 (V)
+        n1, n2: 原、副线圈匝数
+        Z_load: 负载阻抗 (Ω)，可为复数
+        R1, R2: 原、副线圈电阻 (铜损) (Ω)
+        X1, X2: 原、副线圈漏抗 (Ω)
+        Xm: 励磁电抗 (Ω)，inf 表示不计励磁电流
+
+    Returns:
+        字典，包含:
+            U2: 副线圈负载电压有效值 (V)
+            I1, I2: 原、副线圈电流有效值 (A)
+            P_in, P_out: 输入、输出有功功率 (W)
+            efficiency: 效率
+    """
+    a = np.asarray(n1, dtype=float) / np.asarray(n2, dtype=float)
+    Z_load = np.asarray(Z_load, dtype=complex)
+    Z1 = R1 + 1j * np.asarray(X1, dtype=float)
+    # 副边折算到原边
+    Z2 = a**2 * (R2 + 1j * np.asarray(X2, dtype=float) + Z_load)
+    Xm = np.asarray(Xm, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Ym = np.where(np.isinf(Xm), 0, 1 / (1j * Xm))
+    Z_in = Z1 + 1 / (Ym + 1 / Z2)
+    I1 = U1 / Z_in
+    E = U1 - I1 * Z1
+    I2 = a * E / Z2
+    U2 = I2 * Z_load
+    P_in = np.real(U1 * np.conj(I1))
+    P_out = np.real(U2 * np.conj(I2))
+    return {
+        "U2": np.abs(U2),
+        "I1": np.abs(I1),
+        "I2": np.abs(I2),
+        "P_in": P_in,
+        "P_out": P_out,
+        "efficiency": P_out / P_in,
+    }
+
+
+def transmission_loss(
+    P: ArrayLike,
+    U: ArrayLike,
+    R_line: ArrayLike,
+    power_factor: ArrayLike = 1.0
+) -> Dict[str, ArrayLike]:
+    """
+    远距离输电的线路损耗
+
+    Args:
+        P: 输送功率 (W)
+        U: 输电电压 (V)
+        R_line: 输电线总电阻 (Ω)
+        power_factor: 功率因数
+
+    Returns:
+        字典，包含:
+            I: 输电电流 (A)
+            P_loss: 线路损耗功率 I²R (W)
+            U_drop: 线路电压损失 IR (V)
+            P_user: 用户得到的功率 (W)
+            efficiency: 输电效率
+    """
+    P = np.asarray(P, dtype=float)
+    I = P / (np.asarray(U, dtype=float) * power_factor)
+    P_loss = I**2 * R_line
+    return {
+        "I": I,
+        "P_loss": P_loss,
+        "U_drop": I * R_line,
+        "P_user": P - P_loss,
+        "efficiency": 1 - P_loss / P,
+    }
@@ -0,0 +1,212 @@
+"""
+ QuantPhysics - 类氢原子能级与光谱
+玻尔模型下类氢原子 (H、He⁺、Li²⁺ …) 的能级，以及 n_max 以内所有跃迁谱线的
+波长、频率、光子能量。谱线表在第一次使用时生成一次并缓存 (lru_cache)，
+之后按线系、波长范围的查询都是数组切片: 表按波长排序，范围查询用二分查找。
+"""
+
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Optional, Union
+
+from .physics import ArrayLike
+
+# 物理常量 (CODATA 2018)
+H_PLANCK = 6.62607015e-34        # 普朗克常量 (J·s)
+C_LIGHT = 299792458.0            # 光速 (m/s)
+E_CHARGE = 1.602176634e-19       # 元电荷 (C)
+RYDBERG_ENERGY = 13.605693122994  # 里德伯能量 (eV)
+BOHR_RADIUS = 5.29177210903e-11  # 玻尔半径 (m)
+BOHR_VELOCITY = 2.18769126364e6  # 基态电子速率 αc (m/s)
+ELECTRON_MASS_U = 5.48579909065e-4  # 电子质量 (u)
+
+SERIES = {
+    "Lyman": 1,      # 莱曼系 (紫外)
+    "Balmer": 2,     # 巴耳末系 (可见光)
+    "Paschen": 3,    # 帕邢系 (红外)
+    "Brackett": 4,
+    "Pfund": 5,
+    "Humphreys": 6,
+}
+
+# 常见金属的逸出功 (eV)
+WORK_FUNCTIONS = {
+    "Cs": 2.14,
+    "K": 2.30,
+    "Na": 2.29,
+    "Ca": 2.87,
+    "Zn": 4.33,
+    "Cu": 4.70,
+    "Pt": 5.65,
+}
+
+
+def _rydberg_energy(Z: int, mass_number: Optional[float]) -> float:
+    """Z²·Ry，给定质量数时按约化质量修正"""
+    correction = 1.0 if mass_number is None else 1 / (1 + ELECTRON_MASS_U / mass_number)
+    return RYDBERG_ENERGY * Z**2 * correction
+
+
+def energy_level(n: ArrayLike, Z: int = 1, mass_number: Optional[float] = None) -> ArrayLike:
+    """能级 E_n = -Z² Ry / n² (eV)"""
+    return -_rydberg_energy(Z, mass_number) / np.asarray(n, dtype=float)**2
+
+
+def bohr_model(n: ArrayLike, Z: int = 1) -> Dict[str, ArrayLike]:
+    """
+    玻尔模型第 n 条轨道的参数
+
+    Returns:
+        字典，包含:
+            r: 轨道半径 a₀ n² / Z (m)
+            v: 电子速率 αc Z / n (m/s)
+            E: 能量 (eV)
+            period: 绕核运动周期 (s)
+    """
+    n = np.asarray(n, dtype=float)
+    r = BOHR_RADIUS * n**2 / Z
+    v = BOHR_VELOCITY * Z / n
+    return {"r": r, "v": v, "E": energy_level(n, Z), "period": 2 * np.pi * r / v}
+
+
+def photon_energy_to_wavelength(E: ArrayLike) -> ArrayLike:
+    """光子能量 (eV) → 波长 (m)，λ = hc / E"""
+    return H_PLANCK * C_LIGHT / (np.asarray(E, dtype=float) * E_CHARGE)
+
+
+def photoelectric_effect(photon_energy: ArrayLike, work_function: Union[float, str]) -> Dict[str, ArrayLike]:
+    """
+    光电效应 E_k = hν - W₀
+
+    Args:
+        photon_energy: 光子能量 (eV)
+        work_function: 逸出功 (eV) 或 WORK_FUNCTIONS 中的金属名
+
+    Returns:
+        字典，包含:
+            emits: 能否发生光电效应
+            E_k: 光电子最大初动能 (eV)，不能发生时为 0
+            stopping_voltage: 遏止电压 (V)
+            threshold_wavelength: 截止波长 (m)
+    """
+    W = WORK_FUNCTIONS[work_function] if isinstance(work_function, str) else float(work_function)
+    E_k = np.asarray(photon_energy, dtype=float) - W
+    emits = E_k > 0
+    E_k = np.where(emits, E_k, 0.0)
+    return {
+        "emits": emits,
+        "E_k": E_k,
+        "stopping_voltage": E_k,
+        "threshold_wavelength": photon_energy_to_wavelength(W),
+    }
+
+
+# ============================================
+# 谱线表
+# ============================================
+
+class SpectralTable:
+    """
+    类氢原子 n_max 以内全部跃迁谱线 (按波长升序)
+
+    属性 (只读数组，每条谱线一个元素):
+        n_upper, n_lower: 跃迁的上、下能级
+        energy: 光子能量 (eV)
+        wavelength: 真空波长 (m)
+        frequency: 频率 (Hz)
+    levels: 能级 E_1 … E_{n_max} (eV)
+
+    Usage:
+        table = hydrogen_spectrum()
+        balmer = table.series("Balmer")
+        visible = table.in_range(380e-9, 780e-9)
+        table.photoelectric("Cs")["E_k"]
+    """
+
+    def __init__(self, Z: int = 1, n_max: int = 30, mass_number: Optional[float] = None):
+        self.Z = Z
+        self.n_max = n_max
+        self.mass_number = mass_number
+        n = np.arange(1, n_max + 1)
+        self.levels = energy_level(n, Z, mass_number)
+
+        upper, lower = np.nonzero(np.tril(np.ones((n_max, n_max), dtype=bool), k=-1))
+        energy = self.levels[upper] - self.levels[lower]
+        order = np.argsort(photon_energy_to_wavelength(energy))
+        self.n_upper = upper[order] + 1
+        self.n_lower = lower[order] + 1
+        self.energy = energy[order]
+        self.wavelength = photon_energy_to_wavelength(self.energy)
+        self.frequency = C_LIGHT / self.wavelength
+        # 各线系的谱线下标 (保持波长顺序)
+        self._series_index = {m: np.nonzero(self.n_lower == m)[0] for m in range(1, n_max)}
+
+        for a in (self.levels, self.n_upper, self.n_lower, self.energy, self.wavelength, self.frequency):
+            a.setflags(write=False)
+        for a in self._series_index.values():
+            a.setflags(write=False)
+
+    def _select(self, index: Union[np.ndarray, slice]) -> Dict[str, np.ndarray]:
+        return {
+            "n_upper": self.n_upper[index],
+            "n_lower": self.n_lower[index],
+            "energy": self.energy[index],
+            "wavelength": self.wavelength[index],
+            "frequency": self.frequency[index],
+        }
+
+    def series(self, name: Union[str, int]) -> Dict[str, np.ndarray]:
+        """
+        线系 (跃迁到同一下能级的全部谱线)
+
+        Args:
+            name: 线系名 ("Lyman"、"Balmer" …) 或下能级 n (1 ≤ n < n_max)
+
+        Returns:
+            谱线字典 (按波长升序)，另含 limit: 线系限波长 (m)
+        """
+        m = SERIES[name] if isinstance(name, str) else int(name)
+        if not 1 <= m < self.n_max:
+            raise ValueError(f"线系的下能级 n = {m} 必须在 [1, {self.n_max - 1}] 内 (n_max = {self.n_max})")
+        result = self._select(self._series_index[m])
+        result["limit"] = photon_energy_to_wavelength(-self.levels[m - 1])
+        return result
+
+    def in_range(self, wavelength_min: float, wavelength_max: float) -> Dict[str, np.ndarray]:
+        """波长在 [wavelength_min, wavelength_max] (m) 内的谱线 (二分查找)"""
+        lo = np.searchsorted(self.wavelength, wavelength_min, side="left")
+        hi = np.searchsorted(self.wavelength, wavelength_max, side="right")
+        return self._select(slice(lo, hi))
+
+    def transition(self, n_upper: ArrayLike, n_lower: ArrayLike) -> Dict[str, ArrayLike]:
+        """
+        指定跃迁的光子能量、波长、频率
+
+        Args:
+            n_upper, n_lower: 上、下能级，可为数组 (按 NumPy 规则广播)，
+                须满足 1 ≤ n_lower < n_upper ≤ n_max
+        """
+        n_upper = np.asarray(n_upper)
+        n_lower = np.asarray(n_lower)
+        if np.any((n_lower < 1) | (n_lower >= n_upper) | (n_upper > self.n_max)):
+            raise ValueError(f"跃迁能级必须满足 1 ≤ n_lower < n_upper ≤ n_max = {self.n_max}")
+        energy = self.levels[n_upper - 1] - self.levels[n_lower - 1]
+        wavelength = photon_energy_to_wavelength(energy)
+        return {"energy": energy, "wavelength": wavelength, "frequency": C_LIGHT / wavelength}
+
+    def photoelectric(self, work_function: Union[float, str]) -> Dict[str, np.ndarray]:
+        """表中每条谱线照射金属时的光电效应 (见 photoelectric_effect)"""
+        return photoelectric_effect(self.energy, work_function)
+
+
+@lru_cache(maxsize=16)
+def hydrogen_spectrum(Z: int = 1, n_max: int = 30, mass_number: Optional[float] = None) -> SpectralTable:
+    """
+    类氢原子的谱线表 (缓存，同一参数只生成一次)
+
+    Args:
+        Z: 核电荷数 (H 为 1，He⁺ 为 2)
+        n_max: 最高能级
+        mass_number: 原子核质量数，给定时按约化质量修正 (如氢取 1.00728)
+    """
+    return SpectralTable(Z, n_max, mass_number)
@@ -0,0 +1,281 @@
+"""
+ QuantPhysics - 毕奥-萨伐尔定律
+电流路径 (直导线、圆环、螺线管、亥姆霍兹线圈) 离散成直线段，
+按有限长直线段的精确公式叠加各段在网格上产生的磁感应强度 B。
+
+线段数组形状为 (n_seg, 2, 3)，即每段的起点与终点，多条路径用 np.concatenate 拼接。
+几何构造函数的结果用 lru_cache 缓存 (只读数组)，页面重新运行时不重复生成。
+"""
+
+import numpy as np
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple, Union
+
+from .physics import ArrayLike
+
+MU0 = 4e-7 * np.pi
+
+# 单批临时数组 (网格点数 × 线段数) 的元素上限，约 512 KB (float64)；
+# 临时数组能留在 CPU 缓存中时逐元素运算明显更快
+_MAX_CHUNK_ELEMENTS = 1 << 16
+
+Vector = Tuple[float, float, float]
+
+
+# ============================================
+# 电流路径
+# ============================================
+
+def _frozen(a: np.ndarray) -> np.ndarray:
+    a.setflags(write=False)
+    return a
+
+
+def _orthonormal_basis(normal: Vector) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """以 normal 为第三轴的右手正交基 (e1, e2, n)"""
+    n = np.asarray(normal, dtype=float)
+    n = n / np.linalg.norm(n)
+    helper = np.array([1.0, 0.0, 0.0]) if abs(n[0]) < 0.9 else np.array([0.0, 1.0, 0.0])
+    e1 = np.cross(helper, n)
+    e1 /= np.linalg.norm(e1)
+    return e1, np.cross(n, e1), n
+
+
+def polyline_segments(points: np.ndarray, closed: bool = False) -> np.ndarray:
+    """
+    折线路径的线段
+
+    Args:
+        points: 路径上的点 (n, 3)，电流沿点的顺序流动
+        closed: 是否首尾相连
+
+    Returns:
+        线段 (n_seg, 2, 3)
+    """
+    points = np.asarray(points, dtype=float)
+    ends = np.roll(points, -1, axis=0) if closed else points[1:]
+    starts = points if closed else points[:-1]
+    return np.stack([starts, ends], axis=1)
+
+
+@lru_cache(maxsize=64)
+def _wire_cached(start: Vector, end: Vector) -> np.ndarray:
+    return _frozen(np.array([[start, end]], dtype=float))
+
+
+def wire_segments(start: Sequence[float], end: Sequence[float]) -> np.ndarray:
+    """直导线 (一段，用精确公式无需细分)，电流从 start 流向 end"""
+    return _wire_cached(tuple(map(float, start)), tuple(map(float, end)))
+
+
+@lru_cache(maxsize=64)
+def _ring_cached(radius: float, center: Vector, normal: Vector, n: int) -> np.ndarray:
+    e1, e2, _ = _orthonormal_basis(normal)
+    phi = 2 * np.pi * np.arange(n) / n
+    points = np.asarray(center) + radius * (np.cos(phi)[:, None] * e1 + np.sin(phi)[:, None] * e2)
+    return _frozen(polyline_segments(points, closed=True))
+
+
+def ring_segments(
+    radius: float,
+    center: Sequence[float] = (0.0, 0.0, 0.0),
+    normal: Sequence[float] = (0.0, 0.0, 1.0),
+    n: int = 64
+) -> np.ndarray:
+    """
+    圆形线圈 (正 n 边形)，电流方向与 normal 成右手关系
+
+    Args:
+        radius: 半径 (m)
+        center: 圆心
+        normal: 线圈平面法向
+        n: 线段数
+    """
+    return _ring_cached(float(radius), tuple(map(float, center)), tuple(map(float, normal)), int(n))
+
+
+@lru_cache(maxsize=32)
+def _solenoid_cached(radius: float, length: float, turns: int, center: Vector,
+                     axis: Vector, n_per_turn: int) -> np.ndarray:
+    e1, e2, k = _orthonormal_basis(axis)
+    n = turns * n_per_turn
+    phi = 2 * np.pi * np.arange(n + 1) / n_per_turn
+    s = np.linspace(-0.5 * length, 0.5 * length, n + 1)
+    points = (np.asarray(center) + radius * (np.cos(phi)[:, None] * e1 + np.sin(phi)[:, None] * e2)
+              + s[:, None] * k)
+    return _frozen(polyline_segments(points))
+
+
+def solenoid_segments(
+    radius: float,
+    length: float,
+    turns: int,
+    center: Sequence[float] = (0.0, 0.0, 0.0),
+    axis: Sequence[float] = (0.0, 0.0, 1.0),
+    n_per_turn: int = 32
+) -> np.ndarray:
+    """
+    螺线管 (螺旋线)，电流绕 axis 右手旋转，管内磁场沿 axis 方向
+
+    Args:
+        radius: 半径 (m)
+        length: 长度 (m)
+        turns: 匝数
+        center: 中心
+        axis: 轴向
+        n_per_turn: 每匝线段数
+    """
+    return _solenoid_cached(float(radius), float(length), int(turns), tuple(map(float, center)),
+                            tuple(map(float, axis)), int(n_per_turn))
+
+
+def helmholtz_segments(
+    radius: float,
+    separation: Optional[float] = None,
+    center: Sequence[float] = (0.0, 0.0, 0.0),
+    normal: Sequence[float] = (0.0, 0.0, 1.0),
+    n: int = 64
+) -> np.ndarray:
+    """
+    亥姆霍兹线圈: 两个同轴、电流同向的圆形线圈，间距等于半径时中心附近磁场最均匀
+
+    Args:
+        radius: 线圈半径 (m)
+        separation: 两线圈间距 (m)，默认等于半径
+        center: 两线圈中点
+        normal: 公共轴向
+        n: 每个线圈的线段数
+    """
+    separation = radius if separation is None else separation
+    k = np.asarray(normal, dtype=float) / np.linalg.norm(normal)
+    c = np.asarray(center, dtype=float)
+    return np.concatenate([
+        ring_segments(radius, c + 0.5 * separation * k, normal, n),
+        ring_segments(radius, c - 0.5 * separation * k, normal, n),
+    ])
+
+
+# ============================================
+# 磁场
+# ============================================
+
+def biot_savart_field(
+    segments: np.ndarray,
+    I: Union[float, np.ndarray],
+    *grid: ArrayLike,
+    mu0: float = MU0,
+    max_chunk_elements: int = _MAX_CHUNK_ELEMENTS
+) -> np.ndarray:
+    """
+    电流线段在网格上产生的磁感应强度 (毕奥-萨伐尔定律)
+
+    起点 A、终点 B 的线段在点 P 处 (a = A - P，b = B - P):
+        B = μ₀I/4π · (a × b)(|a| + |b|) / (|a||b| (|a||b| + a·b))
+    其中 a × b = A × B - P × (B - A)，各点对各段的求和化为矩阵乘法。
+    网格点按块处理，每块只分配 (块大小 × 线段数) 的临时数组。
+    落在导线上的点磁场记为 0。
+
+    Args:
+        segments: 线段 (n_seg, 2, 3) (m)
+        I: 电流 (A)，标量或每段的电流 (n_seg,)
+        *grid: 网格坐标 X, Y, Z，可广播到同一形状 (如 X, 0, Z 表示 xz 平面)
+        mu0: 真空磁导率
+        max_chunk_elements: 每块临时数组的元素上限
+
+    Returns:
+        B: 磁感应强度 (3,) + grid_shape，即 Bx, By, Bz = B (T)
+
+    Usage:
+        seg = solenoid_segments(0.05, 0.4, 100)
+        X, Z = np.meshgrid(np.linspace(-0.3, 0.3, 200), np.linspace(-0.3, 0.3, 200))
+        Bx, By, Bz = biot_savart_field(seg, 2.0, X, 0, Z)
+    """
+    if len(grid) != 3:
+        raise ValueError(f"需要 X, Y, Z 三个网格坐标，实际为 {len(grid)} 个")
+    segments = np.asarray(segments, dtype=float)
+    A, Bp = segments[:, 0], segments[:, 1]
+    n_seg = len(segments)
+    coef = mu0 / (4 * np.pi) * np.broadcast_to(np.asarray(I, dtype=float), (n_seg,))
+
+    shape = np.broadcast_shapes(*(np.shape(g) for g in grid))
+    points = np.stack([np.broadcast_to(np.asarray(g, dtype=float), shape).ravel() for g in grid], axis=1)
+    n_points = len(points)
+
+    # 与网格点无关的线段量 (电流系数并入，之后只需两次矩阵乘法)
+    AxB = coef[:, None] * np.cross(A, Bp)
+    d = coef[:, None] * (Bp - A)
+    AA = np.einsum("ij,ij->i", A, A)
+    BB = np.einsum("ij,ij->i", Bp, Bp)
+    AB = np.einsum("ij,ij->i", A, Bp)
+
+    out = np.empty((n_points, 3))
+    chunk = max(1, max_chunk_elements // max(n_seg, 1))
+    for start in range(0, n_points, chunk):
+        stop = min(start + chunk, n_points)
+        p = points[start:stop]
+        pp = np.einsum("ij,ij->i", p, p)[:, None]
+        na = p @ A.T
+        nb = p @ Bp.T
+        # a·b = A·B - P·A - P·B + |P|²
+        ab = pp - na
+        ab -= nb
+        ab += AB
+        # |a|² = |A|² - 2 P·A + |P|²，|b| 同理 (原地计算，减少临时数组)
+        for n2, sq in ((na, AA), (nb, BB)):
+            n2 *= -2
+            n2 += sq
+            n2 += pp
+            np.maximum(n2, 0.0, out=n2)
+            np.sqrt(n2, out=n2)
+        prod = na * nb
+        ab += prod
+        # 点在线段上时 |a||b| + a·b → 0，该段的贡献记为 0
+        valid = ab > 1e-12 * prod
+        ab *= prod
+        na += nb
+        w = np.divide(na, ab, out=np.zeros_like(na), where=valid)
+        # Σ_j w_ij (A_j × B_j - p_i × d_j) = w @ AxB - p_i × (w @ d)
+        out[start:stop] = w @ AxB - np.cross(p, w @ d)
+
+    return np.moveaxis(out, -1, 0).reshape((3,) + shape)
+
+
+# ============================================
+# 解析公式
+# ============================================
+
+def straight_wire_field(I: ArrayLike, d: ArrayLike, mu0: float = MU0) -> ArrayLike:
+    """无限长直导线在距离 d 处的磁感应强度 B = μ₀I / (2πd)"""
+    return mu0 * np.asarray(I, dtype=float) / (2 * np.pi * np.asarray(d, dtype=float))
+
+
+def ring_axis_field(I: ArrayLike, R: ArrayLike, z: ArrayLike, mu0: float = MU0) -> ArrayLike:
+    """圆形线圈轴线上距圆心 z 处的磁感应强度 B = μ₀IR² / (2(R² + z²)^{3/2})"""
+    R = np.asarray(R, dtype=float)
+    return mu0 * np.asarray(I, dtype=float) * R**2 / (2 * (R**2 + np.asarray(z, dtype=float)**2)**1.5)
+
+
+def solenoid_axis_field(
+    I: ArrayLike,
+    n: ArrayLike,
+    R: ArrayLike,
+    length: ArrayLike,
+    z: ArrayLike,
+    mu0: float = MU0
+) -> ArrayLike:
+    """
+    有限长螺线管轴线上的磁感应强度 (z 从螺线管中心算起)
+
+    B = μ₀nI/2 · (cos α₁ - cos α₂)，长螺线管内部趋于 μ₀nI
+
+    Args:
+        I: 电流 (A)
+        n: 单位长度匝数 (1/m)
+        R: 半径 (m)
+        length: 长度 (m)
+        z: 轴上位置 (m)
+    """
+    z = np.asarray(z, dtype=float)
+    u1 = z + 0.5 * length
+    u2 = z - 0.5 * length
+    return 0.5 * mu0 * n * I * (u1 / np.sqrt(u1**2 + R**2) - u2 / np.sqrt(u2**2 + R**2))
@@ -0,0 +1,455 @@
+"""
+ QuantPhysics - 直流电路求解 (改进节点分析法 MNA)
+由网表描述电路，支持电阻、理想电源 (可带内阻)、电流源以及内阻有限的电流表、电压表，
+用于欧姆定律、闭合电路、滑动变阻器、电表改装等演示。
+
+未知量为各节点电势 (接地节点除外) 与电压源、电流表的支路电流，方程组 A x = b。
+电路只有几十个节点，用稠密矩阵即可: A 的逆在电路结构不变时缓存复用，
+扫描元件参数时电阻值的变化是 A 的低秩修正 (Woodbury 公式)，电源值的变化只改 b (叠加原理)，
+数百个滑块位置一次向量化求出，不重新组装和分解矩阵。
+
+网表格式 (每行一个元件，# 之后为注释，节点 0 或 gnd 为接地点):
+    V1  1 0 12 r=0.5    电压源: 正极 负极 电动势 [内阻]
+    I1  2 0 0.01        电流源: 流出端 流入端 电流
+    R1  1 2 10k         电阻
+    L1  2 3 10m         电感 (直流下为导线，交流、暂态分析见 ac_circuits)
+    C1  3 0 100u        电容 (直流下断路)
+    AM1 2 3 r=0.1       电流表: 电流从第一个节点流入 [内阻，默认 0]
+    VM1 3 0 r=3k        电压表: [内阻，默认无穷大]
+数值可带后缀 G M k m u n p (如 4.7k、100u)。
+电表名为 AM、VM 后接数字 (如 AM1、VM2)，VMAIN 等其他以 V 开头的名称仍是电压源。
+"""
+
+import numpy as np
+from typing import Callable, Dict, List, Optional
+
+from .physics import ArrayLike
+
+_GROUND_NAMES = ("0", "gnd", "GND")
+_SUFFIXES = {"G": 1e9, "M": 1e6, "k": 1e3, "K": 1e3, "m": 1e-3, "u": 1e-6, "n": 1e-9, "p": 1e-12}
+# 有支路电流未知量的元件种类
+_BRANCH_KINDS = ("V", "AM", "L")
+
+
+def _parse_value(text: str) -> float:
+    """解析带工程后缀的数值，如 4.7k、100u"""
+    if text[-1] in _SUFFIXES:
+        return float(text[:-1]) * _SUFFIXES[text[-1]]
+    return float(text)
+
+
+def _element_prefix(name: str) -> str:
+    """
+    元件类型前缀: 电表为 AM、VM 后接数字或名称结束 (AM1、VM)，其他元件取首字母
+
+    VMAIN、AMP1 等仍按首字母分别识别为电压源和未知元件，不会被当作电表而丢掉数值。
+    """
+    head = name[:2].upper()
+    if head in ("AM", "VM") and (len(name) == 2 or name[2].isdigit()):
+        return head
+    return name[0].upper()
+
+
+# ============================================
+# 电路
+# ============================================
+
+class Circuit:
+    """
+    直流电路 (改进节点分析法)
+
+    元件种类 (kind):
+        "R": 电阻，参数 R
+        "V": 电压源，参数 E (电动势)、r (内阻)
+        "I": 电流源，参数 I
+        "AM": 电流表，参数 r (内阻，0 为理想电流表)
+        "VM": 电压表，参数 r (内阻，inf 为理想电压表)
+        "L": 电感，参数 L (直流下相当于导线)
+        "C": 电容，参数 C (直流下相当于断路)
+
+    电流方向: 电源为从正极 (第一个节点) 流出到外电路的电流，
+    其他元件为从第一个节点经元件流向第二个节点的电流。
+
+    Usage:
+        c = Circuit.from_netlist('''
+            V1 a 0 6 r=1
+            R1 a b 10
+            AM1 b 0 r=0.5
+        ''')
+        c.solve()["readings"]["AM1"]
+        # 滑动变阻器: 扫描 200 个阻值，一次求出
+        sw = c.sweep({"R1": np.linspace(1, 50, 200)})
+        sw["currents"]["V1"]  # (200,)
+    """
+
+    def __init__(self):
+        self.elements: Dict[str, Dict] = {}
+        self.nodes: List[str] = []
+        self._inv: Optional[np.ndarray] = None
+
+    # ----------------------------------------
+    # 构建
+    # ----------------------------------------
+
+    @classmethod
+    def from_netlist(cls, netlist: str) -> "Circuit":
+        """由网表文本构建电路 (格式见模块说明)"""
+        circuit = cls()
+        for line_no, line in enumerate(netlist.splitlines(), 1):
+            tokens = line.split("#", 1)[0].split()
+            if not tokens:
+                continue
+            name = tokens[0]
+            prefix = _element_prefix(name)
+            if len(tokens) < 3:
+                raise ValueError(f"网表第 {line_no} 行格式错误: {line.strip()}")
+            a, b = tokens[1], tokens[2]
+            values = [t for t in tokens[3:] if "=" not in t]
+            options = dict(t.split("=", 1) for t in tokens[3:] if "=" in t)
+            r = _parse_value(options["r"]) if "r" in options else None
+            if prefix in ("AM", "VM") and values:
+                raise ValueError(f"网表第 {line_no} 行: 电表 {name} 只能用 r= 指定内阻: {line.strip()}")
+            if prefix in ("R", "V", "E", "I", "L", "C") and not values:
+                raise ValueError(f"网表第 {line_no} 行格式错误: {line.strip()}")
+
+            if prefix == "R":
+                circuit.add_resistor(name, a, b, _parse_value(values[0]))
+            elif prefix in ("V", "E"):
+                circuit.add_voltage_source(name, a, b, _parse_value(values[0]), r or 0.0)
+            elif prefix == "I":
+                circuit.add_current_source(name, a, b, _parse_value(values[0]))
+            elif prefix == "AM":
+                circuit.add_ammeter(name, a, b, r or 0.0)
+            elif prefix == "VM":
+                circuit.add_voltmeter(name, a, b, np.inf if r is None else r)
+            elif prefix == "L":
+                circuit.add_inductor(name, a, b, _parse_value(values[0]))
+            elif prefix == "C":
+                circuit.add_capacitor(name, a, b, _parse_value(values[0]))
+            else:
+                raise ValueError(f"网表第 {line_no} 行: 未知的元件类型 {name}")
+        return circuit
+
+    def _add(self, name: str, kind: str, a: str, b: str, **params) -> None:
+        if name in self.elements:
+            raise ValueError(f"元件名重复: {name}")
+        for node in (a, b):
+            if node not in _GROUND_NAMES and node not in self.nodes:
+                self.nodes.append(node)
+        self.elements[name] = {"kind": kind, "a": a, "b": b, **params}
+        self._inv = None
+
+    def add_resistor(self, name: str, a: str, b: str, R: float) -> None:
+        """电阻 R (Ω)"""
+        self._add(name, "R", a, b, R=float(R))
+
+    def add_voltage_source(self, name: str, plus: str, minus: str, E: float, r: float = 0.0) -> None:
+        """电压源: 电动势 E (V)，内阻 r (Ω)"""
+        self._add(name, "V", plus, minus, E=float(E), r=float(r))
+
+    def add_current_source(self, name: str, out: str, into: str, I: float) -> None:
+        """电流源: 电流 I (A) 从 out 节点流出到外电路，从 into 节点流回"""
+        self._add(name, "I", out, into, I=float(I))
+
+    def add_ammeter(self, name: str, a: str, b: str, r: float = 0.0) -> None:
+        """电流表: 内阻 r (Ω)，读数为从 a 流向 b 的电流"""
+        self._add(name, "AM", a, b, r=float(r))
+
+    def add_voltmeter(self, name: str, a: str, b: str, r: float = np.inf) -> None:
+        """电压表: 内阻 r (Ω)，读数为 a、b 两点的电势差"""
+        self._add(name, "VM", a, b, r=float(r))
+
+    def add_inductor(self, name: str, a: str, b: str, L: float) -> None:
+        """电感 L (H)"""
+        self._add(name, "L", a, b, L=float(L))
+
+    def add_capacitor(self, name: str, a: str, b: str, C: float) -> None:
+        """电容 C (F)"""
+        self._add(name, "C", a, b, C=float(C))
+
+    def set_value(self, name: str, **params: float) -> None:
+        """修改元件参数，如 set_value("R1", R=20)、set_value("V1", E=3, r=0.5)"""
+        element = self.elements[name]
+        for key, value in params.items():
+            if key not in element or key in ("kind", "a", "b"):
+                raise ValueError(f"元件 {name} 没有参数 {key}")
+            element[key] = float(value)
+        self._inv = None
+
+    # ----------------------------------------
+    # 方程组
+    # ----------------------------------------
+
+    def _branches(self) -> List[str]:
+        """有支路电流未知量的元件 (电压源、电流表、电感)"""
+        return [n for n, e in self.elements.items() if e["kind"] in _BRANCH_KINDS]
+
+    def _index(self, node: str) -> int:
+        """节点在未知量中的下标，接地节点为 -1"""
+        return -1 if node in _GROUND_NAMES else self.nodes.index(node)
+
+    def _incidence(self, name: str) -> np.ndarray:
+        """
+        元件的修正向量 u 与符号 s: 参数 p 对 A 的贡献为 s * p * u uᵀ
+
+        电阻: u = e_a - e_b，p = 1/R (电导)，s = +1
+        支路 (电压源、电流表、电感): u = e_k (支路方程)，p = r，s = -1
+        """
+        e = self.elements[name]
+        n = len(self.nodes) + len(self._branches())
+        u = np.zeros(n)
+        if e["kind"] in _BRANCH_KINDS:
+            u[len(self.nodes) + self._branches().index(name)] = 1.0
+        else:
+            ia, ib = self._index(e["a"]), self._index(e["b"])
+            if ia >= 0:
+                u[ia] += 1.0
+            if ib >= 0:
+                u[ib] -= 1.0
+        return u
+
+    def _assemble(self):
+        """组装 A 与 b"""
+        n_nodes = len(self.nodes)
+        branches = self._branches()
+        n = n_nodes + len(branches)
+        A = np.zeros((n, n))
+        b = np.zeros(n)
+        for name, e in self.elements.items():
+            ia, ib = self._index(e["a"]), self._index(e["b"])
+            kind = e["kind"]
+            if kind in ("R", "VM"):
+                R = e["R"] if kind == "R" else e["r"]
+                if np.isinf(R):
+                    continue
+                if R <= 0:
+                    raise ValueError(f"电阻 {name} 的阻值必须为正 (理想导线请用 r=0 的电流表)")
+                u = self._incidence(name)
+                A += np.outer(u, u) / R
+            elif kind == "I":
+                if ia >= 0:
+                    b[ia] += e["I"]
+                if ib >= 0:
+                    b[ib] -= e["I"]
+            elif kind in _BRANCH_KINDS:
+                # 支路电流 I 从 a 经元件流向 b: KCL 中 a 点流出 +I，b 点流出 -I；
+                # 支路方程 V_a - V_b - r I = E (电流表、电感 E = 0，电感直流下 r = 0)
+                k = n_nodes + branches.index(name)
+                if ia >= 0:
+                    A[ia, k] = A[k, ia] = 1.0
+                if ib >= 0:
+                    A[ib, k] = A[k, ib] = -1.0
+                A[k, k] = -e.get("r", 0.0)
+                b[k] = e.get("E", 0.0)
+        return A, b
+
+    def _inverse(self) -> np.ndarray:
+        """A 的逆 (缓存，电路结构或参数改变后重新计算)"""
+        if self._inv is None:
+            A, _ = self._assemble()
+            try:
+                self._inv = np.linalg.inv(A)
+            except np.linalg.LinAlgError:
+                raise ValueError("电路方程奇异: 存在悬空节点或由理想电压源/电流表/电感构成的回路") from None
+        return self._inv
+
+    def _rhs_vector(self, name: str) -> np.ndarray:
+        """电源参数 (E 或 I) 为 1 时对 b 的贡献"""
+        e = self.elements[name]
+        n = len(self.nodes) + len(self._branches())
+        col = np.zeros(n)
+        if e["kind"] == "V":
+            col[len(self.nodes) + self._branches().index(name)] = 1.0
+        else:
+            ia, ib = self._index(e["a"]), self._index(e["b"])
+            if ia >= 0:
+                col[ia] += 1.0
+            if ib >= 0:
+                col[ib] -= 1.0
+        return col
+
+    # ----------------------------------------
+    # 求解
+    # ----------------------------------------
+
+    def solve(self) -> Dict[str, Dict[str, float]]:
+        """
+        求解当前电路
+
+        Returns:
+            字典，包含:
+                node_voltages: 各节点电势 (接地为 0) (V)
+                currents: 各元件电流 (方向见类说明) (A)
+                voltages: 各元件两端电压 V_a - V_b (V)
+                power: 各元件吸收的功率 (电源为负值，即输出功率) (W)
+                readings: 电流表、电压表的读数
+        """
+        _, b = self._assemble()
+        x = self._inverse() @ b
+        result = self._unpack(x[:, None])
+        return {key: {k: float(v[0]) for k, v in group.items()} for key, group in result.items()}
+
+    def sweep(self, values: Dict[str, ArrayLike], parameter: Optional[Dict[str, str]] = None
+              ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        同时扫描一个或多个元件参数 (如滑动变阻器的位置)，一次求出全部结果
+
+        电阻 (含电表、电源内阻) 的变化作为 A 的低秩修正，电源值的变化作为 b 的修正，
+        均复用缓存的 A⁻¹，不重新组装矩阵。
+
+        Args:
+            values: {元件名: 参数值数组}，各数组长度相同 (或为标量)，按位置一一对应
+            parameter: {元件名: 参数名}，默认电阻为 "R"，电压源为 "E"，电流源为 "I"，
+                       电表为 "r"；扫描电压源内阻时指定 {"V1": "r"}
+
+        Returns:
+            与 solve() 相同的字典，各项为 (n_values,) 数组
+
+        Usage:
+            # 分压接法: 滑片位置 x 把总阻值 R0 分成两段
+            x = np.linspace(0, 1, 300)
+            sw = c.sweep({"Rup": R0 * (1 - x), "Rdown": R0 * x})
+        """
+        parameter = parameter or {}
+        arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in values.values()))
+        inv = self._inverse()
+        _, b = self._assemble()
+        x = np.repeat((inv @ b)[:, None], arrays[0].size, axis=1)
+
+        # 电源值: 叠加原理，x += Δ * A⁻¹ b_k
+        low_rank = []
+        source_values, resistance_values = {}, {}
+        for (name, vals) in zip(values, arrays):
+            e = self.elements[name]
+            key = parameter.get(name, {"R": "R", "V": "E", "I": "I", "AM": "r", "VM": "r"}.get(e["kind"]))
+            if key in ("E", "I"):
+                x += np.outer(inv @ self._rhs_vector(name), vals - e[key])
+                if key == "I":
+                    source_values[name] = vals
+            elif key in ("R", "r"):
+                low_rank.append((name, key, vals))
+                if e["kind"] in ("R", "VM"):
+                    if np.any(vals <= 0):
+                        raise ValueError(f"电阻 {name} 的阻值必须为正 (理想导线请用 r=0 的电流表)")
+                    resistance_values[name] = vals
+            else:
+                raise ValueError(f"元件 {name} 没有参数 {key}")
+
+        # 阻值: A(p) = A₀ + U diag(Δ) Uᵀ，Woodbury 公式
+        # x = x₀ - W (I + Δ Uᵀ W)⁻¹ Δ Uᵀ x₀，W = A₀⁻¹ U
+        if low_rank:
+            U = np.stack([self._incidence(name) for name, _, _ in low_rank], axis=1)
+            delta = np.stack([self._parameter_delta(name, key, vals) for name, key, vals in low_rank], axis=1)
+            W = inv @ U
+            k = U.shape[1]
+            M = np.eye(k) + delta[:, :, None] * (U.T @ W)[None, :, :]
+            rhs = delta * (U.T @ x).T
+            y = np.linalg.solve(M, rhs[:, :, None])[:, :, 0]
+            x -= W @ y.T
+
+        return self._unpack(x, source_values=source_values, resistance_values=resistance_values)
+
+    def _parameter_delta(self, name: str, key: str, vals: np.ndarray) -> np.ndarray:
+        """阻值参数相对当前值的变化量 s * (p - p₀) (电阻为电导的变化，支路为 -r 的变化)"""
+        e = self.elements[name]
+        if e["kind"] in _BRANCH_KINDS:
+            if key != "r" or e["kind"] == "L":
+                raise ValueError(f"元件 {name} 没有参数 {key}")
+            return -(vals - e["r"])
+        R0 = e["R"] if e["kind"] == "R" else e["r"]
+        return 1 / vals - (0.0 if np.isinf(R0) else 1 / R0)
+
+    def _unpack(
+        self,
+        x: np.ndarray,
+        capacitor_current: Optional[Callable[[str, np.ndarray], np.ndarray]] = None,
+        source_values: Optional[Dict[str, np.ndarray]] = None,
+        resistance_values: Optional[Dict[str, np.ndarray]] = None
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        把解向量 (n, n_values) 整理为各节点、各元件的物理量
+
+        Args:
+            x: 解向量，可为复数 (相量)
+            capacitor_current: (元件名, 两端电压) -> 电容电流，默认为 0 (直流)
+            source_values: 电流源随扫描点变化的取值 {元件名: (n_values,)}
+            resistance_values: 电阻、电压表内阻随扫描点变化的取值 {元件名: (n_values,)}
+        """
+        n_nodes = len(self.nodes)
+        branches = self._branches()
+        m = x.shape[1]
+        zero = np.zeros(m)
+        source_values = source_values or {}
+        resistance_values = resistance_values or {}
+        node_v = {name: x[i] for i, name in enumerate(self.nodes)}
+
+        def potential(node):
+            return zero if node in _GROUND_NAMES else node_v[node]
+
+        currents, voltages, power, readings = {}, {}, {}, {}
+        for name, e in self.elements.items():
+            v = potential(e["a"]) - potential(e["b"])
+            kind = e["kind"]
+            if kind in _BRANCH_KINDS:
+                i = x[n_nodes + branches.index(name)]
+                i = -i if kind == "V" else i
+            elif kind == "I":
+                i = source_values.get(name, np.full(m, e["I"]))
+            elif kind == "C":
+                i = zero if capacitor_current is None else capacitor_current(name, v)
+            else:
+                R = resistance_values.get(name, e["R"] if kind == "R" else e["r"])
+                i = v / R
+            voltages[name] = v
+            currents[name] = i
+            # 电源: 电流从正极流出，吸收功率为 -V I
+            power[name] = -v * i if kind in ("V", "I") else v * i
+            if kind == "AM":
+                readings[name] = i
+            elif kind == "VM":
+                readings[name] = v
+
+        node_v.update({g: zero for g in _GROUND_NAMES if any(
+            g in (e["a"], e["b"]) for e in self.elements.values())})
+        return {
+            "node_voltages": node_v,
+            "currents": currents,
+            "voltages": voltages,
+            "power": power,
+            "readings": readings,
+        }
+
+
+# ============================================
+# 电表改装
+# ============================================
+
+def shunt_resistance(Ig: ArrayLike, Rg: ArrayLike, I_range: ArrayLike) -> ArrayLike:
+    """
+    表头改装成电流表需并联的分流电阻 R = Ig Rg / (I - Ig)
+
+    Args:
+        Ig: 表头满偏电流 (A)
+        Rg: 表头内阻 (Ω)
+        I_range: 改装后的量程 (A)
+
+    Returns:
+        分流电阻 (Ω)
+    """
+    Ig = np.asarray(Ig, dtype=float)
+    return Ig * Rg / (np.asarray(I_range, dtype=float) - Ig)
+
+
+def series_resistance(Ig: ArrayLike, Rg: ArrayLike, U_range: ArrayLike) -> ArrayLike:
+    """
+    表头改装成电压表需串联的分压电阻 R = U / Ig - Rg
+
+    Args:
+        Ig: 表头满偏电流 (A)
+        Rg: 表头内阻 (Ω)
+        U_range: 改装后的量程 (V)
+
+    Returns:
+        分压电阻 (Ω)
+    """
+    return np.asarray(U_range, dtype=float) / Ig - np.asarray(Rg, dtype=float)
@@ -0,0 +1,184 @@
+"""
+ QuantPhysics - 一维多体碰撞 (事件驱动)
+N 个滑块在一条直线上运动，两端可有墙壁。两次碰撞之间各滑块匀速运动，
+因此可以解析预测下一次碰撞的时刻并直接跳过去，不做时间步进。
+
+未来事件存放在优先队列 (堆) 中; 滑块速度改变后其旧事件不从堆中删除，
+而是通过版本号在取出时判为失效 (惰性失效)。
+
+恢复系数小于 1 时可能出现非弹性塌缩 (有限时间内无穷多次碰撞，如弹跳逐渐减弱的球)。
+碰后速度低于 rest_speed 的滑块视为静止，碰后相对速度低于 rest_speed 的两滑块以共同速度
+一起运动 (按完全非弹性碰撞处理)，从而事件数有限，速度也不会衰减到下溢。
+"""
+
+import heapq
+import numpy as np
+from typing import Dict, Optional, Tuple, Union
+
+from .physics import inelastic_collision_1d
+
+
+def simulate_collisions_1d(
+    x: np.ndarray,
+    v: np.ndarray,
+    m: np.ndarray,
+    widths: Union[float, np.ndarray] = 0.0,
+    restitution: Union[float, np.ndarray] = 1.0,
+    walls: Tuple[Optional[float], Optional[float]] = (None, None),
+    wall_restitution: float = 1.0,
+    t_end: float = np.inf,
+    rest_speed: Optional[float] = None,
+    max_events: int = 10**7,
+    sample_times: Optional[np.ndarray] = None,
+    record_events: bool = False
+) -> Dict[str, np.ndarray]:
+    """
+    事件驱动的一维多滑块碰撞模拟
+
+    Args:
+        x: 各滑块中心的初始位置 (N,)，需按从左到右排列且互不重叠 (m)
+        v: 初速度 (N,) (m/s)
+        m: 质量 (N,) (kg)
+        widths: 滑块宽度，标量或 (N,) (m)，0 表示质点
+        restitution: 相邻滑块间的恢复系数，标量或 (N-1,)，第 i 个对应滑块 i 与 i+1
+        walls: 左右墙壁的位置 (None 表示没有墙)
+        wall_restitution: 滑块与墙壁碰撞的恢复系数
+        t_end: 模拟结束时间 (s)，默认一直进行到不再发生碰撞
+        rest_speed: 静止判据 (m/s)，碰后速度 (或两滑块的相对速度) 低于此值时视为 (相对) 静止，
+            默认为初速度最大值的 1e-9 倍
+        max_events: 最多处理的碰撞次数
+        sample_times: 需要输出全部滑块位置的时刻 (升序)
+        record_events: 是否记录每次碰撞的时刻与类型
+
+    Returns:
+        字典，包含:
+            n_collisions: 碰撞总次数
+            n_block_collisions, n_wall_collisions: 滑块间、滑块与墙的碰撞次数
+            t: 结束时刻 (t_end 或最后一次碰撞的时刻，没有碰撞时为 0)
+            x, v: 结束时刻的位置与速度 (N,)
+            x_samples: sample_times 各时刻的位置 (n_samples, N)
+            event_t, event_index: 碰撞时刻与类型 (record_events=True 时)，
+                类型 i ∈ [0, N-2] 为滑块 i 与 i+1，-1 为左墙，-2 为右墙
+
+    Usage:
+        # 数 π: 墙 - 小滑块 - 大滑块，质量比 100^(d-1) 时碰撞次数为 π 的前 d 位
+        r = simulate_collisions_1d([1, 2], [0, -1], [1, 100**4], walls=(0, None))
+        r["n_collisions"]  # 31415
+    """
+    x = [float(a) for a in np.atleast_1d(x)]
+    v = [float(a) for a in np.atleast_1d(v)]
+    n = len(x)
+    m = [float(a) for a in np.broadcast_to(np.asarray(m, dtype=float), (n,))]
+    half = [0.5 * float(a) for a in np.broadcast_to(np.asarray(widths, dtype=float), (n,))]
+    e_pair = [float(a) for a in np.broadcast_to(np.asarray(restitution, dtype=float), (max(n - 1, 0),))]
+    left, right = walls
+    if rest_speed is None:
+        rest_speed = 1e-9 * max((abs(a) for a in v), default=0.0)
+
+    # 每个滑块的参考时刻与参考位置: x(t) = x_ref + v * (t - t_ref)
+    t_ref = [0.0] * n
+    version = [0] * n
+    heap = []
+
+    def position(i, t):
+        return x[i] + v[i] * (t - t_ref[i])
+
+    def push(t, k, va, vb):
+        # 接近速度极小时 gap / closing 可能溢出为 inf，这样的事件永远不会发生
+        if np.isfinite(t):
+            heapq.heappush(heap, (t, k, va, vb))
+
+    def schedule_pair(i, now):
+        closing = v[i] - v[i + 1]
+        if closing > 0:
+            gap = position(i + 1, now) - position(i, now) - half[i] - half[i + 1]
+            push(now + max(gap, 0.0) / closing, i, version[i], version[i + 1])
+
+    def schedule_walls(i, now):
+        if i == 0 and left is not None and v[0] < 0:
+            gap = position(0, now) - half[0] - left
+            push(now + max(gap, 0.0) / -v[0], -1, version[0], version[0])
+        if i == n - 1 and right is not None and v[-1] > 0:
+            gap = right - position(n - 1, now) - half[-1]
+            push(now + max(gap, 0.0) / v[-1], -2, version[-1], version[-1])
+
+    for i in range(n - 1):
+        schedule_pair(i, 0.0)
+    if n:
+        schedule_walls(0, 0.0)
+        schedule_walls(n - 1, 0.0)
+
+    sample_times = np.empty(0) if sample_times is None else np.asarray(sample_times, dtype=float)
+    x_samples = np.empty((len(sample_times), n))
+    next_sample = 0
+
+    def take_samples(until):
+        nonlocal next_sample
+        while next_sample < len(sample_times) and sample_times[next_sample] <= until:
+            ts = sample_times[next_sample]
+            x_samples[next_sample] = [position(j, ts) for j in range(n)]
+            next_sample += 1
+
+    n_block = n_wall = 0
+    event_t, event_index = [], []
+    now = 0.0
+
+    while heap and n_block + n_wall < max_events:
+        t, k, va, vb = heapq.heappop(heap)
+        if t > t_end:
+            break
+        # 惰性失效: 参与滑块的速度在入队后改变过
+        i, j = (k, k + 1) if k >= 0 else ((0, 0) if k == -1 else (n - 1, n - 1))
+        if version[i] != va or version[j] != vb:
+            continue
+
+        take_samples(t)
+        now = t
+        for b in {i, j}:
+            x[b] = position(b, now)
+            t_ref[b] = now
+            version[b] += 1
+
+        if k >= 0:
+            v[i], v[j] = inelastic_collision_1d(m[i], v[i], m[j], v[j], e_pair[k])
+            if abs(v[j] - v[i]) < rest_speed:
+                v[i] = v[j] = (m[i] * v[i] + m[j] * v[j]) / (m[i] + m[j])
+            for b in (i, j):
+                if abs(v[b]) < rest_speed:
+                    v[b] = 0.0
+            n_block += 1
+            for p in (k - 1, k + 1):
+                if 0 <= p < n - 1:
+                    schedule_pair(p, now)
+            schedule_walls(i, now)
+            schedule_walls(j, now)
+        else:
+            v[i] = -wall_restitution * v[i]
+            if abs(v[i]) < rest_speed:
+                v[i] = 0.0
+            n_wall += 1
+            for p in (i - 1, i):
+                if 0 <= p < n - 1:
+                    schedule_pair(p, now)
+            schedule_walls(i, now)
+
+        if record_events:
+            event_t.append(now)
+            event_index.append(k)
+
+    t_final = t_end if np.isfinite(t_end) else now
+    take_samples(t_final if np.isfinite(t_end) else np.inf)
+
+    result = {
+        "n_collisions": n_block + n_wall,
+        "n_block_collisions": n_block,
+        "n_wall_collisions": n_wall,
+        "t": t_final,
+        "x": np.array([position(j, t_final) for j in range(n)]),
+        "v": np.array(v),
+        "x_samples": x_samples,
+    }
+    if record_events:
+        result["event_t"] = np.array(event_t)
+        result["event_index"] = np.array(event_index, dtype=int)
+    return result
@@ -0,0 +1,75 @@
+"""
+ QuantPhysics - 静电场计算
+多个点电荷在网格上的电场强度 E 与电势 V (叠加原理)，
+是电场线、等势线、场强分布图的基础。
+"""
+
+import numpy as np
+from typing import Tuple, Union
+
+# 单批临时数组 (网格点数 × 电荷数) 的元素上限，约 32 MB (float64)
+_MAX_CHUNK_ELEMENTS = 1 << 22
+
+
+def point_charges_field(
+    q: Union[float, np.ndarray],
+    r_q: np.ndarray,
+    *grid: np.ndarray,
+    k: float = 8.99e9,
+    softening: float = 0.0,
+    max_chunk_elements: int = _MAX_CHUNK_ELEMENTS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    点电荷系在网格上的电场强度与电势 (叠加原理)
+
+    网格点展平后按块处理，每块只分配 (块大小 × 电荷数) 的临时数组，
+    大网格、多电荷时内存占用有上限。
+
+    Args:
+        q: 电荷量 (C)，标量或 (n_q,)
+        r_q: 电荷位置 (n_q, d)，d = 2 或 3 (m)
+        *grid: 网格坐标 X, Y 或 X, Y, Z (如 np.meshgrid 的结果)，形状相同
+        k: 静电力常量
+        softening: 软化长度 (m)，用 sqrt(r² + ε²) 代替 r，避免电荷所在格点发散
+        max_chunk_elements: 每块临时数组的元素上限
+
+    Returns:
+        (E, V):
+            E: 电场强度 (d,) + grid_shape，即 Ex, Ey = E (V/m)
+            V: 电势 grid_shape，以无穷远为零点 (V)
+
+    Usage:
+        X, Y = np.meshgrid(np.linspace(-1, 1, 200), np.linspace(-1, 1, 200))
+        (Ex, Ey), V = point_charges_field([1e-9, -1e-9], [[-0.3, 0], [0.3, 0]], X, Y)
+    """
+    r_q = np.atleast_2d(np.asarray(r_q, dtype=float))
+    n_q, d = r_q.shape
+    q = np.broadcast_to(np.asarray(q, dtype=float), (n_q,))
+    if len(grid) != d:
+        raise ValueError(f"网格维数 {len(grid)} 与电荷坐标维数 {d} 不一致")
+
+    shape = np.broadcast_shapes(*(np.shape(g) for g in grid))
+    points = np.stack([np.broadcast_to(g, shape).ravel() for g in grid], axis=1)
+    n_points = len(points)
+
+    E = np.empty((n_points, d))
+    V = np.empty(n_points)
+    chunk = max(1, max_chunk_elements // max(n_q, 1))
+
+    kq = k * q
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for start in range(0, n_points, chunk):
+            stop = min(start + chunk, n_points)
+            p = points[start:stop]
+            r2 = np.full((stop - start, n_q), softening**2)
+            for axis in range(d):
+                dk = p[:, axis, None] - r_q[None, :, axis]
+                dk *= dk
+                r2 += dk
+            inv_r = 1 / np.sqrt(r2)
+            V[start:stop] = inv_r @ kq
+            # E_i = Σ_j kq_j (x_i - x_j) / r_ij³，求和用矩阵乘法
+            w = inv_r**3 * kq
+            E[start:stop] = p * w.sum(axis=1)[:, None] - w @ r_q
+
+    return np.moveaxis(E, -1, 0).reshape((d,) + shape), V.reshape(shape)
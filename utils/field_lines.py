@@ -0,0 +1,158 @@
+"""
+ QuantPhysics - 场线 / 流线追踪
+所有场线以弧长为参数同时积分 (自适应步长)，遇到汇点、区域边界或回到起点
+(闭合磁感线) 时停止，结果打包成以 NaN 分隔的折线，直接作为一条 Plotly 曲线绘制。
+
+场函数约定与 create_vector_field 相同: field_func(x, y) -> (u, v)，
+x、y 为同形状数组，需支持数组输入。
+"""
+
+import numpy as np
+from typing import Callable, Optional, Sequence, Tuple
+
+from .integrators import dormand_prince
+
+
+def seed_around_points(
+    centers: np.ndarray,
+    radius: float,
+    n_per_point: int = 12,
+    offset: float = 0.0
+) -> np.ndarray:
+    """
+    在每个点周围的小圆上均匀布置起点 (如点电荷周围)
+
+    Args:
+        centers: 中心点 (n, 2)
+        radius: 圆半径
+        n_per_point: 每个点的起点数
+        offset: 起始角偏移 (度)
+
+    Returns:
+        起点 (n * n_per_point, 2)
+    """
+    centers = np.atleast_2d(np.asarray(centers, dtype=float))
+    phi = np.radians(offset) + 2 * np.pi * np.arange(n_per_point) / n_per_point
+    ring = radius * np.stack([np.cos(phi), np.sin(phi)], axis=1)
+    return (centers[:, None, :] + ring[None, :, :]).reshape(-1, 2)
+
+
+def seed_along_segment(
+    start: Tuple[float, float],
+    end: Tuple[float, float],
+    n: int = 10
+) -> np.ndarray:
+    """
+    沿线段均匀布置起点 (如沿磁铁端面、平行板)
+
+    Returns:
+        起点 (n, 2)
+    """
+    s = (np.arange(n) + 0.5) / n
+    return np.asarray(start, dtype=float) + s[:, None] * (
+        np.asarray(end, dtype=float) - np.asarray(start, dtype=float))
+
+
+def trace_field_lines(
+    field_func: Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]],
+    seeds: np.ndarray,
+    x_range: Tuple[float, float],
+    y_range: Tuple[float, float],
+    direction: str = "forward",
+    sinks: Optional[Sequence[Tuple[float, float]]] = None,
+    sink_radius: Optional[float] = None,
+    max_length: Optional[float] = None,
+    close_loops: bool = False,
+    n_points: int = 400,
+    rtol: float = 1e-5
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    批量追踪场线
+
+    沿单位方向场 dr/ds = F/|F| 积分，步长由 Dormand-Prince 误差控制自动调整。
+    停止条件: 进入汇点半径内、离开绘图区域、回到起点附近 (close_loops=True)
+    或达到最大弧长。
+
+    Args:
+        field_func: 场函数 (x, y) -> (u, v)，需支持数组输入
+        seeds: 起点 (n, 2)
+        x_range, y_range: 绘图区域，离开即停止
+        direction: "forward" 顺着场方向，"backward" 逆着场方向，"both" 两个方向都追踪
+        sinks: 汇点坐标 (如点电荷位置)，场线进入 sink_radius 内停止
+        sink_radius: 汇点半径，默认为区域尺寸的 1%
+        max_length: 最大弧长，默认为区域对角线长度的 3 倍
+        close_loops: 是否检测闭合 (磁感线、涡旋流线)
+        n_points: 每条场线按弧长均匀输出的最多点数
+        rtol: 积分相对误差容限
+
+    Returns:
+        (x, y): 所有场线拼接成的坐标数组，各条之间以 NaN 分隔
+
+    Usage:
+        seeds = seed_around_points(charges_xy, 0.05, 16)
+        x, y = trace_field_lines(E_func, seeds, (-1, 1), (-1, 1), sinks=charges_xy)
+        fig.add_trace(go.Scatter(x=x, y=y, mode="lines"))
+    """
+    seeds = np.atleast_2d(np.asarray(seeds, dtype=float))
+    if direction == "both":
+        signs = np.repeat([1.0, -1.0], len(seeds))
+        seeds = np.concatenate([seeds, seeds])
+    elif direction in ("forward", "backward"):
+        signs = np.full(len(seeds), 1.0 if direction == "forward" else -1.0)
+    else:
+        raise ValueError(f"未知的追踪方向: {direction}")
+
+    (x0, x1), (y0, y1) = x_range, y_range
+    size = np.hypot(x1 - x0, y1 - y0)
+    if max_length is None:
+        max_length = 3 * size
+    if sink_radius is None:
+        sink_radius = 0.01 * size
+    sinks = np.empty((0, 2)) if sinks is None else np.atleast_2d(np.asarray(sinks, dtype=float))
+    # 闭合判据: 离开起点至少这么远之后再回到 close_tol 以内
+    close_tol = 0.02 * size
+
+    def rhs(s, r, p):
+        u, v = field_func(r[:, 0], r[:, 1])
+        u = np.asarray(u, dtype=float) * p[:, 0]
+        v = np.asarray(v, dtype=float) * p[:, 0]
+        norm = np.hypot(u, v)
+        norm = np.where(norm > 0, norm, np.inf)
+        return np.stack([u / norm, v / norm], axis=1)
+
+    def stop(s, r, p):
+        # 各停止条件取最小值，过零即停止
+        g = np.minimum.reduce([r[:, 0] - x0, x1 - r[:, 0], r[:, 1] - y0, y1 - r[:, 1]])
+        if len(sinks):
+            d = np.hypot(r[:, None, 0] - sinks[None, :, 0], r[:, None, 1] - sinks[None, :, 1])
+            g = np.minimum(g, d.min(axis=1) - sink_radius)
+        if close_loops:
+            d_seed = np.hypot(r[:, 0] - p[:, 1], r[:, 1] - p[:, 2])
+            g = np.minimum(g, np.where(s > 4 * close_tol, d_seed - close_tol, np.inf))
+        return g
+
+    params = np.column_stack([signs, seeds])
+    sol = dormand_prince(
+        rhs, seeds, (0, max_length), t_eval=np.linspace(0, max_length, n_points),
+        rtol=rtol, atol=1e-6 * size, max_step=min(sink_radius, close_tol),
+        event=stop, event_direction=-1, args=params
+    )
+
+    # 每条线: 有效采样点 + 终点 (+ 闭合时回到起点) + NaN 分隔
+    ended = sol["status"] == 1
+    closed = ended & close_loops & (
+        np.hypot(*(sol["y_event"] - seeds).T) <= 1.01 * close_tol)
+    pts = np.concatenate([
+        sol["y"],
+        sol["y_event"][:, None, :],
+        seeds[:, None, :],
+        np.full((len(seeds), 1, 2), np.nan),
+    ], axis=1)
+    keep = np.concatenate([
+        ~np.isnan(sol["y"][:, :, 0]),
+        ended[:, None],
+        closed[:, None],
+        np.ones((len(seeds), 1), dtype=bool),
+    ], axis=1)
+    packed = pts[keep]
+    return packed[:, 0], packed[:, 1]
@@ -0,0 +1,232 @@
+"""
+ QuantPhysics - 二维硬球 (圆盘) 气体分子动力学
+数千个等质量圆盘在矩形容器中做弹性碰撞，用均匀网格 (cell list) 查找近邻，
+统计速率分布 (与麦克斯韦-玻尔兹曼分布对比) 以及由器壁冲量得到的压强。
+
+二维中每个分子的平均动能 <½mv²> = kT。
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+# 半壳邻居格偏移: 每对相邻格只检查一次
+_NEIGHBOR_OFFSETS = ((0, 0), (1, 0), (0, 1), (1, 1), (1, -1))
+
+
+def maxwell_boltzmann_2d(v: np.ndarray, m: float = 1.0, kT: float = 1.0) -> np.ndarray:
+    """
+    二维麦克斯韦-玻尔兹曼速率分布 f(v) = (m v / kT) exp(-m v² / 2kT)
+
+    Args:
+        v: 速率 (m/s)
+        m: 分子质量 (kg)
+        kT: 温度 (以能量为单位，J)
+
+    Returns:
+        概率密度 (s/m)
+    """
+    v = np.asarray(v, dtype=float)
+    return m * v / kT * np.exp(-m * v**2 / (2 * kT))
+
+
+class HardDiskGas:
+    """
+    二维硬球气体
+
+    Args:
+        n: 分子数
+        box: 容器尺寸 (Lx, Ly)
+        radius: 分子半径
+        mass: 分子质量
+        kT: 初始温度 (以能量为单位)
+        seed: 随机数种子
+        speed_bins: 速率直方图的分组数
+
+    Usage:
+        gas = HardDiskGas(5000, radius=0.003)
+        gas.step(dt=2e-4, n_steps=20)  # 每帧调用
+        v, f = gas.speed_histogram()
+        gas.pressure(), gas.temperature()
+    """
+
+    def __init__(
+        self,
+        n: int,
+        box: Tuple[float, float] = (1.0, 1.0),
+        radius: float = 0.003,
+        mass: float = 1.0,
+        kT: float = 1.0,
+        seed: Optional[int] = None,
+        speed_bins: int = 50
+    ):
+        self.n = n
+        self.box = (float(box[0]), float(box[1]))
+        self.radius = radius
+        self.mass = mass
+        rng = np.random.default_rng(seed)
+
+        # 初始位置: 规则格点 + 小扰动，保证互不重叠
+        lx, ly = self.box
+        cols = int(np.ceil(np.sqrt(n * lx / ly)))
+        rows = int(np.ceil(n / cols))
+        if min(lx / cols, ly / rows) < 2 * radius:
+            raise ValueError("分子数过多或半径过大，容器中放不下")
+        gx, gy = np.meshgrid((np.arange(cols) + 0.5) * lx / cols, (np.arange(rows) + 0.5) * ly / rows)
+        self.x = np.stack([gx.ravel(), gy.ravel()], axis=1)[:n]
+        jitter = 0.5 * (min(lx / cols, ly / rows) - 2 * radius)
+        self.x += rng.uniform(-jitter, jitter, self.x.shape)
+
+        # 初始速度: 高斯分布，去掉质心速度后缩放到给定温度
+        self.v = rng.normal(0, np.sqrt(kT / mass), (n, 2))
+        self.v -= self.v.mean(axis=0)
+        self.v *= np.sqrt(kT / self.temperature())
+
+        # 统计量
+        self.time = 0.0
+        self.n_collisions = 0
+        self._wall_impulse = 0.0
+        self._stat_time = 0.0
+        self._speed_edges = np.linspace(0, 4 * np.sqrt(2 * kT / mass), speed_bins + 1)
+        self._speed_counts = np.zeros(speed_bins)
+
+        # 网格: 格边长不小于分子直径，只需检查相邻格
+        self._cells = (max(1, int(lx / (2 * radius))), max(1, int(ly / (2 * radius))))
+
+    # ----------------------------------------
+    # 推进
+    # ----------------------------------------
+
+    def step(self, dt: float, n_steps: int = 1) -> None:
+        """
+        推进 n_steps 步，每步: 自由运动 → 器壁反弹 → 分子间碰撞
+
+        dt 应使每步位移远小于分子半径 (如 dt < 0.2 * radius / v_rms)。
+        """
+        for _ in range(n_steps):
+            self.x += self.v * dt
+            self._collide_walls()
+            self._collide_pairs()
+            self.time += dt
+            self._stat_time += dt
+            speed = np.hypot(self.v[:, 0], self.v[:, 1])
+            self._speed_counts += np.histogram(speed, bins=self._speed_edges)[0]
+
+    def _collide_walls(self) -> None:
+        """镜面反射并累计器壁受到的冲量"""
+        r = self.radius
+        for axis, length in enumerate(self.box):
+            xa, va = self.x[:, axis], self.v[:, axis]
+            low = xa < r
+            high = xa > length - r
+            # 只反弹正在撞向器壁的分子
+            low &= va < 0
+            high &= va > 0
+            hit = low | high
+            self._wall_impulse += 2 * self.mass * np.abs(va[hit]).sum()
+            xa[low] = 2 * r - xa[low]
+            xa[high] = 2 * (length - r) - xa[high]
+            va[hit] = -va[hit]
+
+    def _candidate_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """用网格查找距离小于直径的分子对"""
+        nx, ny = self._cells
+        lx, ly = self.box
+        cx = np.clip((self.x[:, 0] / lx * nx).astype(int), 0, nx - 1)
+        cy = np.clip((self.x[:, 1] / ly * ny).astype(int), 0, ny - 1)
+        cell = cx * ny + cy
+
+        # 按格排序，构造 (格数, 每格最多分子数) 的填充表，空位为 -1
+        order = np.argsort(cell, kind="stable")
+        sorted_cell = cell[order]
+        counts = np.bincount(cell, minlength=nx * ny)
+        start = np.cumsum(counts) - counts
+        slot = np.arange(self.n) - start[sorted_cell]
+        table = np.full((nx * ny, counts.max()), -1)
+        table[sorted_cell, slot] = order
+
+        ii, jj = [], []
+        gx, gy = np.divmod(np.arange(nx * ny), ny)
+        for ox, oy in _NEIGHBOR_OFFSETS:
+            nbx, nby = gx + ox, gy + oy
+            ok = (nbx >= 0) & (nbx < nx) & (nby >= 0) & (nby < ny)
+            a = table[ok][:, :, None]
+            b = table[(nbx * ny + nby)[ok]][:, None, :]
+            mask = (a >= 0) & (b >= 0)
+            if ox == 0 and oy == 0:
+                mask &= a < b
+            a, b = np.broadcast_arrays(a, b)
+            ii.append(a[mask])
+            jj.append(b[mask])
+
+        i, j = np.concatenate(ii), np.concatenate(jj)
+        d = self.x[i] - self.x[j]
+        close = np.einsum("ij,ij->i", d, d) < (2 * self.radius)**2
+        return i[close], j[close]
+
+    def _collide_pairs(self) -> None:
+        """对重叠且相互接近的分子对做等质量弹性碰撞"""
+        i, j = self._candidate_pairs()
+        if i.size == 0:
+            return
+        dx = self.x[i] - self.x[j]
+        dv = self.v[i] - self.v[j]
+        approaching = np.einsum("ij,ij->i", dx, dv) < 0
+        i, j, dx, dv = i[approaching], j[approaching], dx[approaching], dv[approaching]
+
+        # 每个分子每步只参与一次碰撞，其余留到下一步处理
+        both = np.concatenate([i, j])
+        _, first = np.unique(both, return_index=True)
+        is_first = np.zeros(both.size, dtype=bool)
+        is_first[first] = True
+        keep = is_first[:i.size] & is_first[i.size:]
+        i, j, dx, dv = i[keep], j[keep], dx[keep], dv[keep]
+
+        # 交换法向速度分量
+        n_hat = dx / np.linalg.norm(dx, axis=1, keepdims=True)
+        dvn = np.einsum("ij,ij->i", dv, n_hat)[:, None] * n_hat
+        self.v[i] -= dvn
+        self.v[j] += dvn
+        self.n_collisions += i.size
+
+    # ----------------------------------------
+    # 统计量
+    # ----------------------------------------
+
+    def temperature(self) -> float:
+        """温度 kT = <½mv²> (二维)"""
+        return 0.5 * self.mass * np.mean(np.sum(self.v**2, axis=1))
+
+    def pressure(self) -> float:
+        """压强 (二维，单位长度器壁受力): 累计器壁冲量 / (统计时间 × 周长)"""
+        if self._stat_time == 0:
+            return 0.0
+        perimeter = 2 * (self.box[0] + self.box[1])
+        return self._wall_impulse / (self._stat_time * perimeter)
+
+    def ideal_gas_pressure(self) -> float:
+        """
+        理想气体的压强 P = N kT / A，用于和 pressure() 对比
+
+        分子有限大小使实测压强偏高，约为 (1 + η²/8) / (1 - η)² 倍，
+        η = N π r² / A 为面积占有率。
+        """
+        return self.n * self.temperature() / (self.box[0] * self.box[1])
+
+    def speed_histogram(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        累计的速率分布
+
+        Returns:
+            (v, f): 各分组中心速率与归一化的概率密度，可直接与
+                    maxwell_boltzmann_2d(v, mass, temperature()) 对比
+        """
+        edges = self._speed_edges
+        total = self._speed_counts.sum()
+        density = self._speed_counts / (total * np.diff(edges)) if total else self._speed_counts
+        return 0.5 * (edges[:-1] + edges[1:]), density
+
+    def reset_statistics(self) -> None:
+        """清空速率直方图与压强统计 (如改变温度后重新统计)"""
+        self._wall_impulse = 0.0
+        self._stat_time = 0.0
+        self._speed_counts[:] = 0
@@ -0,0 +1,397 @@
+"""
+ QuantPhysics - 电磁感应
+计算平动、转动或变形的多边形线圈中的磁通量、感应电动势和感应电流，
+以及导轨上导体棒在安培力作用下趋于收尾速度的过程。
+
+线圈顶点数组形状为 (n_v, 3) (固定线圈) 或 (n_t, n_v, 3) (各时刻的顶点)，二维顶点视为 z = 0。
+磁场约定与 particle_pusher 相同: 常向量 (匀强磁场) 或函数 field(x, t) -> (..., 3)，
+计算磁通量时 x 的形状为 (n_t, n_points, 3)，t 的形状为 (n_t, 1)。
+
+磁通量用以顶点重心为公共顶点的扇形三角剖分计算: 对无散磁场，通过以线圈为边界的
+任意曲面的磁通量相同，因此对非平面、非凸的线圈同样成立。各三角形上的求积点
+(重心坐标) 只预先计算一次，所有时刻、所有求积点的场值由一次场函数调用得到。
+"""
+
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from .particle_pusher import Field, _eval_field
+from .physics import ArrayLike
+
+
+# ============================================
+# 磁通量
+# ============================================
+
+@lru_cache(maxsize=16)
+def _triangle_quadrature(subdivisions: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    三角形上的求积点 (重心坐标) 与权重
+
+    把三角形均分为 subdivisions² 个小三角形，每个小三角形用三点 (各边中点) 公式，
+    对二次多项式精确。权重之和为 1。
+
+    Returns:
+        (bary, weights): (n_q, 3) 与 (n_q,)
+    """
+    s = subdivisions
+    corners = []
+    for i in range(s):
+        for j in range(s - i):
+            # 正立的小三角形
+            corners.append(((i, j), (i + 1, j), (i, j + 1)))
+            # 倒立的小三角形
+            if j < s - i - 1:
+                corners.append(((i + 1, j), (i + 1, j + 1), (i, j + 1)))
+    corners = np.asarray(corners, dtype=float) / s                  # (n_sub, 3, 2)
+    mids = 0.5 * (corners + np.roll(corners, -1, axis=1))           # 各边中点
+    uv = mids.reshape(-1, 2)
+    bary = np.column_stack([1 - uv.sum(axis=1), uv])
+    weights = np.full(len(bary), 1.0 / len(bary))
+    bary.setflags(write=False)
+    weights.setflags(write=False)
+    return bary, weights
+
+
+def _as_vertices(vertices: np.ndarray) -> np.ndarray:
+    """顶点整理为 (n_t, n_v, 3)"""
+    vertices = np.asarray(vertices, dtype=float)
+    if vertices.shape[-1] == 2:
+        vertices = np.concatenate([vertices, np.zeros(vertices.shape[:-1] + (1,))], axis=-1)
+    return vertices if vertices.ndim == 3 else vertices[None]
+
+
+def loop_area_vector(vertices: np.ndarray) -> np.ndarray:
+    """
+    线圈的面积向量 ½ Σ r_i × r_{i+1} (方向按顶点顺序由右手定则确定)
+
+    Args:
+        vertices: (n_v, 2|3) 或 (n_t, n_v, 2|3)
+
+    Returns:
+        面积向量 (n_t, 3) (m²)
+    """
+    v = _as_vertices(vertices)
+    return 0.5 * np.cross(v, np.roll(v, -1, axis=1)).sum(axis=1)
+
+
+def loop_flux(
+    vertices: np.ndarray,
+    field: Field,
+    t: Optional[ArrayLike] = None,
+    subdivisions: int = 4
+) -> np.ndarray:
+    """
+    通过多边形线圈的磁通量 (一匝)
+
+    Args:
+        vertices: 线圈顶点 (n_v, 2|3) 或各时刻的顶点 (n_t, n_v, 2|3) (m)
+        field: 磁感应强度 (T)，常向量 (3,) 或函数 field(x, t)
+        t: 时刻 (n_t,)，磁场随时间变化或顶点随时间变化时需要
+        subdivisions: 每个扇形三角形的细分数，非匀强磁场时越大越精确
+
+    Returns:
+        磁通量 (n_t,) (Wb)
+    """
+    v = _as_vertices(vertices)
+    t = np.zeros(1) if t is None else np.atleast_1d(np.asarray(t, dtype=float))
+    n_t = max(len(v), len(t))
+    v = np.broadcast_to(v, (n_t,) + v.shape[1:])
+
+    if not callable(field):
+        return loop_area_vector(v) @ np.asarray(field, dtype=float)
+
+    # 扇形三角剖分: 重心 c 与每条边 (r_i, r_{i+1}) 组成三角形
+    c = v.mean(axis=1, keepdims=True)
+    a, b = v, np.roll(v, -1, axis=1)
+    area = 0.5 * np.cross(a - c, b - c)                             # (n_t, n_v, 3)
+
+    bary, weights = _triangle_quadrature(subdivisions)
+    points = (bary[:, 0, None] * c[:, :, None, :]
+              + bary[:, 1, None] * a[:, :, None, :]
+              + bary[:, 2, None] * b[:, :, None, :])                 # (n_t, n_v, n_q, 3)
+    x = points.reshape(n_t, -1, 3)
+    B = _eval_field(field, x, np.broadcast_to(t, (n_t,))[:, None])
+    B = np.broadcast_to(B, x.shape).reshape(points.shape)
+    return np.einsum("tvqk,tvk,q->t", B, area, weights)
+
+
+# ============================================
+# 感应电动势
+# ============================================
+
+def time_derivative(y: np.ndarray, t: np.ndarray, method: str = "gradient") -> np.ndarray:
+    """
+    对等间隔采样的时间序列求导
+
+    Args:
+        y: 采样值 (..., n_t)
+        t: 时刻 (n_t,)
+        method: "gradient" 二阶中心差分; "spectral" 傅里叶谱方法
+                (要求信号在采样区间上周期，如匀速转动的线圈采样整数个周期，
+                 末点不与首点重复)
+
+    Returns:
+        dy/dt (..., n_t)
+    """
+    y = np.asarray(y, dtype=float)
+    t = np.asarray(t, dtype=float)
+    if method == "gradient":
+        return np.gradient(y, t, axis=-1)
+    if method == "spectral":
+        n = y.shape[-1]
+        dt = t[1] - t[0]
+        k = 2j * np.pi * np.fft.rfftfreq(n, dt)
+        if n % 2 == 0:
+            k[-1] = 0  # 奈奎斯特频率分量的导数无法确定
+        return np.fft.irfft(k * np.fft.rfft(y, axis=-1), n, axis=-1)
+    raise ValueError(f"未知的求导方法: {method}")
+
+
+def motional_emf(
+    vertices: np.ndarray,
+    velocities: np.ndarray,
+    field: Field,
+    t: Optional[ArrayLike] = None,
+    n_gauss: int = 4
+) -> np.ndarray:
+    """
+    动生电动势 ε = ∮ (u × B)·dl (静磁场中精确等于 -dΦ/dt)
+
+    各边上的速度由两端顶点的速度线性插值，沿边用高斯-勒让德求积。
+
+    Args:
+        vertices: 线圈顶点 (n_t, n_v, 3)
+        velocities: 顶点速度，形状同 vertices (m/s)
+        field: 磁感应强度 (T)
+        t: 时刻 (n_t,)
+        n_gauss: 每条边的求积点数
+
+    Returns:
+        电动势 (n_t,) (V)，正方向与顶点顺序 (面积向量的右手方向) 一致
+    """
+    v = _as_vertices(vertices)
+    u = _as_vertices(velocities)
+    n_t = max(len(v), len(u))
+    v = np.broadcast_to(v, (n_t,) + v.shape[1:])
+    u = np.broadcast_to(u, (n_t,) + u.shape[1:])
+    t = np.zeros(n_t) if t is None else np.broadcast_to(np.asarray(t, dtype=float), (n_t,))
+
+    s, w = np.polynomial.legendre.leggauss(n_gauss)
+    s = 0.5 * (s + 1)[:, None]
+    w = 0.5 * w
+    a, b = v, np.roll(v, -1, axis=1)
+    ua, ub = u, np.roll(u, -1, axis=1)
+    x = a[:, :, None] + s * (b - a)[:, :, None]                      # (n_t, n_v, n_g, 3)
+    uq = ua[:, :, None] + s * (ub - ua)[:, :, None]
+    B = _eval_field(field, x.reshape(n_t, -1, 3), t[:, None])
+    B = np.broadcast_to(B, (n_t, x.shape[1] * n_gauss, 3)).reshape(x.shape)
+    return np.einsum("tvgk,tvk,g->t", np.cross(uq, B), b - a, w)
+
+
+def loop_induction(
+    vertices: np.ndarray,
+    field: Field,
+    t: np.ndarray,
+    turns: int = 1,
+    resistance: Optional[float] = None,
+    method: str = "gradient",
+    velocities: Optional[np.ndarray] = None,
+    subdivisions: int = 4
+) -> Dict[str, np.ndarray]:
+    """
+    线圈中的磁通量、感应电动势与感应电流随时间的变化
+
+    Args:
+        vertices: 线圈顶点 (n_v, 2|3) 或 (n_t, n_v, 2|3) (m)
+        field: 磁感应强度 (T)，常向量或函数 field(x, t)
+        t: 等间隔时刻 (n_t,) (s)
+        turns: 匝数
+        resistance: 回路总电阻 (Ω)，None 时不计算电流
+        method: 电动势的计算方法
+            "gradient": -dΦ/dt 中心差分
+            "spectral": -dΦ/dt 谱方法 (周期运动)
+            "motional": ∮ (u × B)·dl，需要 velocities，只适用于静磁场
+        velocities: 顶点速度，形状同 vertices (如 rigid_motion 的返回值)
+        subdivisions: 磁通量求积的细分数
+
+    Returns:
+        字典，包含:
+            t: 时刻
+            flux: 磁链 NΦ (Wb)
+            emf: 感应电动势 (V)，正方向与面积向量成右手关系
+            current: 感应电流 (A) (给定 resistance 时)
+            power: 电功率 ε I (W) (给定 resistance 时)
+
+    Usage:
+        # 匀强磁场中匀速转动的矩形线圈 (交流发电机)
+        square = [[-0.1, -0.1, 0], [0.1, -0.1, 0], [0.1, 0.1, 0], [-0.1, 0.1, 0]]
+        t = np.linspace(0, 0.04, 1000, endpoint=False)
+        verts, vel = rigid_motion(square, t, omega=2 * np.pi * 50, axis=(1, 0, 0))
+        res = loop_induction(verts, [0, 0, 0.5], t, turns=100, method="spectral")
+    """
+    t = np.asarray(t, dtype=float)
+    flux = turns * loop_flux(vertices, field, t, subdivisions)
+    if method == "motional":
+        if velocities is None:
+            raise ValueError("method='motional' 需要顶点速度 velocities")
+        emf = turns * motional_emf(vertices, velocities, field, t)
+    else:
+        emf = -time_derivative(flux, t, method)
+
+    result = {"t": t, "flux": flux, "emf": emf}
+    if resistance is not None:
+        result["current"] = emf / resistance
+        result["power"] = emf**2 / resistance
+    return result
+
+
+def rigid_motion(
+    vertices: np.ndarray,
+    t: ArrayLike,
+    velocity: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+    omega: float = 0.0,
+    axis: Tuple[float, float, float] = (0.0, 0.0, 1.0),
+    center: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    线圈的刚体运动: 绕过 center 的轴以角速度 omega 转动，同时以 velocity 平动
+
+    Args:
+        vertices: 初始顶点 (n_v, 2|3) (m)
+        t: 时刻 (n_t,) (s)
+        velocity: 平动速度 (m/s)
+        omega: 角速度 (rad/s)
+        axis: 转轴方向
+        center: 转轴经过的点 (初始时刻)
+
+    Returns:
+        (positions, velocities): 各时刻的顶点位置与速度 (n_t, n_v, 3)
+    """
+    v0 = _as_vertices(vertices)[0]
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    k = np.asarray(axis, dtype=float)
+    k = k / np.linalg.norm(k)
+    center = np.asarray(center, dtype=float)
+    velocity = np.asarray(velocity, dtype=float)
+
+    # 罗德里格斯公式: r' = r cos θ + (k × r) sin θ + k (k·r)(1 - cos θ)
+    r = v0 - center
+    kxr = np.cross(k, r)
+    kr = (r @ k)[:, None] * k
+    theta = omega * t[:, None, None]
+    rot = r * np.cos(theta) + kxr * np.sin(theta) + kr * (1 - np.cos(theta))
+    positions = center + rot + velocity * t[:, None, None]
+    velocities = omega * np.cross(k, rot) + velocity
+    return positions, velocities
+
+
+# ============================================
+# 导轨上的导体棒
+# ============================================
+
+def rod_on_rails(
+    t: ArrayLike,
+    B: float,
+    L: float,
+    R: float,
+    m: float,
+    v0: float = 0.0,
+    F: float = 0.0,
+    incline: float = 0.0,
+    mu: float = 0.0,
+    g: float = 9.8
+) -> Dict[str, ArrayLike]:
+    """
+    导轨上导体棒的运动 (磁场垂直于导轨平面)
+
+    棒受外力 F、重力沿斜面的分力和摩擦力，感应电流产生的安培力 B²L²v/R 阻碍运动，
+    每一段运动中速度按指数规律趋于收尾速度: v(t) = v_T + (v0 - v_T) e^{-t/τ}，τ = mR/(B²L²)。
+
+    滑动摩擦力 μmg cosθ 与速度方向相反，因此速度减到 0 时分段处理:
+    若外力与重力分力的合力不超过最大静摩擦力 (取与滑动摩擦力相等)，棒停住；
+    否则棒从静止开始反向运动，趋于反向的收尾速度。
+
+    Args:
+        t: 时刻 (s)，标量或数组
+        B: 磁感应强度 (T)
+        L: 导轨间距 (棒的有效长度) (m)
+        R: 回路总电阻 (Ω)
+        m: 棒的质量 (kg)
+        v0: 初速度 (m/s)
+        F: 沿导轨的恒定外力 (N)
+        incline: 导轨倾角 (度)，棒沿斜面向下为正方向
+        mu: 动摩擦因数
+        g: 重力加速度 (m/s²)
+
+    Returns:
+        字典，包含:
+            v, x: 速度 (m/s) 与位移 (m)
+            a: 加速度 (m/s²)
+            emf: 感应电动势 BLv (V)
+            current: 感应电流 (A)
+            F_ampere: 安培力大小 (N)
+            heat: 0~t 内回路产生的焦耳热 (J)
+            v_terminal: 最终的收尾速度 (m/s)，停住时为 0
+            t_stop: 速度减为 0 的时刻 (s)，不经过 0 时为 inf
+            tau: 时间常数 (s)
+    """
+    t = np.asarray(t, dtype=float)
+    theta = np.radians(incline)
+    drive = F + m * g * np.sin(theta)         # 除摩擦、安培力外的合力
+    friction = mu * m * g * np.cos(theta)
+    k = B**2 * L**2 / R
+    tau = m / k
+
+    def phase(s, v_start, v_T):
+        """从 v_start 开始、趋于 v_T 的一段指数运动 (s 为本段内的时间)"""
+        decay = np.exp(-s / tau)
+        dv = v_start - v_T
+        v = v_T + dv * decay
+        x = v_T * s + dv * tau * (1 - decay)
+        # Q = ∫ k v² dt
+        heat = k * (v_T**2 * s + 2 * v_T * dv * tau * (1 - decay) + 0.5 * dv**2 * tau * (1 - decay**2))
+        return v, x, (v_T - v_start) / tau * decay, heat
+
+    def start_from_rest():
+        """静止时: 合力不超过最大静摩擦力则保持静止，否则沿合力方向运动"""
+        if abs(drive) <= friction:
+            return 0.0
+        return (drive - np.sign(drive) * friction) / k
+
+    # 第一段: 速度方向不变；速度减为 0 时进入第二段
+    t_stop = np.inf
+    if v0 == 0:
+        v_T1 = start_from_rest()
+        v_T2 = v_T1
+    else:
+        v_T1 = (drive - np.sign(v0) * friction) / k
+        v_T2 = v_T1
+        if v_T1 * v0 < 0:
+            t_stop = tau * np.log(1 - v0 / v_T1)
+            v_T2 = start_from_rest()
+
+    first = t < t_stop
+    v, x, a, heat = phase(np.where(first, t, t_stop), v0, v_T1)
+    if np.isfinite(t_stop):
+        _, x1, _, heat1 = phase(t_stop, v0, v_T1)
+        v2, x2, a2, heat2 = phase(np.maximum(t - t_stop, 0.0), 0.0, v_T2)
+        v = np.where(first, v, v2)
+        x = np.where(first, x, x1 + x2)
+        a = np.where(first, a, a2)
+        heat = np.where(first, heat, heat1 + heat2)
+
+    emf = B * L * v
+    return {
+        "v": v,
+        "x": x,
+        "a": a,
+        "emf": emf,
+        "current": emf / R,
+        "F_ampere": k * np.abs(v),
+        "heat": heat,
+        "v_terminal": v_T2,
+        "t_stop": t_stop,
+        "tau": tau,
+    }
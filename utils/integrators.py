@@ -0,0 +1,362 @@
+"""
+ QuantPhysics - 常微分方程数值积分
+批量推进一组系统的状态 (n_systems, n_dims)，供阻力抛体、大角度单摆、天体轨道、
+RLC 暂态等没有解析解的问题共用。
+
+约定:
+    - 状态数组形状为 (n_systems, n_dims)，每一行是一个独立系统
+    - 右端函数 f(t, y) 中 t 为形状 (m,) 的数组，y 为形状 (m, n_dims)，
+      返回 dy/dt，形状与 y 相同 (m 为当前仍在积分的系统数)
+    - 事件函数 event(t, y) 返回形状 (m,) 的数组，过零即触发事件 (如落地 y=0)
+    - 输出的采样数组形状为 (n_systems, n_times, n_dims)
+"""
+
+import numpy as np
+from typing import Callable, Dict, Optional, Tuple
+
+# ============================================
+# 定步长方法
+# ============================================
+
+def rk4(
+    f: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    y0: np.ndarray,
+    t: np.ndarray
+) -> np.ndarray:
+    """
+    经典四阶 Runge-Kutta 法 (定步长)
+
+    Args:
+        f: 右端函数 f(t, y) -> dy/dt
+        y0: 初始状态 (n_systems, n_dims)
+        t: 时间网格 (n_times,)，步长可以不均匀
+
+    Returns:
+        y: 各时刻的状态 (n_systems, n_times, n_dims)
+    """
+    y = np.array(y0, dtype=float)
+    t = np.asarray(t, dtype=float)
+    n = y.shape[0]
+    out = np.empty((n, len(t)) + y.shape[1:])
+    out[:, 0] = y
+
+    for i in range(len(t) - 1):
+        h = t[i + 1] - t[i]
+        ti = np.full(n, t[i])
+        k1 = f(ti, y)
+        k2 = f(ti + h / 2, y + h / 2 * k1)
+        k3 = f(ti + h / 2, y + h / 2 * k2)
+        k4 = f(ti + h, y + h * k3)
+        y = y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+        out[:, i + 1] = y
+
+    return out
+
+
+def velocity_verlet(
+    accel: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    x0: np.ndarray,
+    v0: np.ndarray,
+    dt: float,
+    n_steps: int,
+    t0: float = 0.0,
+    save_every: int = 1,
+    event: Optional[Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]] = None,
+    args: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    """
+    速度 Verlet 法 (即 kick-drift-kick 蛙跳法)，辛积分器
+
+    适用于加速度只依赖位置的保守系统 (引力、弹簧、单摆)，
+    长时间积分时能量误差有界而不会累积漂移。
+
+    Args:
+        accel: 加速度函数 a(t, x)，t 为形状 (n_systems,) 的数组，x 形状与 x0 相同
+        x0, v0: 初始位置与速度 (n_systems, n_dims)
+        dt: 时间步长 (s)
+        n_steps: 步数
+        t0: 起始时间 (s)
+        save_every: 每隔多少步保存一帧
+        event: 终止事件函数 event(t, x, v) -> (n_systems,)，
+               由正变负时该系统停止，状态冻结在事件时刻 (线性插值)
+        args: 各系统的常数参数 (n_systems, n_args)，给出时以 a(t, x, p)、
+              event(t, x, v, p) 调用 (与 dormand_prince 相同)
+
+    Returns:
+        字典，包含:
+            t: 保存帧的时刻 (n_saved,)
+            x, v: 保存帧的状态 (n_systems, n_saved, n_dims)
+            t_event: 各系统的事件时刻 (n_systems,)，未触发为 NaN
+    """
+    x = np.array(x0, dtype=float)
+    v = np.array(v0, dtype=float)
+    n = x.shape[0]
+    n_saved = n_steps // save_every + 1
+
+    t_out = np.empty(n_saved)
+    x_out = np.empty((n, n_saved) + x.shape[1:])
+    v_out = np.empty((n, n_saved) + v.shape[1:])
+    t_out[0], x_out[:, 0], v_out[:, 0] = t0, x, v
+
+    t_event = np.full(n, np.nan)
+    active = np.ones(n, dtype=bool)
+    # 用于按系统屏蔽更新的广播形状
+    row = (slice(None),) + (None,) * (x.ndim - 1)
+
+    if args is not None:
+        args = np.asarray(args)
+        acc = lambda t, x: accel(t, x, args)
+        ev = lambda t, x, v: event(t, x, v, args)
+    else:
+        acc, ev = accel, event
+
+    a = acc(np.full(n, t0), x)
+    g_old = ev(np.full(n, t0), x, v) if event is not None else None
+
+    for step in range(1, n_steps + 1):
+        t = t0 + step * dt
+        t_arr = np.full(n, t)
+        v_half = v + 0.5 * dt * a
+        x_new = x + dt * v_half
+        a_new = acc(t_arr, x_new)
+        v_new = v_half + 0.5 * dt * a_new
+
+        if event is not None:
+            g_new = ev(t_arr, x_new, v_new)
+            hit = active & (g_old > 0) & (g_new <= 0)
+            if hit.any():
+                frac = g_old[hit] / (g_old[hit] - g_new[hit])
+                t_event[hit] = t - dt + frac * dt
+                f = frac[row]
+                x_new[hit] = x[hit] + f * (x_new[hit] - x[hit])
+                v_new[hit] = v[hit] + f * (v_new[hit] - v[hit])
+            keep = ~active
+            x_new[keep], v_new[keep] = x[keep], v[keep]
+            active &= ~hit
+            g_old = g_new
+
+        x, v, a = x_new, v_new, a_new
+        if step % save_every == 0:
+            k = step // save_every
+            t_out[k], x_out[:, k], v_out[:, k] = t, x, v
+
+    return {"t": t_out, "x": x_out, "v": v_out, "t_event": t_event}
+
+
+# ============================================
+# 自适应步长 (Dormand-Prince 5(4))
+# ============================================
+
+# Butcher 表
+_DP_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+_DP_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+# 五阶解与四阶嵌入解之差的系数 (用于误差估计)
+_DP_E = np.array([71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+# 四阶连续扩展 (Hairer, Nørsett & Wanner): y(t + θh) = y + h Σ_i K_i (P_i · [θ, θ², θ³, θ⁴])
+_DP_P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+])
+
+
+def _dense_output(y0, Q, h, theta):
+    """
+    步内的四阶稠密输出，theta ∈ [0, 1]
+
+    Args:
+        y0: 步起点的状态 (m, n_dims)
+        Q: 各阶段斜率与连续扩展系数的组合 Σ_i K_i P_i (m, n_dims, 4)
+        h: 步长 (m,)
+        theta: 步内的相对位置 (m,)
+    """
+    powers = np.cumprod(np.repeat(theta[:, None], 4, axis=1), axis=1)   # θ, θ², θ³, θ⁴
+    return y0 + h[:, None] * np.einsum("mdk,mk->md", Q, powers)
+
+
+def _locate_event(event, t, h, y0, Q, g0, n_iter=50):
+    """在 [t, t+h] 内对稠密输出二分求事件时刻，返回 (theta, y)"""
+    lo = np.zeros(len(t))
+    hi = np.ones(len(t))
+    for _ in range(n_iter):
+        mid = 0.5 * (lo + hi)
+        g_mid = event(t + mid * h, _dense_output(y0, Q, h, mid))
+        same = np.sign(g_mid) == np.sign(g0)
+        lo = np.where(same, mid, lo)
+        hi = np.where(same, hi, mid)
+    return hi, _dense_output(y0, Q, h, hi)
+
+
+def dormand_prince(
+    f: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    y0: np.ndarray,
+    t_span: Tuple[float, float],
+    t_eval: Optional[np.ndarray] = None,
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+    h0: Optional[float] = None,
+    max_step: float = np.inf,
+    event: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None,
+    event_direction: int = 0,
+    max_steps: int = 100000,
+    args: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Dormand-Prince 5(4) 自适应步长积分 (批量)
+
+    每个系统各自控制步长，所有仍在积分的系统在一次函数调用中同时求值。
+    t_eval 处的值与事件时刻由步内的四阶连续扩展 (稠密输出) 给出，
+    只用已算出的各阶段斜率，不增加函数求值，也不影响步长选择。
+
+    Args:
+        f: 右端函数 f(t, y) -> dy/dt
+        y0: 初始状态 (n_systems, n_dims)
+        t_span: 积分区间 (t0, t1)
+        t_eval: 输出时刻 (n_times,)，升序且位于 t_span 内，默认只输出两端
+        rtol, atol: 相对/绝对误差容限
+        h0: 初始步长，默认自动估计
+        max_step: 最大步长
+        event: 终止事件函数 event(t, y) -> (m,)，过零时该系统停止积分
+        event_direction: 1 只检测由负变正，-1 只检测由正变负，0 两者都检测
+        max_steps: 单个系统的最大尝试步数
+        args: 各系统的常数参数 (n_systems, n_args)，给出时以 f(t, y, p)、
+              event(t, y, p) 调用，p 为当前参与求值的系统对应的行
+
+    Returns:
+        字典，包含:
+            t: 输出时刻 (n_times,)
+            y: 输出状态 (n_systems, n_times, n_dims)，事件之后的时刻为 NaN
+            t_event: 事件时刻 (n_systems,)，未触发为 NaN
+            y_event: 事件时刻的状态 (n_systems, n_dims)
+            status: 0 到达 t1，1 触发事件，-1 超过 max_steps
+            nfev: 每个系统的右端函数求值次数 (n_systems,)
+    """
+    t0, t1 = float(t_span[0]), float(t_span[1])
+    y = np.array(y0, dtype=float)
+    n, d = y.shape
+    t_eval = np.array([t0, t1]) if t_eval is None else np.asarray(t_eval, dtype=float)
+
+    y_out = np.full((n, len(t_eval), d), np.nan)
+    y_out[:, t_eval <= t0] = y[:, None]
+    t_event = np.full(n, np.nan)
+    y_event = np.full((n, d), np.nan)
+    status = np.zeros(n, dtype=int)
+    nfev = np.ones(n, dtype=int)
+    n_tries = np.zeros(n, dtype=int)
+
+    # 按系统编号取出对应参数行
+    if args is None:
+        rhs = lambda rows, t, y: f(t, y)
+        ev = lambda rows, t, y: event(t, y)
+    else:
+        args = np.asarray(args)
+        rhs = lambda rows, t, y: f(t, y, args[rows])
+        ev = lambda rows, t, y: event(t, y, args[rows])
+
+    all_rows = np.arange(n)
+    t = np.full(n, t0)
+    k1 = rhs(all_rows, t, y)
+    g = ev(all_rows, t, y) if event is not None else None
+
+    # 初始步长估计
+    if h0 is None:
+        scale = atol + rtol * np.abs(y)
+        d0 = np.sqrt(np.mean((y / scale)**2, axis=1))
+        d1 = np.sqrt(np.mean((k1 / scale)**2, axis=1))
+        h = np.where((d0 < 1e-5) | (d1 < 1e-5), 1e-6, 0.01 * d0 / np.maximum(d1, 1e-300))
+    else:
+        h = np.full(n, float(h0))
+    h = np.minimum(h, min(max_step, t1 - t0))
+
+    active = all_rows
+    while active.size:
+        ta, ya, k1a = t[active], y[active], k1[active]
+        ha = np.minimum(h[active], t1 - ta)
+
+        # Runge-Kutta 各阶段
+        K = [k1a]
+        for s in range(1, 7):
+            dy = sum(a * k for a, k in zip(_DP_A[s], K) if a != 0)
+            K.append(rhs(active, ta + _DP_C[s] * ha, ya + ha[:, None] * dy))
+        y_new = ya + ha[:, None] * sum(a * k for a, k in zip(_DP_A[6], K[:6]) if a != 0)
+        k_new = K[6]
+        err = ha[:, None] * sum(e * k for e, k in zip(_DP_E, K) if e != 0)
+        nfev[active] += 6
+        n_tries[active] += 1
+
+        scale = atol + rtol * np.maximum(np.abs(ya), np.abs(y_new))
+        err_norm = np.sqrt(np.mean((err / scale)**2, axis=1))
+        accept = err_norm <= 1
+
+        # 步长更新
+        factor = np.clip(0.9 * np.maximum(err_norm, 1e-10)**(-0.2), 0.2, 5.0)
+        factor = np.where(accept, factor, np.minimum(factor, 1.0))
+        h[active] = np.minimum(ha * factor, max_step)
+
+        idx = active[accept]
+        if idx.size:
+            ta, ha = ta[accept], ha[accept]
+            y_old = ya[accept]
+            y_acc, f_acc = y_new[accept], k_new[accept]
+            Q = np.einsum("smd,sk->mdk", np.stack([k[accept] for k in K]), _DP_P)
+            # 最后一步精确落在 t1 上，避免舍入误差多走一步
+            t_next = np.where(ha >= t1 - ta, t1, ta + ha)
+            t_end = t_next.copy()
+
+            # 事件检测
+            hit = np.zeros(idx.size, dtype=bool)
+            if event is not None:
+                g_old = g[idx]
+                g_new = ev(idx, t_end, y_acc)
+                if event_direction >= 0:
+                    hit |= (g_old < 0) & (g_new >= 0)
+                if event_direction <= 0:
+                    hit |= (g_old > 0) & (g_new <= 0)
+                g[idx] = g_new
+                if hit.any():
+                    rows_hit = idx[hit]
+                    theta, y_hit = _locate_event(
+                        lambda t, y: ev(rows_hit, t, y), ta[hit], ha[hit], y_old[hit], Q[hit], g_old[hit])
+                    t_end[hit] = ta[hit] + theta * ha[hit]
+                    t_event[idx[hit]] = t_end[hit]
+                    y_event[idx[hit]] = y_hit
+                    status[idx[hit]] = 1
+
+            # 稠密输出: 填充落在 (t, t_end] 内的 t_eval
+            lo = np.searchsorted(t_eval, ta, side="right")
+            hi = np.searchsorted(t_eval, t_end, side="right")
+            counts = hi - lo
+            if counts.sum():
+                rows = np.repeat(np.arange(idx.size), counts)
+                offsets = np.cumsum(counts) - counts
+                cols = lo[rows] + np.arange(counts.sum()) - offsets[rows]
+                theta = (t_eval[cols] - ta[rows]) / ha[rows]
+                y_out[idx[rows], cols] = _dense_output(y_old[rows], Q[rows], ha[rows], theta)
+
+            t[idx], y[idx], k1[idx] = t_next, y_acc, f_acc
+
+        done = (t[active] >= t1) | (status[active] == 1)
+        failed = ~done & (n_tries[active] >= max_steps)
+        status[active[failed]] = -1
+        active = active[~done & ~failed]
+
+    return {
+        "t": t_eval,
+        "y": y_out,
+        "t_event": t_event,
+        "y_event": y_event,
+        "status": status,
+        "nfev": nfev,
+    }
@@ -0,0 +1,359 @@
+"""
+ QuantPhysics - N 体引力模拟
+直接求和 O(N²) 与 Barnes-Hut 树 O(N log N) 两种引力核，
+以速度 Verlet (辛积分器) 推进，并给出能量、角动量的守恒漂移。
+
+位置、速度数组形状为 (N, d)，d = 2 (四叉树) 或 3 (八叉树)。
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+from .integrators import velocity_verlet
+
+# 直接求和每批处理的目标天体数，限制 (chunk, N) 临时数组的大小
+_DIRECT_CHUNK = 1024
+
+# method="auto" 时改用 Barnes-Hut 的天体数阈值
+_AUTO_THRESHOLD = 3000
+
+
+# ============================================
+# 直接求和
+# ============================================
+
+def gravity_direct(
+    pos: np.ndarray,
+    mass: np.ndarray,
+    G: float = 6.674e-11,
+    softening: float = 0.0
+) -> np.ndarray:
+    """
+    直接两两求和计算引力加速度 (向量化，按目标天体分块)
+
+    Args:
+        pos: 位置 (N, d)
+        mass: 质量 (N,)
+        G: 引力常量
+        softening: 软化长度 ε，势能取 -G m_i m_j / sqrt(r² + ε²)
+
+    Returns:
+        加速度 (N, d)
+    """
+    pos = np.asarray(pos, dtype=float)
+    mass = np.asarray(mass, dtype=float)
+    n = len(pos)
+    acc = np.empty_like(pos)
+
+    for start in range(0, n, _DIRECT_CHUNK):
+        stop = min(start + _DIRECT_CHUNK, n)
+        r2 = np.full((stop - start, n), softening**2)
+        for k in range(pos.shape[1]):
+            dk = pos[None, :, k] - pos[start:stop, k, None]
+            dk *= dk
+            r2 += dk
+        # 排除自身
+        r2[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        # w_ij = m_j / r_ij³，a_i = G Σ_j w_ij (x_j - x_i)，求和用矩阵乘法
+        w = np.sqrt(r2)
+        w *= r2
+        np.divide(mass, w, out=w)
+        acc[start:stop] = G * (w @ pos - w.sum(axis=1)[:, None] * pos[start:stop])
+
+    return acc
+
+
+# ============================================
+# Barnes-Hut 树
+# ============================================
+
+def _build_tree(pos: np.ndarray, mass: np.ndarray, max_depth: int) -> Dict[str, np.ndarray]:
+    """
+    逐层构建 2^d 叉树 (d=2 四叉树，d=3 八叉树)
+
+    每一层只对仍含多个天体的结点继续细分，同层结点用整数格点坐标编号。
+    结点数据以扁平数组保存，子结点以 CSR 形式索引。
+    """
+    n, d = pos.shape
+    lo = pos.min(axis=0)
+    size = float((pos.max(axis=0) - lo).max()) * (1 + 1e-9) or 1.0
+    u = (pos - lo) / size
+    # 保证同层编号不超过 int64
+    max_depth = min(max_depth, 62 // d)
+
+    levels = [np.zeros(1, dtype=int)]
+    coords = [np.zeros((1, d), dtype=np.int64)]
+    masses = [np.array([mass.sum()])]
+    coms = [(mass @ pos / mass.sum())[None, :]]
+    counts = [np.array([n])]
+    parents = [np.array([-1])]
+
+    # 每个天体当前所在的最深结点
+    body_node = np.zeros(n, dtype=int)
+    count_all = counts[0]
+    n_nodes = 1
+
+    for level in range(1, max_depth + 1):
+        split = count_all[body_node] > 1
+        bodies = np.nonzero(split)[0]
+        if bodies.size == 0:
+            break
+
+        cells = 1 << level
+        c = np.minimum((u[bodies] * cells).astype(np.int64), cells - 1)
+        key = np.zeros(bodies.size, dtype=np.int64)
+        for k in range(d):
+            key = key * cells + c[:, k]
+        uniq, first, inv = np.unique(key, return_index=True, return_inverse=True)
+
+        m_b = mass[bodies]
+        m_node = np.bincount(inv, weights=m_b)
+        com = np.stack([np.bincount(inv, weights=m_b * pos[bodies, k]) for k in range(d)], axis=1)
+        com /= np.where(m_node > 0, m_node, 1.0)[:, None]
+
+        levels.append(np.full(uniq.size, level))
+        coords.append(c[first])
+        masses.append(m_node)
+        coms.append(com)
+        node_count = np.bincount(inv)
+        counts.append(node_count)
+        count_all = np.concatenate([count_all, node_count])
+        parents.append(body_node[bodies[first]])
+
+        # 已是单天体叶结点的天体停留原处，之后不再参与细分
+        body_node[bodies] = n_nodes + inv
+        n_nodes += uniq.size
+
+    tree = {
+        "level": np.concatenate(levels),
+        "coords": np.concatenate(coords),
+        "mass": np.concatenate(masses),
+        "com": np.concatenate(coms),
+        "count": np.concatenate(counts),
+        "parent": np.concatenate(parents),
+    }
+    tree["size"] = size / 2.0**tree["level"]
+
+    # 子结点 CSR 索引
+    order = np.argsort(tree["parent"][1:], kind="stable") + 1
+    sorted_parent = tree["parent"][order]
+    node_ids = np.arange(n_nodes)
+    tree["child_start"] = np.searchsorted(sorted_parent, node_ids, side="left")
+    tree["n_child"] = np.searchsorted(sorted_parent, node_ids, side="right") - tree["child_start"]
+    tree["children"] = order
+    tree["is_leaf"] = tree["n_child"] == 0
+    tree["u"] = u
+    return tree
+
+
+def gravity_barnes_hut(
+    pos: np.ndarray,
+    mass: np.ndarray,
+    G: float = 6.674e-11,
+    softening: float = 0.0,
+    theta: float = 0.5,
+    max_depth: int = 20
+) -> np.ndarray:
+    """
+    Barnes-Hut 树算法计算引力加速度
+
+    对所有 (天体, 结点) 对同时做开角判据: 结点边长 / 距离 < theta 时
+    用结点质心近似，否则展开到子结点。整棵树按层向量化遍历，无逐天体循环。
+
+    Args:
+        pos: 位置 (N, d)，d = 2 或 3
+        mass: 质量 (N,)
+        G: 引力常量
+        softening: 软化长度 ε
+        theta: 开角参数，越小越精确 (theta = 0 退化为直接求和)
+        max_depth: 树的最大深度 (重合天体落在同一叶结点)
+
+    Returns:
+        加速度 (N, d)
+    """
+    pos = np.asarray(pos, dtype=float)
+    mass = np.asarray(mass, dtype=float)
+    n, d = pos.shape
+    tree = _build_tree(pos, mass, max_depth)
+    u = tree["u"]
+    eps2 = softening**2
+
+    acc = np.zeros((n, d))
+    bi = np.arange(n)
+    ni = np.zeros(n, dtype=int)
+
+    while bi.size:
+        dx = tree["com"][ni] - pos[bi]
+        r2 = np.einsum("ij,ij->i", dx, dx)
+
+        # 结点是否包含该天体: 天体在结点所在层的格点坐标与结点坐标一致
+        cells = (1 << tree["level"][ni])[:, None]
+        c = np.minimum((u[bi] * cells).astype(np.int64), cells - 1)
+        contains = np.all(c == tree["coords"][ni], axis=1)
+
+        leaf = tree["is_leaf"][ni]
+        far = ~contains & (tree["size"][ni]**2 < theta**2 * r2)
+        accept = far | leaf
+
+        if accept.any():
+            b, node = bi[accept], ni[accept]
+            m_eff = tree["mass"][node].copy()
+            dx_eff = dx[accept]
+            # 包含自身的叶结点: 扣除自身质量后用剩余天体的质心
+            own = contains[accept]
+            if own.any():
+                m_rest = m_eff[own] - mass[b[own]]
+                com_rest = (tree["mass"][node[own], None] * tree["com"][node[own]]
+                            - mass[b[own], None] * pos[b[own]])
+                safe = np.where(m_rest > 0, m_rest, 1.0)
+                dx_eff[own] = com_rest / safe[:, None] - pos[b[own]]
+                m_eff[own] = np.where(m_rest > 1e-12 * tree["mass"][node[own]], m_rest, 0.0)
+            r2_eff = np.einsum("ij,ij->i", dx_eff, dx_eff) + eps2
+            with np.errstate(divide="ignore", invalid="ignore"):
+                w = np.where(m_eff > 0, G * m_eff / (r2_eff * np.sqrt(r2_eff)), 0.0)
+            for k in range(d):
+                acc[:, k] += np.bincount(b, weights=w * dx_eff[:, k], minlength=n)
+
+        # 展开未被接受的结点
+        opened = ~accept
+        b, node = bi[opened], ni[opened]
+        n_child = tree["n_child"][node]
+        bi = np.repeat(b, n_child)
+        offsets = np.cumsum(n_child) - n_child
+        local = np.arange(bi.size) - np.repeat(offsets, n_child)
+        ni = tree["children"][np.repeat(tree["child_start"][node], n_child) + local]
+
+    return acc
+
+
+# ============================================
+# 守恒量
+# ============================================
+
+def nbody_energy(
+    pos: np.ndarray,
+    vel: np.ndarray,
+    mass: np.ndarray,
+    G: float = 6.674e-11,
+    softening: float = 0.0
+) -> float:
+    """
+    体系总机械能 (动能 + 引力势能)，势能与 gravity_direct 一样按目标天体分块直接求和
+
+    距离平方逐个分量原地累加，只有 (chunk, N) 的临时数组；
+    每块的 Σ_ij m_i m_j / r_ij 用矩阵-向量乘法求出，每对计了两次，最后取一半。
+    """
+    pos = np.asarray(pos, dtype=float)
+    mass = np.asarray(mass, dtype=float)
+    n = len(pos)
+    kinetic = 0.5 * np.sum(mass * np.sum(np.asarray(vel)**2, axis=1))
+
+    pair_sum = 0.0
+    for start in range(0, n, _DIRECT_CHUNK):
+        stop = min(start + _DIRECT_CHUNK, n)
+        r2 = np.full((stop - start, n), softening**2)
+        for k in range(pos.shape[1]):
+            dk = pos[None, :, k] - pos[start:stop, k, None]
+            dk *= dk
+            r2 += dk
+        # 排除自身
+        r2[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        np.sqrt(r2, out=r2)
+        np.divide(1.0, r2, out=r2)
+        pair_sum += mass[start:stop] @ (r2 @ mass)
+
+    return float(kinetic - 0.5 * G * pair_sum)
+
+
+def nbody_angular_momentum(
+    pos: np.ndarray,
+    vel: np.ndarray,
+    mass: np.ndarray
+) -> np.ndarray:
+    """
+    体系对原点的总角动量 L = Σ m r × v
+
+    Returns:
+        二维时为标量 (z 分量)，三维时为形状 (3,) 的向量
+    """
+    pos = np.asarray(pos, dtype=float)
+    p = np.asarray(mass, dtype=float)[:, None] * np.asarray(vel, dtype=float)
+    if pos.shape[1] == 2:
+        return np.sum(pos[:, 0] * p[:, 1] - pos[:, 1] * p[:, 0])
+    return np.cross(pos, p).sum(axis=0)
+
+
+# ============================================
+# 模拟
+# ============================================
+
+def nbody_simulate(
+    pos: np.ndarray,
+    vel: np.ndarray,
+    mass: np.ndarray,
+    dt: float,
+    n_steps: int,
+    G: float = 6.674e-11,
+    softening: float = 0.0,
+    method: str = "auto",
+    theta: float = 0.5,
+    save_every: int = 1,
+    track_conservation: Optional[bool] = None
+) -> Dict[str, np.ndarray]:
+    """
+    N 体引力模拟 (速度 Verlet 推进)
+
+    Args:
+        pos, vel: 初始位置与速度 (N, d)
+        mass: 质量 (N,)
+        dt: 时间步长
+        n_steps: 步数
+        G: 引力常量 (演示时可取 1 配合无量纲单位)
+        softening: 软化长度 ε，避免近距离相遇时加速度发散
+        method: "direct"、"barnes_hut"，或 "auto" (N 较大时用 Barnes-Hut)
+        theta: Barnes-Hut 开角参数
+        save_every: 每隔多少步保存一帧
+        track_conservation: 是否在保存帧上计算能量与角动量；势能为 O(N²) 直接求和，
+            默认只在 method 为 "direct" 时计算 (Barnes-Hut 时每帧的势能比引力本身还慢)
+
+    Returns:
+        字典，包含:
+            t: 保存帧的时刻 (n_saved,)
+            x, v: 各天体的轨迹 (N, n_saved, d)
+            以下各项仅在 track_conservation 时给出:
+            energy: 各帧总能量 (n_saved,)
+            angular_momentum: 各帧总角动量 (n_saved,) 或 (n_saved, 3)
+            energy_drift: 相对能量漂移 |E - E0| / |E0| (n_saved,)
+            angular_momentum_drift: 角动量相对漂移 (n_saved,)
+    """
+    mass = np.asarray(mass, dtype=float)
+    if method == "auto":
+        method = "barnes_hut" if len(mass) > _AUTO_THRESHOLD else "direct"
+    if method == "direct":
+        accel = lambda t, x: gravity_direct(x, mass, G, softening)
+    elif method == "barnes_hut":
+        accel = lambda t, x: gravity_barnes_hut(x, mass, G, softening, theta)
+    else:
+        raise ValueError(f"未知的引力计算方法: {method}")
+    if track_conservation is None:
+        track_conservation = method == "direct"
+
+    sol = velocity_verlet(accel, pos, vel, dt, n_steps, save_every=save_every)
+    result = {"t": sol["t"], "x": sol["x"], "v": sol["v"]}
+
+    if track_conservation:
+        frames = range(len(sol["t"]))
+        energy = np.array([
+            nbody_energy(sol["x"][:, k], sol["v"][:, k], mass, G, softening) for k in frames
+        ])
+        ang = np.array([
+            nbody_angular_momentum(sol["x"][:, k], sol["v"][:, k], mass) for k in frames
+        ])
+        ang_err = np.abs(ang - ang[0]) if ang.ndim == 1 else np.linalg.norm(ang - ang[0], axis=1)
+        ang_ref = np.linalg.norm(np.atleast_1d(ang[0])) or 1.0
+        result["energy"] = energy
+        result["angular_momentum"] = ang
+        result["energy_drift"] = np.abs(energy - energy[0]) / (abs(energy[0]) or 1.0)
+        result["angular_momentum_drift"] = ang_err / ang_ref
+
+    return result
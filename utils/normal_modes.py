@@ -0,0 +1,234 @@
+"""
+ QuantPhysics - 耦合振子与简正模式
+弹簧连接的 N 个质点 (一维链) 的小振动: M x'' + C x' + K x = F(t)。
+
+广义本征问题 K φ = ω² M φ 只求解一次 (质量加权后为对称矩阵，用 eigh)，
+之后任意初始条件在任意时刻的运动都是各简正模式的叠加:
+    x(t) = Φ q(t)，q_j(t) 为第 j 个模式的单自由度解析解
+所有时刻一次矩阵乘法求出，数百个质点、上千帧也无需逐步积分，可任意拖动时间轴。
+
+阻尼取瑞利阻尼 C = αM + βK (α 对应与速度成正比的空气阻力，β 对应弹簧内部的阻尼)，
+这时各模式仍然相互独立，模式 j 的衰减率 σ_j = (α + β ω_j²) / 2。
+"""
+
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+from .physics import ArrayLike
+
+_END_TYPES = ("fixed", "free")
+
+
+def chain_matrices(
+    n: int,
+    masses: ArrayLike = 1.0,
+    springs: ArrayLike = 1.0,
+    left: str = "fixed",
+    right: str = "fixed"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    一维质点-弹簧链的质量矩阵与刚度矩阵
+
+    质点 0 … n-1 依次由弹簧 1 … n-1 相连；端点固定时，弹簧 0 (左) 与弹簧 n (右)
+    把两端质点连到墙上，端点自由时这两根弹簧不起作用。
+
+    Args:
+        n: 质点数
+        masses: 各质点质量 (kg)，标量或 (n,)
+        springs: 各弹簧劲度系数 (N/m)，标量或 (n+1,) (含两端的弹簧)
+        left, right: 端点条件，"fixed" 或 "free"
+
+    Returns:
+        (M, K): 质量矩阵 (对角) 与刚度矩阵 (三对角)，均为 (n, n)
+    """
+    for end in (left, right):
+        if end not in _END_TYPES:
+            raise ValueError(f"未知的端点条件 {end!r}，应为 {_END_TYPES} 之一")
+    m = np.broadcast_to(np.asarray(masses, dtype=float), (n,))
+    k = np.array(np.broadcast_to(np.asarray(springs, dtype=float), (n + 1,)))
+    if left == "free":
+        k[0] = 0.0
+    if right == "free":
+        k[-1] = 0.0
+
+    K = np.diag(k[:-1] + k[1:])
+    K -= np.diag(k[1:-1], 1)
+    K -= np.diag(k[1:-1], -1)
+    return np.diag(m), K
+
+
+class NormalModes:
+    """
+    简正模式分析 (构造时求解本征问题，之后的运动计算都是矩阵乘法)
+
+    属性:
+        omega: 各模式角频率 (n,)，升序
+        frequency: 各模式频率 (Hz)
+        modes: 按质量归一化的模式矩阵 Φ (n, n)，第 j 列为第 j 个模式，Φᵀ M Φ = I
+        decay_rate: 各模式振幅的衰减率 σ_j (1/s)
+        damping_ratio: 阻尼比 ζ_j = σ_j / ω_j
+
+    Usage:
+        chain = NormalModes.chain(200, masses=0.1, springs=50.0)
+        x0 = np.exp(-((np.arange(200) - 40) / 8.0)**2)      # 高斯波包
+        t = np.linspace(0, 20, 1000)
+        x = chain.motion(t, x0)["x"]                           # (1000, 200)
+    """
+
+    def __init__(self, M: np.ndarray, K: np.ndarray, damping: float = 0.0, stiffness_damping: float = 0.0):
+        """
+        Args:
+            M: 质量矩阵 (n, n)，对称正定
+            K: 刚度矩阵 (n, n)，对称半正定
+            damping: 瑞利阻尼的质量系数 α (1/s)，即阻力系数 / 质量
+            stiffness_damping: 瑞利阻尼的刚度系数 β (s)
+        """
+        self.M = np.asarray(M, dtype=float)
+        self.K = np.asarray(K, dtype=float)
+        self.damping = damping
+        self.stiffness_damping = stiffness_damping
+
+        # M = L Lᵀ，L⁻¹ K L⁻ᵀ = Q Λ Qᵀ，Φ = L⁻ᵀ Q
+        L = np.linalg.cholesky(self.M)
+        L_inv = np.linalg.inv(L)
+        lam, Q = np.linalg.eigh(L_inv @ self.K @ L_inv.T)
+        lam = np.maximum(lam, 0.0)            # 自由链的刚体模式 ω = 0 (消去舍入误差)
+        self.omega = np.sqrt(lam)
+        self.frequency = self.omega / (2 * np.pi)
+        self.modes = L_inv.T @ Q
+        self.decay_rate = 0.5 * (damping + stiffness_damping * lam)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.damping_ratio = np.where(self.omega > 0, self.decay_rate / self.omega, np.inf)
+
+    @classmethod
+    def chain(
+        cls,
+        n: int,
+        masses: ArrayLike = 1.0,
+        springs: ArrayLike = 1.0,
+        left: str = "fixed",
+        right: str = "fixed",
+        damping: float = 0.0,
+        stiffness_damping: float = 0.0
+    ) -> "NormalModes":
+        """一维质点-弹簧链 (参数见 chain_matrices)"""
+        M, K = chain_matrices(n, masses, springs, left, right)
+        return cls(M, K, damping, stiffness_damping)
+
+    # ----------------------------------------
+    # 模式分解
+    # ----------------------------------------
+
+    def modal_coordinates(self, x: np.ndarray) -> np.ndarray:
+        """位移 (..., n) → 模式坐标 q = Φᵀ M x"""
+        return np.asarray(x, dtype=float) @ (self.M @ self.modes)
+
+    def _modal_response(self, t: np.ndarray, q0: np.ndarray, qd0: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        各模式的自由振动 q'' + 2σ q' + ω² q = 0
+
+        q = e^{-σt} [q₀ C(t) + (q̇₀ + σq₀) S(t)]，q' = e^{-σt} [q̇₀ C(t) - (σq̇₀ + ω²q₀) S(t)]，
+        μ² = ω² - σ²: 欠阻尼 C = cos μt，S = sin μt / μ；过阻尼为 cosh、sinh；临界阻尼 C = 1，S = t。
+        """
+        t = t[:, None]
+        w2 = self.omega**2
+        sigma = self.decay_rate
+        mu2 = w2 - sigma**2
+        mu = np.sqrt(np.abs(mu2))
+        with np.errstate(over="ignore", invalid="ignore"):
+            under = mu2 >= 0
+            C = np.where(under, np.cos(mu * t), np.cosh(mu * t))
+            # np.sinc 在 μ = 0 处取极限值 1，即 S = t
+            S = np.where(under, t * np.sinc(mu * t / np.pi),
+                         np.sinh(mu * t) / np.where(mu > 0, mu, 1.0))
+        decay = np.exp(-sigma * t)
+        q = decay * (q0 * C + (qd0 + sigma * q0) * S)
+        qd = decay * (qd0 * C - (sigma * qd0 + w2 * q0) * S)
+        return q, qd
+
+    # ----------------------------------------
+    # 运动
+    # ----------------------------------------
+
+    def motion(
+        self,
+        t: ArrayLike,
+        x0: np.ndarray,
+        v0: Optional[np.ndarray] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        给定初始位移、速度的自由振动 (模式叠加)
+
+        Args:
+            t: 时刻 (n_t,) (s)
+            x0: 各质点初始位移 (n,)
+            v0: 各质点初始速度 (n,)，默认静止
+
+        Returns:
+            字典，包含:
+                t: 时刻 (n_t,)
+                x, v: 各质点的位移与速度 (n_t, n)
+                q: 各模式坐标 (n_t, n)
+                energy: 各模式的能量 (n_t, n)，无阻尼时守恒
+        """
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+        q0 = self.modal_coordinates(x0)
+        qd0 = self.modal_coordinates(np.zeros_like(q0) if v0 is None else v0)
+        q, qd = self._modal_response(t, q0, qd0)
+        return {
+            "t": t,
+            "x": q @ self.modes.T,
+            "v": qd @ self.modes.T,
+            "q": q,
+            "energy": 0.5 * (qd**2 + self.omega**2 * q**2),
+        }
+
+    def frequency_response(
+        self,
+        f: ArrayLike,
+        force: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        简谐驱动力 F cos(2πft) 作用下的稳态响应 (共振曲线)
+
+        X(Ω) = Σ_j φ_j (φ_jᵀ F) / (ω_j² - Ω² + 2iσ_j Ω)
+
+        分母为零 (无阻尼共振 Ω = ω_j，包括自由链的刚体模式 ω = 0 在 Ω = 0 处) 时单独处理:
+        该模式不受力 (φ_jᵀ F = 0，如合力为零的静力) 则贡献为零，否则该模式振幅无界，
+        模式形状不为零的质点振幅为 inf (相位记为 0)。
+
+        Args:
+            f: 驱动频率 (Hz)，(n_f,)
+            force: 各质点上驱动力的振幅 (n,) (N)
+
+        Returns:
+            字典，包含:
+                f: 驱动频率 (n_f,)
+                X: 复振幅 (n_f, n)，位移为 Re[X e^{iΩt}]
+                amplitude: 各质点振幅 |X| (n_f, n)
+                phase: 位移相对驱动力的相位 (rad)
+        """
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        Omega = 2 * np.pi * f[:, None]
+        force = np.asarray(force, dtype=float)
+        modal_force = force @ self.modes
+        denom = self.omega**2 - Omega**2 + 2j * self.decay_rate * Omega
+        resonant = denom == 0
+        q = np.where(resonant, 0.0, modal_force / np.where(resonant, 1.0, denom))
+        X = q @ self.modes.T
+        # 模式力按舍入误差的量级判零 (合力为零时刚体模式的 φᵀF 只剩舍入误差)
+        unbounded = resonant & (np.abs(modal_force) > 1e-12 * (np.abs(force) @ np.abs(self.modes)))
+        if unbounded.any():
+            X[(unbounded.astype(float) @ (self.modes.T != 0)) > 0] = np.inf
+        return {"f": f, "X": X, "amplitude": np.abs(X), "phase": np.angle(X)}
+
+
+def uniform_chain_frequencies(n: int, m: float = 1.0, k: float = 1.0) -> np.ndarray:
+    """
+    两端固定的均匀链的简正频率解析式 ω_j = 2 sqrt(k/m) sin(jπ / (2(n+1)))，j = 1 … n
+
+    Returns:
+        角频率 (n,) (rad/s)，可用于核对数值结果或标注色散关系
+    """
+    j = np.arange(1, n + 1)
+    return 2 * np.sqrt(k / m) * np.sin(j * np.pi / (2 * (n + 1)))
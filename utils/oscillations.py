@@ -0,0 +1,239 @@
+"""
+ QuantPhysics - 机械振动
+单摆的精确解 (任意振幅，不作小角度近似) 与相空间图:
+    - 周期: T = 4 sqrt(L/g) K(k)，k = sin(θ₀/2)，第一类完全椭圆积分 K 用算术-几何平均 (AGM) 计算
+    - 运动: sin(θ/2) = k sn(K - ω₀t, k)，雅可比椭圆函数同样由 AGM 序列得到
+都是闭式解，对振幅数组整体计算，不需要逐帧数值积分。
+相图 (等能量线与分界线) 以 ω₀ 为单位生成，与摆长、重力加速度无关，用 lru_cache 缓存。
+
+椭圆函数的参数统一用 m = k² (与 scipy.special.ellipk / ellipj 相同)。
+"""
+
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from .physics import ArrayLike
+
+# AGM 迭代的收敛精度与最大次数 (二次收敛，m < 1 - 1e-15 时 10 次以内即可)
+_AGM_TOL = 1e-15
+_AGM_MAX_ITER = 40
+
+
+def _frozen(a: np.ndarray) -> np.ndarray:
+    a.setflags(write=False)
+    return a
+
+
+# ============================================
+# 椭圆积分与椭圆函数
+# ============================================
+
+def _agm_sequence(m: np.ndarray) -> Tuple[list, list]:
+    """AGM 序列 a_n、c_n (a₀ = 1，b₀ = sqrt(1 - m)，c₀ = sqrt(m))，对整个数组迭代到全部收敛"""
+    a = np.ones_like(m)
+    b = np.sqrt(1 - m)
+    c = np.sqrt(m)
+    a_seq, c_seq = [a], [c]
+    for _ in range(_AGM_MAX_ITER):
+        if np.all(np.abs(c) <= _AGM_TOL * a):
+            break
+        a, b, c = 0.5 * (a + b), np.sqrt(a * b), 0.5 * (a - b)
+        a_seq.append(a)
+        c_seq.append(c)
+    return a_seq, c_seq
+
+
+def ellipk(m: ArrayLike) -> ArrayLike:
+    """
+    第一类完全椭圆积分 K(m) = ∫₀^{π/2} dφ / sqrt(1 - m sin²φ)
+
+    K(m) = π / (2 AGM(1, sqrt(1 - m)))，m → 1 时趋于无穷。
+
+    Args:
+        m: 参数 m = k²，0 ≤ m ≤ 1
+    """
+    m = np.asarray(m, dtype=float)
+    if np.any((m < 0) | (m > 1)):
+        raise ValueError("椭圆积分的参数 m 必须在 [0, 1] 内")
+    with np.errstate(divide="ignore"):
+        K = 0.5 * np.pi / _agm_sequence(np.minimum(m, 1.0))[0][-1]
+    return np.where(m < 1, K, np.inf)
+
+
+def jacobi_elliptic(u: ArrayLike, m: ArrayLike) -> Tuple[ArrayLike, ArrayLike, ArrayLike]:
+    """
+    雅可比椭圆函数 sn(u|m)、cn(u|m)、dn(u|m) (AGM 降序 Landen 变换)
+
+    由 AGM 序列得到 φ_N = 2^N a_N u，再按 φ_{n-1} = (φ_n + arcsin(c_n sin φ_n / a_n)) / 2
+    递推到振幅 φ₀，sn = sin φ₀，cn = cos φ₀，dn = sqrt(1 - m sn²)。
+
+    Args:
+        u: 自变量
+        m: 参数 m = k²，0 ≤ m < 1；u、m 按 NumPy 规则广播
+
+    Returns:
+        (sn, cn, dn)
+    """
+    u, m = np.broadcast_arrays(np.asarray(u, dtype=float), np.asarray(m, dtype=float))
+    if np.any((m < 0) | (m >= 1)):
+        raise ValueError("雅可比椭圆函数的参数 m 必须在 [0, 1) 内")
+    a_seq, c_seq = _agm_sequence(m)
+    n = len(a_seq) - 1
+    phi = 2.0**n * a_seq[-1] * u
+    for k in range(n, 0, -1):
+        phi = 0.5 * (phi + np.arcsin(c_seq[k] / a_seq[k] * np.sin(phi)))
+    sn = np.sin(phi)
+    return sn, np.cos(phi), np.sqrt(1 - m * sn**2)
+
+
+# ============================================
+# 单摆
+# ============================================
+
+def _amplitude_parameter(theta0: ArrayLike) -> np.ndarray:
+    """振幅 θ₀ (rad) → 椭圆参数 m = sin²(θ₀/2)"""
+    theta0 = np.asarray(theta0, dtype=float)
+    if np.any(np.abs(theta0) >= np.pi):
+        raise ValueError("单摆振幅必须小于 π (180°)")
+    return np.sin(0.5 * theta0)**2
+
+
+def pendulum_period(theta0: ArrayLike, L: float = 1.0, g: float = 9.8) -> ArrayLike:
+    """
+    单摆的精确周期 T = 4 sqrt(L/g) K(sin²(θ₀/2))
+
+    Args:
+        theta0: 振幅 (rad)，可为数组 (整个滑块范围)
+        L: 摆长 (m)
+        g: 重力加速度 (m/s²)
+
+    Returns:
+        周期 (s)；小角度近似为 2π sqrt(L/g)
+    """
+    return 4 * np.sqrt(L / g) * ellipk(_amplitude_parameter(theta0))
+
+
+def pendulum_motion(
+    t: ArrayLike,
+    theta0: ArrayLike,
+    L: float = 1.0,
+    g: float = 9.8
+) -> Dict[str, ArrayLike]:
+    """
+    单摆从振幅 θ₀ 处静止释放后的精确运动及小角度近似
+
+    sin(θ/2) = k sn(K - ω₀t, k)，dθ/dt = -2kω₀ cn(K - ω₀t, k)，k = sin(θ₀/2)，ω₀ = sqrt(g/L)
+
+    Args:
+        t: 时刻 (s)，形状 (n_t,) 或标量
+        theta0: 振幅 (rad)，标量或数组
+        L: 摆长 (m)
+        g: 重力加速度 (m/s²)
+
+    Returns:
+        字典，包含 (数组形状为 theta0.shape + t.shape):
+            theta, omega: 精确解的摆角 (rad) 与角速度 (rad/s)
+            theta_small, omega_small: 小角度近似 θ₀ cos(ω₀t) 及其导数
+            period: 精确周期 (theta0.shape)
+            period_small: 小角度近似周期 2π/ω₀
+
+    Usage:
+        t = np.linspace(0, 10, 500)
+        res = pendulum_motion(t, np.radians([10, 60, 120, 170]))
+        res["theta"][2]        # 120° 振幅的摆角曲线
+    """
+    m = _amplitude_parameter(theta0)
+    k = np.sqrt(m)[..., None]
+    theta0 = np.asarray(theta0, dtype=float)[..., None]
+    t = np.asarray(t, dtype=float)
+    w0 = np.sqrt(g / L)
+    K = ellipk(m)
+    # 振幅为负时 k 取负号
+    k = np.copysign(k, theta0)
+
+    sn, cn, _ = jacobi_elliptic(K[..., None] - w0 * t.ravel(), m[..., None])
+    shape = theta0.shape[:-1] + t.shape
+    theta = (2 * np.arcsin(k * sn)).reshape(shape)
+    omega = (-2 * k * w0 * cn).reshape(shape)
+
+    phase = w0 * t
+    return {
+        "theta": theta,
+        "omega": omega,
+        "theta_small": (theta0 * np.cos(phase.ravel())).reshape(shape),
+        "omega_small": (-theta0 * w0 * np.sin(phase.ravel())).reshape(shape),
+        "period": 4 * K / w0,
+        "period_small": 2 * np.pi / w0,
+    }
+
+
+# ============================================
+# 相图
+# ============================================
+
+@lru_cache(maxsize=16)
+def pendulum_phase_portrait(
+    n_levels: int = 12,
+    theta_max: float = 2 * np.pi,
+    energy_max: float = 4.0,
+    n_points: int = 201
+) -> Dict[str, np.ndarray]:
+    """
+    单摆相图 (缓存，只读数组)，角速度以 ω₀ 为单位 (实际角速度乘以 sqrt(g/L))
+
+    无量纲能量 E = ω²/2 + (1 - cos θ)，等能量线 ω = ±sqrt(2(E - 1 + cos θ)):
+        E < 2: 摆动 (闭合曲线，绕 θ = 2πj 的平衡位置)
+        E = 2: 分界线 ω = ±2 cos(θ/2)
+        E > 2: 转动 (上下两条开放曲线)
+
+    Args:
+        n_levels: 等能量线条数 (能量在 (0, energy_max] 内均匀取值)
+        theta_max: θ 的显示范围 [-theta_max, theta_max]
+        energy_max: 最大能量
+        n_points: 每条曲线的采样点数
+
+    Returns:
+        字典，包含:
+            energies: 各等能量线的能量 (n_levels,)
+            x, y: 全部等能量线，曲线之间以 NaN 分隔 (可直接作为一条 Scatter 轨迹)
+            separatrix_x, separatrix_y: 分界线 (上下两支，以 NaN 分隔)
+            theta, omega, H: 能量等值图的网格 (n_points,)、(n_points,)、(n_points, n_points)
+    """
+    energies = energy_max * np.arange(1, n_levels + 1) / n_levels
+    centers = 2 * np.pi * np.arange(-np.ceil(theta_max / (2 * np.pi)), np.ceil(theta_max / (2 * np.pi)) + 1)
+    theta = np.linspace(-theta_max, theta_max, n_points)
+    s = np.linspace(-0.5 * np.pi, 0.5 * np.pi, n_points)
+    gap = np.array([np.nan])
+
+    xs, ys = [], []
+    for E in energies:
+        if E < 2:
+            # 摆动: θ = θ_m sin s 使转折点附近采样更密，上半支与下半支连成闭合曲线
+            th = np.arccos(1 - E) * np.sin(s)
+            w = np.sqrt(np.maximum(2 * (E - 1 + np.cos(th)), 0.0))
+            loop_x = np.concatenate([th, th[::-1]])
+            loop_y = np.concatenate([w, -w[::-1]])
+            for c in centers:
+                x = loop_x + c
+                if np.any(np.abs(x) <= theta_max):
+                    xs += [np.where(np.abs(x) <= theta_max, x, np.nan), gap]
+                    ys += [loop_y, gap]
+        else:
+            w = np.sqrt(2 * (E - 1 + np.cos(theta)))
+            xs += [theta, gap, theta, gap]
+            ys += [w, gap, -w, gap]
+
+    omega_max = np.sqrt(2 * energy_max)
+    omega = np.linspace(-omega_max, omega_max, n_points)
+    H = 0.5 * omega[:, None]**2 + 1 - np.cos(theta)[None, :]
+    return {
+        "energies": _frozen(energies),
+        "x": _frozen(np.concatenate(xs) if xs else np.empty(0)),
+        "y": _frozen(np.concatenate(ys) if ys else np.empty(0)),
+        "separatrix_x": _frozen(np.concatenate([theta, gap, theta])),
+        "separatrix_y": _frozen(np.concatenate([2 * np.cos(0.5 * theta), gap, -2 * np.cos(0.5 * theta)])),
+        "theta": _frozen(theta),
+        "omega": _frozen(omega),
+        "H": _frozen(H),
+    }
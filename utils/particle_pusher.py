@@ -0,0 +1,161 @@
+"""
+ QuantPhysics - 带电粒子推进 (Boris 算法)
+批量推进大量带电粒子在电场 E、磁场 B (可随空间、时间变化) 中的运动，
+用于速度选择器、质谱仪、回旋加速器等演示。
+
+粒子状态数组形状为 (N, 3)。场可以是:
+    - 常向量或数组: 可广播到 (N, 3)，表示匀强场
+    - 函数 field(x, t) -> (N, 3): x 为粒子位置 (N, 3)，t 为当前时刻
+"""
+
+import numpy as np
+from typing import Callable, Dict, Optional, Union
+
+Field = Union[np.ndarray, Callable[[np.ndarray, float], np.ndarray]]
+
+
+def _eval_field(field: Optional[Field], x: np.ndarray, t: float) -> np.ndarray:
+    """在粒子位置处求场值，返回 (N, 3)"""
+    if field is None:
+        return np.zeros_like(x)
+    if callable(field):
+        return np.asarray(field(x, t), dtype=float)
+    return np.broadcast_to(np.asarray(field, dtype=float), x.shape)
+
+
+def boris_rotate(
+    v: np.ndarray,
+    E: np.ndarray,
+    B: np.ndarray,
+    q_m: np.ndarray,
+    dt: float
+) -> np.ndarray:
+    """
+    Boris 速度更新: 半步电场加速 → 磁场旋转 → 半步电场加速
+
+    磁场旋转严格保持速度大小，纯磁场中粒子动能不随步数漂移。
+
+    Args:
+        v: 速度 (N, 3)
+        E, B: 粒子处的电场、磁场 (N, 3)
+        q_m: 荷质比 q/m，标量或 (N,)
+        dt: 时间步长
+
+    Returns:
+        更新后的速度 (N, 3)
+    """
+    q_m = np.asarray(q_m, dtype=float)
+    if q_m.ndim:
+        q_m = q_m[..., None]
+    half = 0.5 * q_m * dt
+    v_minus = v + half * E
+    t_vec = half * B
+    s_vec = 2 * t_vec / (1 + np.sum(t_vec**2, axis=-1, keepdims=True))
+    v_prime = v_minus + np.cross(v_minus, t_vec)
+    v_plus = v_minus + np.cross(v_prime, s_vec)
+    return v_plus + half * E
+
+
+def boris_push(
+    x0: np.ndarray,
+    v0: np.ndarray,
+    q_m: Union[float, np.ndarray],
+    dt: float,
+    n_steps: int,
+    E: Optional[Field] = None,
+    B: Optional[Field] = None,
+    t0: float = 0.0,
+    save_every: int = 1,
+    absorb: Optional[Callable[[np.ndarray], np.ndarray]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    用 Boris 算法批量推进带电粒子
+
+    位置与速度交错半步 (蛙跳格式): 推进过程中速度 v 对应 t - dt/2 时刻。
+    开始时先把 v0 回推半步，使输出的 x 与 t 对应、整体二阶精度；
+    结束 (或粒子被吸收) 时再前推半步，输出的速度与位置处于同一时刻。
+    被吸收的粒子停止推进，不再参与场的计算。
+
+    Args:
+        x0: 初始位置 (N, 3) (m)
+        v0: 初始速度 (N, 3) (m/s)
+        q_m: 荷质比 q/m (C/kg)，标量或 (N,)
+        dt: 时间步长 (s)，回旋运动建议 dt < 0.1 / (|q/m| B)
+        n_steps: 步数
+        E: 电场 (V/m)，常向量、数组或函数 E(x, t)
+        B: 磁场 (T)，常向量、数组或函数 B(x, t)
+        t0: 起始时间 (s)
+        save_every: 每隔多少步保存一帧
+        absorb: 吸收边界 absorb(x) -> (N,) 布尔数组，为 True 的粒子被吸收
+                (如打到探测屏、极板或飞出区域)
+
+    Returns:
+        字典，包含:
+            t: 保存帧的时刻 (n_saved,)
+            x: 保存帧的位置 (N, n_saved, 3)，被吸收后保持吸收位置
+            v: 最终速度 (N, 3)，与最后一帧 (被吸收的粒子为吸收时刻) 同步
+            alive: 最终是否仍在运动 (N,)
+            t_absorb: 吸收时刻 (N,)，未被吸收为 NaN
+            x_absorb: 吸收位置 (N, 3)，未被吸收为 NaN
+    """
+    x = np.array(x0, dtype=float)
+    v = np.array(v0, dtype=float)
+    n = len(x)
+    q_m = np.broadcast_to(np.asarray(q_m, dtype=float), (n,))
+
+    # 速度回推半步: v(-dt/2)
+    v = boris_rotate(v, _eval_field(E, x, t0), _eval_field(B, x, t0), q_m, -0.5 * dt)
+
+    n_saved = n_steps // save_every + 1
+    t_out = t0 + dt * save_every * np.arange(n_saved)
+    x_out = np.empty((n, n_saved, 3))
+    x_out[:, 0] = x
+
+    alive = np.ones(n, dtype=bool)
+    t_absorb = np.full(n, np.nan)
+    x_absorb = np.full((n, 3), np.nan)
+    if absorb is not None:
+        hit = np.asarray(absorb(x), dtype=bool)
+        alive &= ~hit
+        t_absorb[hit] = t0
+        x_absorb[hit] = x[hit]
+        v[hit] = np.asarray(v0, dtype=float)[hit]
+
+    idx = np.nonzero(alive)[0]
+    for step in range(1, n_steps + 1):
+        t = t0 + (step - 1) * dt
+        if idx.size:
+            xa = x[idx]
+            va = boris_rotate(v[idx], _eval_field(E, xa, t), _eval_field(B, xa, t), q_m[idx], dt)
+            xa = xa + va * dt
+            x[idx], v[idx] = xa, va
+
+            if absorb is not None:
+                hit = np.asarray(absorb(xa), dtype=bool)
+                if hit.any():
+                    rows = idx[hit]
+                    t_absorb[rows] = t + dt
+                    x_absorb[rows] = xa[hit]
+                    alive[rows] = False
+                    # 被吸收的粒子速度前推半步到吸收时刻
+                    v[rows] = boris_rotate(va[hit], _eval_field(E, xa[hit], t + dt),
+                                           _eval_field(B, xa[hit], t + dt), q_m[rows], 0.5 * dt)
+                    idx = idx[~hit]
+
+        if step % save_every == 0:
+            x_out[:, step // save_every] = x
+
+    # 速度前推半步: v(t_end)
+    if idx.size:
+        t_end = t0 + n_steps * dt
+        xa = x[idx]
+        v[idx] = boris_rotate(v[idx], _eval_field(E, xa, t_end), _eval_field(B, xa, t_end), q_m[idx], 0.5 * dt)
+
+    return {
+        "t": t_out,
+        "x": x_out,
+        "v": v,
+        "alive": alive,
+        "t_absorb": t_absorb,
+        "x_absorb": x_absorb,
+    }
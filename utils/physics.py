@@ -3,8 +3,16 @@
 常用物理公式和计算函数
 """
 
+import warnings
+from abc import ABC, abstractmethod
+
 import numpy as np
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional, Union
+
+from .integrators import dormand_prince
+
+# 标量或数组参数 (按 NumPy 规则广播)
+ArrayLike = Union[float, np.ndarray]
 
 # ============================================
 # 运动学
@@ -39,12 +47,7 @@ def projectile_motion(
     v0y = v0 * np.sin(theta_rad)
     
     # 计算飞行时间 (解一元二次方程)
-    # h0 + v0y*t - 0.5*g*t^2 = 0
-    a = -0.5 * g
-    b = v0y
-    c = h0
-    discriminant = b**2 - 4*a*c
-    t_flight = (-b - np.sqrt(discriminant)) / (2*a)
+    t_flight = _flight_time(v0y, g, h0)
     
     # 生成轨迹
     t = np.arange(0, t_flight, dt)
@@ -58,11 +61,273 @@ def projectile_motion(
     return x, y, t_flight, x_max, h_max
 
 
+def _flight_time(v0y: ArrayLike, g: ArrayLike, h0: ArrayLike) -> ArrayLike:
+    """
+    抛体落地时间: h0 + v0y*t - 0.5*g*t^2 = 0 的正根
+    
+    支持数组输入 (逐元素计算)
+    """
+    return (v0y + np.sqrt(v0y**2 + 2 * g * h0)) / g
+
+
+def projectile_motion_batch(
+    v0: ArrayLike,
+    theta: ArrayLike,
+    g: ArrayLike = 9.8,
+    h0: ArrayLike = 0,
+    dt: float = 0.01,
+    num_points: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    批量计算抛体运动轨迹 (一次向量化计算所有轨迹)
+    
+    v0、theta、g、h0 均可为标量或数组，按 NumPy 规则广播，
+    广播后的形状记为 batch_shape。
+    
+    两种采样方式:
+        - num_points 为 None: 所有轨迹共用时间步长 dt，
+          按最长飞行时间补齐成矩形数组，落地后的点由 mask 标记为无效 (值为 NaN)
+        - num_points 为整数: 每条轨迹在各自的 [0, t_flight] 上取 num_points 个点，
+          mask 全为 True
+    
+    Args:
+        v0: 初速度 (m/s)
+        theta: 发射角度 (度)
+        g: 重力加速度 (m/s²)
+        h0: 初始高度 (m)
+        dt: 时间步长 (s)，仅在 num_points 为 None 时使用
+        num_points: 每条轨迹的采样点数
+    
+    Returns:
+        字典，包含:
+            t, x, y: 形状 batch_shape + (n_samples,) 的时间与坐标数组
+            mask: 同形状的布尔数组，True 表示该采样点在飞行过程中
+            t_flight, x_max, h_max: 形状 batch_shape 的飞行时间、水平射程、最大高度
+    """
+    v0, theta, g, h0 = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (v0, theta, g, h0))
+    )
+    theta_rad = np.radians(theta)
+    v0x = v0 * np.cos(theta_rad)
+    v0y = v0 * np.sin(theta_rad)
+    
+    t_flight = _flight_time(v0y, g, h0)
+    x_max = v0x * t_flight
+    # 斜向下抛出时最高点即为抛出点
+    h_max = h0 + np.maximum(v0y, 0)**2 / (2 * g)
+    
+    if num_points is None:
+        n_samples = int(np.ceil(t_flight.max() / dt)) if t_flight.size else 0
+        t = np.arange(n_samples) * dt
+        mask = t < t_flight[..., None]
+        t = np.broadcast_to(t, mask.shape)
+    else:
+        t = t_flight[..., None] * np.linspace(0, 1, num_points)
+        mask = np.ones(t.shape, dtype=bool)
+    
+    x = v0x[..., None] * t
+    y = h0[..., None] + v0y[..., None] * t - 0.5 * g[..., None] * t**2
+    x[~mask] = np.nan
+    y[~mask] = np.nan
+    
+    return {
+        "t": t,
+        "x": x,
+        "y": y,
+        "mask": mask,
+        "t_flight": t_flight,
+        "x_max": x_max,
+        "h_max": h_max,
+    }
+
+
+def _drag_rhs(t, y, p):
+    """阻力抛体的右端函数，状态 [x, y, vx, vy]，参数 [g, k/m, 阻力指数]"""
+    g, k_m, order = p[:, 0], p[:, 1], p[:, 2]
+    vx, vy = y[:, 2], y[:, 3]
+    # 线性阻力 f = -k v；二次阻力 f = -k |v| v
+    coef = k_m * np.where(order == 2, np.hypot(vx, vy), 1.0)
+    return np.stack([vx, vy, -coef * vx, -g - coef * vy], axis=1)
+
+
+def _drag_flight_bound(v0, v0y, g, h0, k_m, order):
+    """阻力抛体飞行时间的上界，用于确定共用的输出时间网格"""
+    h_top = h0 + np.maximum(v0y, 0)**2 / (2 * g)
+    t_up = np.maximum(v0y, 0) / g
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # 下落时竖直方向阻力至少相当于时间常数 tau 的线性阻力
+        v_scale = np.where(order == 2, np.maximum(v0, np.sqrt(g / k_m)), 1.0)
+        tau = np.where(k_m > 0, 1 / (k_m * v_scale), np.inf)
+    # 线性阻力下从静止下落 h_top 的时间: g*tau*(t - tau*(1 - e^(-t/tau))) = h_top
+    # 从上界 h_top/(g*tau) + tau 出发做牛顿迭代 (函数单调凸，迭代单调收敛)
+    finite = np.isfinite(tau)
+    tau_f = np.where(finite, tau, 1.0)
+    t_down = np.where(finite, h_top / (g * tau_f) + tau_f, np.sqrt(2 * h_top / g))
+    for _ in range(30):
+        decay = np.exp(-t_down / tau_f)
+        F = g * tau_f * (t_down - tau_f * (1 - decay)) - h_top
+        dF = g * tau_f * (1 - decay)
+        t_down = np.where(finite & (dF > 0), t_down - F / np.where(dF > 0, dF, 1.0), t_down)
+    return t_up + t_down
+
+
+def _integrate_drag(v0, theta, g, h0, m, k, drag, num_points, rtol):
+    """
+    批量积分阻力抛体直到落地
+
+    Returns:
+        (sol, batch_shape, t_eval, y0, params, t_max)，sol 为 dormand_prince 的结果
+        (系统按广播后的参数展平排列)
+    """
+    if drag not in ("linear", "quadratic"):
+        raise ValueError(f"未知的阻力模型: {drag}")
+    order = 2 if drag == "quadratic" else 1
+
+    v0, theta, g, h0, m, k = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (v0, theta, g, h0, m, k))
+    )
+    shape = v0.shape
+    v0, theta, g, h0, k_m = (a.ravel() for a in (v0, theta, g, h0, k / m))
+    theta_rad = np.radians(theta)
+    v0x, v0y = v0 * np.cos(theta_rad), v0 * np.sin(theta_rad)
+
+    order = np.full(v0.shape, order, dtype=float)
+    t_bound = _drag_flight_bound(v0, v0y, g, h0, k_m, order)
+    t_max = float(t_bound.max()) * 1.01 if t_bound.size else 1.0
+    t_eval = np.linspace(0, t_max, num_points)
+
+    y0 = np.stack([np.zeros_like(v0), h0, v0x, v0y], axis=1)
+    params = np.stack([g, k_m, order], axis=1)
+    # 落地事件: y 由正变负 (从地面抛出时 y0=0，只有下降穿过地面才触发)
+    sol = dormand_prince(
+        _drag_rhs, y0, (0, t_max), t_eval=t_eval,
+        rtol=rtol, atol=1e-9 * max(1.0, t_max),
+        event=lambda t, y, p: np.where(y[:, 3] < 0, y[:, 1], 1.0),
+        event_direction=-1, args=params
+    )
+    return sol, shape, t_eval, y0, params, t_max
+
+
+def projectile_motion_drag(
+    v0: ArrayLike,
+    theta: ArrayLike,
+    g: ArrayLike = 9.8,
+    h0: ArrayLike = 0,
+    m: ArrayLike = 1.0,
+    k: ArrayLike = 0.0,
+    drag: str = "quadratic",
+    num_points: int = 200,
+    rtol: float = 1e-6
+) -> Dict[str, np.ndarray]:
+    """
+    批量计算有空气阻力的抛体运动 (所有抛射一次积分)
+
+    阻力模型:
+        - "linear":    f = -k v
+        - "quadratic": f = -k |v| v
+
+    所有参数按 NumPy 规则广播，广播后的形状记为 batch_shape。
+    轨迹在共用的时间网格上输出，落地之后的采样点为 NaN。
+
+    Args:
+        v0: 初速度 (m/s)
+        theta: 发射角度 (度)
+        g: 重力加速度 (m/s²)
+        h0: 初始高度 (m)
+        m: 质量 (kg)
+        k: 阻力系数 (线性 kg/s，二次 kg/m)
+        drag: 阻力模型 "linear" 或 "quadratic"
+        num_points: 输出时间网格的点数
+        rtol: 积分相对误差容限
+
+    Returns:
+        字典，包含:
+            t: 输出时刻 (num_points,)
+            x, y: 轨迹 batch_shape + (num_points,)
+            t_flight, x_max, h_max: 飞行时间、水平射程、最大高度 (batch_shape)
+    """
+    sol, shape, t_eval, y0, params, t_max = _integrate_drag(v0, theta, g, h0, m, k, drag, num_points, rtol)
+    x, y = sol["y"][:, :, 0], sol["y"][:, :, 1]
+
+    # 最高点: 竖直速度由正变负的事件 (与落地事件同一套事件定位，不受输出网格疏密影响)
+    h_max = y0[:, 1].copy()
+    rising = np.nonzero(y0[:, 3] > 0)[0]
+    if rising.size:
+        apex = dormand_prince(
+            _drag_rhs, y0[rising], (0, t_max), rtol=rtol, atol=1e-9 * max(1.0, t_max),
+            event=lambda t, y, p: y[:, 3], event_direction=-1, args=params[rising]
+        )
+        h_max[rising] = apex["y_event"][:, 1]
+
+    return {
+        "t": t_eval,
+        "x": x.reshape(shape + (num_points,)),
+        "y": y.reshape(shape + (num_points,)),
+        "t_flight": sol["t_event"].reshape(shape),
+        "x_max": sol["y_event"][:, 0].reshape(shape),
+        "h_max": h_max.reshape(shape),
+    }
+
+
+def optimal_angle_drag(
+    v0: ArrayLike,
+    g: ArrayLike = 9.8,
+    h0: ArrayLike = 0,
+    m: ArrayLike = 1.0,
+    k: ArrayLike = 0.0,
+    drag: str = "quadratic",
+    n_angles: int = 89
+) -> Dict[str, np.ndarray]:
+    """
+    有空气阻力时射程最远的发射角
+
+    对每组参数在 (0°, 90°) 内扫描 n_angles 个角度，所有 (参数, 角度) 组合
+    在一次批量积分中完成，再用最大值附近三点的抛物线插值细化。
+
+    Args:
+        v0, g, h0, m, k: 同 projectile_motion_drag，按 NumPy 规则广播
+        drag: 阻力模型 "linear" 或 "quadratic"
+        n_angles: 扫描的角度个数
+
+    Returns:
+        字典，包含:
+            theta_opt: 最佳发射角 (度)，batch_shape
+            x_max: 最佳发射角对应的射程 (m)，batch_shape
+            theta: 扫描的角度 (n_angles,)
+            ranges: 各角度的射程 batch_shape + (n_angles,)
+    """
+    angles = np.linspace(0, 90, n_angles + 2)[1:-1]
+    params = [np.asarray(a, dtype=float)[..., None] for a in (v0, g, h0, m, k)]
+    v0, g, h0, m, k = params
+
+    # 只需落地点，不必求最高点
+    sol, shape = _integrate_drag(v0, angles, g, h0, m, k, drag, 2, 1e-6)[:2]
+    ranges = sol["y_event"][:, 0].reshape(shape)
+
+    # 最大值两侧各取一点做抛物线插值
+    i = np.clip(np.argmax(ranges, axis=-1), 1, n_angles - 2)[..., None]
+    r_l, r_c, r_r = (np.take_along_axis(ranges, i + s, axis=-1)[..., 0] for s in (-1, 0, 1))
+    step = angles[1] - angles[0]
+    denom = r_l - 2 * r_c + r_r
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shift = np.where(denom < 0, 0.5 * (r_l - r_r) / denom, 0.0)
+    shift = np.clip(shift, -1, 1)
+    theta_opt = angles[i[..., 0]] + shift * step
+    x_max = r_c - 0.25 * (r_l - r_r) * shift
+
+    return {
+        "theta_opt": theta_opt,
+        "x_max": x_max,
+        "theta": angles,
+        "ranges": ranges,
+    }
+
+
 def uniform_circular_motion(
-    r: float,
-    T: float,
+    r: ArrayLike,
+    T: ArrayLike,
     num_points: int = 100
-) -> Tuple[np.ndarray, np.ndarray, float, float]:
+) -> Tuple[np.ndarray, np.ndarray, ArrayLike, ArrayLike]:
     """
     计算匀速圆周运动参数
     
@@ -71,61 +336,448 @@ def uniform_circular_motion(
         T: 周期 (s)
         num_points: 轨迹点数
     
+    r、T 可为数组 (按 NumPy 规则广播)，x、y 的形状为广播后的 batch_shape + (num_points,)
+    
     Returns:
         x: x坐标数组
         y: y坐标数组
         omega: 角速度 (rad/s)
         a_c: 向心加速度 (m/s²)
     """
-    omega = 2 * np.pi / T
-    v = omega * r
-    a_c = v**2 / r  # 或 omega**2 * r
+    r = np.asarray(r, dtype=float)
+    omega = 2 * np.pi / np.asarray(T, dtype=float)
+    a_c = omega**2 * r
     
     theta = np.linspace(0, 2 * np.pi, num_points)
-    x = r * np.cos(theta)
-    y = r * np.sin(theta)
+    radius = np.broadcast_to(r, a_c.shape)[..., None]
+    x = radius * np.cos(theta)
+    y = radius * np.sin(theta)
     
     return x, y, omega, a_c
 
 
 def charged_particle_in_magnetic_field(
-    q: float,
-    m: float,
-    v: float,
-    B: float
-) -> Dict[str, float]:
+    q: ArrayLike,
+    m: ArrayLike,
+    v: ArrayLike,
+    B: ArrayLike
+) -> Dict[str, ArrayLike]:
     """
-    计算带电粒子在匀强磁场中的运动参数
+    计算带电粒子在匀强磁场中的运动参数 (速度垂直于磁场)
     
     Args:
-        q: 电荷量 (C)
+        q: 电荷量 (C)，正负电荷均可，结果只与 |q| 有关
         m: 质量 (kg)
         v: 速度 (m/s)
         B: 磁感应强度 (T)
     
     Returns:
-        包含回旋半径、周期、角速度的字典
+        包含回旋半径、周期、角速度 (大小) 的字典，参数为数组时各项为同形状数组
     """
-    r = m * v / (q * B)
-    T = 2 * np.pi * m / (q * B)
-    omega = q * B / m
+    qB = np.abs(np.asarray(q, dtype=float) * B)
+    r = m * np.abs(v) / qB
+    T = 2 * np.pi * m / qB
+    omega = qB / m
     
     return {
         "radius": r,
         "period": T,
         "omega": omega,
-        "lorentz_force": q * v * B
+        "lorentz_force": qB * np.abs(v)
     }
 
 
+# ============================================
+# 解析轨迹 (按需求值)
+# ============================================
+
+class Trajectory(ABC):
+    """
+    解析轨迹基类
+    
+    只保存运动参数，位置、速度、加速度在给定时间数组上按需求值，
+    绘图时可按实际需要的点数重新采样，不预先生成固定步长的数组。
+    子类需实现 position / velocity / acceleration 以及 t_end，缺少任一方法的子类不能实例化。
+    """
+    
+    t_end: float = 0.0
+    
+    @abstractmethod
+    def position(self, t: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """t 时刻的位置 (x, y)"""
+    
+    @abstractmethod
+    def velocity(self, t: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """t 时刻的速度 (vx, vy)"""
+    
+    @abstractmethod
+    def acceleration(self, t: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """t 时刻的加速度 (ax, ay)"""
+    
+    def events(self) -> Dict[str, float]:
+        """特征时刻 (精确值)，如落地、最高点"""
+        return {}
+    
+    def sample(
+        self,
+        num_points: int,
+        t_start: float = 0.0,
+        t_end: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        在 [t_start, t_end] 上均匀采样
+        
+        Args:
+            num_points: 采样点数 (如图表的像素宽度)
+            t_start: 起始时间 (s)
+            t_end: 结束时间 (s)，默认为轨迹的结束时刻
+        
+        Returns:
+            (t, x, y): 时间与坐标数组
+        """
+        if t_end is None:
+            t_end = self.t_end
+        t = np.linspace(t_start, t_end, num_points)
+        x, y = self.position(t)
+        return t, x, y
+
+
+class ProjectileTrajectory(Trajectory):
+    """
+    抛体运动的解析轨迹
+    
+    Args:
+        v0: 初速度 (m/s)
+        theta: 发射角度 (度)
+        g: 重力加速度 (m/s²)
+        h0: 初始高度 (m)
+    
+    Usage:
+        traj = ProjectileTrajectory(20, 45)
+        t, x, y = traj.sample(800)
+    """
+    
+    def __init__(self, v0: float, theta: float, g: float = 9.8, h0: float = 0):
+        self.v0 = v0
+        self.theta = theta
+        self.g = g
+        self.h0 = h0
+        
+        theta_rad = np.radians(theta)
+        self.v0x = v0 * np.cos(theta_rad)
+        self.v0y = v0 * np.sin(theta_rad)
+        self.t_end = float(_flight_time(self.v0y, g, h0))
+    
+    @property
+    def t_flight(self) -> float:
+        """飞行时间 (s)"""
+        return self.t_end
+    
+    @property
+    def t_apex(self) -> float:
+        """到达最高点的时刻 (s)，斜向下抛出时为 0"""
+        return float(max(self.v0y, 0) / self.g)
+    
+    @property
+    def x_max(self) -> float:
+        """水平射程 (m)"""
+        return self.v0x * self.t_end
+    
+    @property
+    def h_max(self) -> float:
+        """最大高度 (m)"""
+        return self.h0 + max(self.v0y, 0)**2 / (2 * self.g)
+    
+    def position(self, t: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        t = np.asarray(t, dtype=float)
+        x = self.v0x * t
+        y = self.h0 + self.v0y * t - 0.5 * self.g * t**2
+        return x, y
+    
+    def velocity(self, t: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        t = np.asarray(t, dtype=float)
+        vx = np.full_like(t, self.v0x)
+        vy = self.v0y - self.g * t
+        return vx, vy
+    
+    def acceleration(self, t: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        t = np.asarray(t, dtype=float)
+        return np.zeros_like(t), np.full_like(t, -self.g)
+    
+    def events(self) -> Dict[str, float]:
+        return {"apex": self.t_apex, "landing": self.t_end}
+
+
+class CircularTrajectory(Trajectory):
+    """
+    匀速圆周运动的解析轨迹 (逆时针)
+    
+    Args:
+        r: 圆周半径 (m)
+        T: 周期 (s)
+        phase0: 初始相位 (度)
+        center: 圆心坐标
+    """
+    
+    def __init__(
+        self,
+        r: float,
+        T: float,
+        phase0: float = 0,
+        center: Tuple[float, float] = (0.0, 0.0)
+    ):
+        self.r = r
+        self.T = T
+        self.phase0 = np.radians(phase0)
+        self.center = center
+        self.omega = 2 * np.pi / T
+        self.t_end = T
+    
+    @property
+    def speed(self) -> float:
+        """线速度大小 (m/s)"""
+        return self.omega * self.r
+    
+    @property
+    def a_c(self) -> float:
+        """向心加速度大小 (m/s²)"""
+        return self.omega**2 * self.r
+    
+    def _phase(self, t: ArrayLike) -> np.ndarray:
+        return self.phase0 + self.omega * np.asarray(t, dtype=float)
+    
+    def position(self, t: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        phi = self._phase(t)
+        return (self.center[0] + self.r * np.cos(phi),
+                self.center[1] + self.r * np.sin(phi))
+    
+    def velocity(self, t: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        phi = self._phase(t)
+        return -self.speed * np.sin(phi), self.speed * np.cos(phi)
+    
+    def acceleration(self, t: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        phi = self._phase(t)
+        return -self.a_c * np.cos(phi), -self.a_c * np.sin(phi)
+    
+    def events(self) -> Dict[str, float]:
+        return {"period": self.T}
+
+
+# ============================================
+# 天体运动 (二体问题解析传播)
+# ============================================
+
+def _stumpff(z: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Stumpff 函数 C(z)、S(z)，z > 0 椭圆，z < 0 双曲，z ≈ 0 抛物 (级数)"""
+    C = np.empty_like(z)
+    S = np.empty_like(z)
+    pos = z > 1e-6
+    neg = z < -1e-6
+    mid = ~pos & ~neg
+
+    sz = np.sqrt(z[pos])
+    C[pos] = (1 - np.cos(sz)) / z[pos]
+    S[pos] = (sz - np.sin(sz)) / sz**3
+
+    sz = np.sqrt(-z[neg])
+    C[neg] = (np.cosh(sz) - 1) / -z[neg]
+    S[neg] = (np.sinh(sz) - sz) / sz**3
+
+    zm = z[mid]
+    C[mid] = 1/2 - zm/24 + zm**2/720
+    S[mid] = 1/6 - zm/120 + zm**2/5040
+    return C, S
+
+
+def orbit_properties(
+    r0: np.ndarray,
+    v0: np.ndarray,
+    mu: ArrayLike
+) -> Dict[str, np.ndarray]:
+    """
+    由某一时刻的位置和速度求轨道特征量 (支持批量)
+
+    Args:
+        r0: 位置 (..., d)，d = 2 或 3 (m)
+        v0: 速度 (..., d) (m/s)
+        mu: 引力参数 GM (m³/s²)
+
+    Returns:
+        字典，包含:
+            energy: 比机械能 v²/2 - mu/r (J/kg)
+            a: 半长轴 (m)，抛物轨道为 inf，双曲轨道为负
+            e: 偏心率，e < 1 椭圆，e = 1 抛物，e > 1 双曲
+            period: 周期 (s)，非椭圆轨道为 inf
+            v_escape: 该位置的逃逸速度 sqrt(2mu/r) (m/s)
+    """
+    r0 = np.asarray(r0, dtype=float)
+    v0 = np.asarray(v0, dtype=float)
+    mu = np.asarray(mu, dtype=float)
+    r = np.linalg.norm(r0, axis=-1)
+    v2 = np.sum(v0**2, axis=-1)
+    rv = np.sum(r0 * v0, axis=-1)
+
+    energy = v2 / 2 - mu / r
+    e_vec = ((v2 - mu / r)[..., None] * r0 - rv[..., None] * v0) / mu[..., None]
+    e = np.linalg.norm(e_vec, axis=-1)
+    with np.errstate(divide="ignore"):
+        a = -mu / (2 * energy)
+        period = np.where(energy < 0, 2 * np.pi * np.sqrt(np.abs(a)**3 / mu), np.inf)
+
+    return {
+        "energy": energy,
+        "a": a,
+        "e": e,
+        "period": period,
+        "v_escape": np.sqrt(2 * mu / r),
+    }
+
+
+def kepler_propagate(
+    r0: np.ndarray,
+    v0: np.ndarray,
+    t: ArrayLike,
+    mu: ArrayLike,
+    tol: float = 1e-12,
+    max_iter: int = 100
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    二体轨道的解析传播 (普适变量法，无需时间步进)
+
+    用普适变量 χ 表示的开普勒方程统一处理椭圆、抛物线、双曲线轨道，
+    对所有轨道和时刻同时做向量化迭代，再由拉格朗日 f、g 系数得到状态。
+    椭圆轨道先将 t 对周期取模，任意时刻的求值代价相同。
+
+    开普勒方程 F(χ) = 0 中 F 随 χ 单调递增 (dF/dχ = r > 0)，先为每个样本确定
+    包含根的区间，再做带保护的牛顿迭代: 牛顿步越出区间时改用二分，
+    因此近抛物线轨道、刚越过抛物线阈值的双曲轨道也必定收敛。
+
+    Args:
+        r0: t=0 时的位置 (..., d)，d = 2 或 3 (m)
+        v0: t=0 时的速度 (..., d) (m/s)
+        t: 求值时刻 (s)，与 r0[..., 0] 按 NumPy 规则广播
+        mu: 引力参数 GM (m³/s²)
+        tol: 迭代的相对收敛容限
+        max_iter: 最大迭代次数，仍未收敛时发出 RuntimeWarning
+
+    Returns:
+        (r, v): 各时刻的位置与速度，形状为广播后的 batch_shape + (d,)
+    """
+    r0 = np.asarray(r0, dtype=float)
+    v0 = np.asarray(v0, dtype=float)
+    batch = np.broadcast_shapes(r0.shape[:-1], np.shape(t), np.shape(mu))
+    d = r0.shape[-1]
+    r0 = np.broadcast_to(r0, batch + (d,))
+    v0 = np.broadcast_to(v0, batch + (d,))
+    t = np.broadcast_to(np.asarray(t, dtype=float), batch).copy()
+    mu = np.broadcast_to(np.asarray(mu, dtype=float), batch)
+    sqrt_mu = np.sqrt(mu)
+
+    r0n = np.linalg.norm(r0, axis=-1)
+    v02 = np.sum(v0**2, axis=-1)
+    rv = np.sum(r0 * v0, axis=-1)
+    alpha = 2 / r0n - v02 / mu  # 1/a
+
+    ellip = alpha > 1e-12 / r0n
+    hyper = alpha < -1e-12 / r0n
+    parab = ~ellip & ~hyper
+
+    # 椭圆轨道对周期取模，归到 [-T/2, T/2] (近抛物线的椭圆周期极长，
+    # 取模到 [0, T) 会使负时刻变成接近 T 的大数而丢失精度)
+    period = np.where(ellip, 2 * np.pi / (sqrt_mu * np.where(ellip, alpha, 1.0)**1.5), 1.0)
+    t = np.where(ellip, t - period * np.round(t / period), t)
+
+    c1 = rv / sqrt_mu
+    c2 = 1 - alpha * r0n
+
+    def kepler(chi):
+        """F(χ) 与 dF/dχ；双曲轨道 χ 很大时 cosh 溢出，F 取 χ 同号的无穷大"""
+        z = alpha * chi**2
+        with np.errstate(over="ignore", invalid="ignore"):
+            C, S = _stumpff(z)
+            F = c1 * chi**2 * C + c2 * chi**3 * S + r0n * chi - sqrt_mu * t
+            dF = c1 * chi * (1 - z * S) + c2 * chi**2 * C + r0n
+        F = np.where(np.isnan(F), np.copysign(np.inf, chi), F)
+        return F, dF
+
+    # 含根区间 [lo, hi]: F(0) = -√μ t；椭圆轨道 |t| ≤ T/2 时偏近点角之差小于 2π，
+    # 即 |χ| < 2π/√α；其他轨道从 √μ|t|/r₀ 起逐次加倍，直到区间端点的 F 异号
+    width = np.where(ellip, 2 * np.pi / np.sqrt(np.where(ellip, alpha, 1.0)), sqrt_mu * np.abs(t) / r0n)
+    lo = np.where(t < 0, -width, 0.0)
+    hi = np.where(t < 0, 0.0, width)
+    for _ in range(200):
+        F_lo, _ = kepler(lo)
+        F_hi, _ = kepler(hi)
+        low_bad = F_lo > 0
+        high_bad = F_hi < 0
+        if not (low_bad.any() or high_bad.any()):
+            break
+        width = hi - lo
+        lo = np.where(low_bad, lo - width, lo)
+        hi = np.where(high_bad, hi + width, hi)
+
+    # 初值 (Vallado)；近抛物线轨道用抛物线 (Barker) 解作初值，初值落在区间外时取区间中点
+    chi = np.where(ellip, sqrt_mu * t * alpha, 0.0)
+    if hyper.any():
+        a = 1 / alpha[hyper]
+        th, s = t[hyper], np.sign(t[hyper])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            arg = (-2 * mu[hyper] * alpha[hyper] * th
+                   / (rv[hyper] + s * np.sqrt(-mu[hyper] * a) * (1 - r0n[hyper] * alpha[hyper])))
+            guess = s * np.sqrt(-a) * np.log(arg)
+        chi[hyper] = np.where(np.isfinite(guess), guess, sqrt_mu[hyper] * th / r0n[hyper])
+    e = orbit_properties(r0, v0, mu)["e"]
+    near_parab = parab | (np.abs(e - 1) < 0.05)
+    if near_parab.any():
+        h2 = r0n[near_parab]**2 * v02[near_parab] - rv[near_parab]**2
+        p = h2 / mu[near_parab]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s = 0.5 * np.arctan2(1.0, 3 * np.sqrt(mu[near_parab] / p**3) * t[near_parab])
+            w = np.arctan(np.cbrt(np.tan(s)))
+            chi[near_parab] = np.sqrt(p) * 2 / np.tan(2 * w)
+    inside = np.isfinite(chi) & (chi >= lo) & (chi <= hi)
+    chi = np.where(inside, chi, 0.5 * (lo + hi))
+
+    # 带保护的牛顿迭代 (对全部轨道、全部时刻同时进行)
+    for _ in range(max_iter):
+        F, dF = kepler(chi)
+        lo = np.where(F < 0, chi, lo)
+        hi = np.where(F > 0, chi, hi)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = chi - F / dF
+        ok = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        new = np.where(ok, newton, 0.5 * (lo + hi))
+        scale = tol * np.maximum(np.abs(new), 1.0)
+        done = (np.abs(new - chi) <= scale) | (hi - lo <= scale) | (F == 0)
+        chi = np.where(F == 0, chi, new)
+        if np.all(done):
+            break
+    else:
+        warnings.warn(f"kepler_propagate: {np.count_nonzero(~done)} 个样本在 {max_iter} 次迭代后未收敛",
+                      RuntimeWarning, stacklevel=2)
+
+    # 拉格朗日系数
+    z = alpha * chi**2
+    C, S = _stumpff(z)
+    f = 1 - chi**2 / r0n * C
+    g = t - chi**3 / sqrt_mu * S
+    r = f[..., None] * r0 + g[..., None] * v0
+    rn = np.linalg.norm(r, axis=-1)
+    f_dot = sqrt_mu / (rn * r0n) * (z * chi * S - chi)
+    g_dot = 1 - chi**2 / rn * C
+    v = f_dot[..., None] * r0 + g_dot[..., None] * v0
+
+    return r, v
+
+
 # ============================================
 # 碰撞与动量
 # ============================================
 
 def elastic_collision_1d(
-    m1: float, v1: float,
-    m2: float, v2: float
-) -> Tuple[float, float]:
+    m1: ArrayLike, v1: ArrayLike,
+    m2: ArrayLike, v2: ArrayLike
+) -> Tuple[ArrayLike, ArrayLike]:
     """
     一维完全弹性碰撞
     
@@ -142,10 +794,10 @@ def elastic_collision_1d(
 
 
 def inelastic_collision_1d(
-    m1: float, v1: float,
-    m2: float, v2: float,
-    e: float = 0  # 恢复系数，0为完全非弹性
-) -> Tuple[float, float]:
+    m1: ArrayLike, v1: ArrayLike,
+    m2: ArrayLike, v2: ArrayLike,
+    e: ArrayLike = 0  # 恢复系数，0为完全非弹性
+) -> Tuple[ArrayLike, ArrayLike]:
     """
     一维非弹性碰撞
     
@@ -166,14 +818,28 @@ def inelastic_collision_1d(
     return v1_new, v2_new
 
 
-def momentum(m: float, v: float) -> float:
-    """计算动量 p = mv"""
-    return m * v
+def momentum(m: ArrayLike, v: ArrayLike) -> ArrayLike:
+    """计算动量 p = mv (m、v 按 NumPy 规则广播)"""
+    return np.asarray(m, dtype=float) * np.asarray(v, dtype=float)
+
+
+def momentum_vector(m: ArrayLike, v: np.ndarray) -> np.ndarray:
+    """
+    计算动量向量 p = m v
+
+    Args:
+        m: 质量 (...,)，标量或与 v 的前若干维相同
+        v: 速度向量 (..., d)，最后一维为分量
+
+    Returns:
+        动量 (..., d)
+    """
+    return np.asarray(m, dtype=float)[..., None] * np.asarray(v, dtype=float)
 
 
-def kinetic_energy(m: float, v: float) -> float:
-    """计算动能 E = 0.5*m*v²"""
-    return 0.5 * m * v**2
+def kinetic_energy(m: ArrayLike, v: ArrayLike) -> ArrayLike:
+    """计算动能 E = 0.5*m*v² (v 为速率，可为数组)"""
+    return 0.5 * np.asarray(m, dtype=float) * np.asarray(v, dtype=float)**2
 
 
 # ============================================
@@ -181,9 +847,9 @@ def kinetic_energy(m: float, v: float) -> float:
 # ============================================
 
 def resolve_force(
-    F: float, 
-    theta: float
-) -> Tuple[float, float]:
+    F: ArrayLike, 
+    theta: ArrayLike
+) -> Tuple[ArrayLike, ArrayLike]:
     """
     力的分解 (正交分解)
     
@@ -200,18 +866,26 @@ def resolve_force(
     return Fx, Fy
 
 
-def compose_forces(forces: List[Tuple[float, float]]) -> Tuple[float, float]:
+def compose_forces(
+    forces: Union[List[Tuple[float, float]], np.ndarray]
+) -> Tuple[ArrayLike, ArrayLike]:
     """
     力的合成
     
     Args:
-        forces: 力的列表，每个元素为 (F, theta)
+        forces: 力的列表，每个元素为 (F, theta)；
+                也可为形状 (..., n, 2) 的数组，对倒数第二维的 n 个力求合力，
+                前面的维度为批量 (如滑块扫过的一组参数)
     
     Returns:
-        (F_total, theta_total): 合力大小和方向
+        (F_total, theta_total): 合力大小和方向 (度)，批量输入时为 (...,) 数组
     """
-    Fx_total = sum(F * np.cos(np.radians(theta)) for F, theta in forces)
-    Fy_total = sum(F * np.sin(np.radians(theta)) for F, theta in forces)
+    forces = np.asarray(forces, dtype=float)
+    if forces.ndim == 1 and forces.size == 0:
+        forces = forces.reshape(0, 2)  # 空列表: 合力为 0
+    F, theta_rad = forces[..., 0], np.radians(forces[..., 1])
+    Fx_total = np.sum(F * np.cos(theta_rad), axis=-1)
+    Fy_total = np.sum(F * np.sin(theta_rad), axis=-1)
     
     F_total = np.sqrt(Fx_total**2 + Fy_total**2)
     theta_total = np.degrees(np.arctan2(Fy_total, Fx_total))
@@ -220,10 +894,10 @@ def compose_forces(forces: List[Tuple[float, float]]) -> Tuple[float, float]:
 
 
 def friction_force(
-    mu: float,
-    N: float,
+    mu: ArrayLike,
+    N: ArrayLike,
     kinetic: bool = True
-) -> float:
+) -> ArrayLike:
     """
     计算摩擦力
     
@@ -235,7 +909,7 @@ def friction_force(
     Returns:
         摩擦力大小 (N)
     """
-    return mu * N
+    return np.asarray(mu, dtype=float) * np.abs(N)
 
 
 # ============================================
@@ -243,11 +917,11 @@ def friction_force(
 # ============================================
 
 def coulomb_force(
-    q1: float,
-    q2: float,
-    r: float,
+    q1: ArrayLike,
+    q2: ArrayLike,
+    r: ArrayLike,
     k: float = 8.99e9
-) -> float:
+) -> ArrayLike:
     """
     库仑定律计算电场力
     
@@ -259,14 +933,14 @@ def coulomb_force(
     Returns:
         电场力大小 (N)
     """
-    return k * abs(q1 * q2) / r**2
+    return k * np.abs(np.multiply(q1, q2)) / np.asarray(r, dtype=float)**2
 
 
 def electric_field(
-    q: float,
-    r: float,
+    q: ArrayLike,
+    r: ArrayLike,
     k: float = 8.99e9
-) -> float:
+) -> ArrayLike:
     """
     点电荷电场强度
     
@@ -278,15 +952,15 @@ def electric_field(
     Returns:
         电场强度 (N/C 或 V/m)
     """
-    return k * abs(q) / r**2
+    return k * np.abs(q) / np.asarray(r, dtype=float)**2
 
 
 def lorentz_force(
-    q: float,
-    v: float,
-    B: float,
-    theta: float = 90
-) -> float:
+    q: ArrayLike,
+    v: ArrayLike,
+    B: ArrayLike,
+    theta: ArrayLike = 90
+) -> ArrayLike:
     """
     洛伦兹力
     
@@ -299,5 +973,29 @@ def lorentz_force(
     Returns:
         洛伦兹力大小 (N)
     """
-    return abs(q) * v * B * np.sin(np.radians(theta))
+    return np.abs(q) * np.abs(v) * np.abs(B) * np.abs(np.sin(np.radians(theta)))
+
+
+def lorentz_force_vector(
+    q: ArrayLike,
+    v: np.ndarray,
+    B: np.ndarray,
+    E: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    洛伦兹力 (向量形式) F = q (E + v × B)
+    
+    Args:
+        q: 电荷量 (C)，标量或 (...,)
+        v: 速度向量 (..., 3) (m/s)
+        B: 磁感应强度向量 (..., 3) (T)，v 与 B 可成任意夹角
+        E: 电场强度向量 (..., 3) (V/m)，默认无电场
+    
+    Returns:
+        力向量 (..., 3) (N)，各参数按 NumPy 规则广播
+    """
+    F = np.cross(np.asarray(v, dtype=float), np.asarray(B, dtype=float))
+    if E is not None:
+        F = F + np.asarray(E, dtype=float)
+    return np.asarray(q, dtype=float)[..., None] * F
 
@@ -0,0 +1,219 @@
+"""
+ QuantPhysics - 泊松/拉普拉斯方程求解 (几何多重网格)
+在二维网格上求解 ∇²V = -ρ/ε₀，导体 (电极、屏蔽罩) 作为网格内部的
+Dirichlet 固定电势点，用于电容器、静电屏蔽、带电导体等演示。
+
+网格为正方形格点，间距 h；最外圈格点总是固定电势。
+粗化要求每边为奇数个点，其他尺寸 (如 512) 在内部补到 m·2^L + 1 (m ≤ 8，如 513) 再求解，
+补出的格点在固定的最外圈之外，不影响结果；边长直接取 2^k + 1 (如 129、257、513) 时无需补齐。
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+# 最粗网格上的高斯-赛德尔迭代次数
+_COARSE_SWEEPS = 50
+# 最粗网格每边的最大间隔数 (补齐尺寸时使用)
+_COARSE_INTERVALS = 8
+
+
+# ============================================
+# 网格算子
+# ============================================
+
+def _laplacian_residual(u: np.ndarray, f: np.ndarray, free: np.ndarray, h: float) -> np.ndarray:
+    """残差 r = f - ∇²u，固定点处为 0"""
+    r = np.zeros_like(u)
+    lap = (u[:-2, 1:-1] + u[2:, 1:-1] + u[1:-1, :-2] + u[1:-1, 2:] - 4 * u[1:-1, 1:-1]) / h**2
+    r[1:-1, 1:-1] = f[1:-1, 1:-1] - lap
+    r[~free] = 0.0
+    return r
+
+
+def _smooth(u: np.ndarray, f: np.ndarray, red: np.ndarray, black: np.ndarray,
+            h: float, sweeps: int, reverse: bool = False) -> None:
+    """
+    红黑高斯-赛德尔迭代 (原地修改 u)，red/black 为内部自由点的着色掩码
+
+    reverse=True 时先黑后红，前后光滑顺序相反使 V 循环成为对称算子，
+    可以作为共轭梯度法的预条件子。
+    """
+    inner = u[1:-1, 1:-1]
+    rhs = h**2 * f[1:-1, 1:-1]
+    colors = (black, red) if reverse else (red, black)
+    for _ in range(sweeps):
+        for color in colors:
+            new = 0.25 * (u[:-2, 1:-1] + u[2:, 1:-1] + u[1:-1, :-2] + u[1:-1, 2:] - rhs)
+            np.copyto(inner, new, where=color)
+
+
+def _restrict(r: np.ndarray) -> np.ndarray:
+    """全加权限制到粗网格 (边界置 0)"""
+    ny, nx = r.shape
+    c = np.zeros(((ny + 1) // 2, (nx + 1) // 2))
+    c[1:-1, 1:-1] = (
+        4 * r[2:-2:2, 2:-2:2]
+        + 2 * (r[1:-3:2, 2:-2:2] + r[3:-1:2, 2:-2:2] + r[2:-2:2, 1:-3:2] + r[2:-2:2, 3:-1:2])
+        + r[1:-3:2, 1:-3:2] + r[1:-3:2, 3:-1:2] + r[3:-1:2, 1:-3:2] + r[3:-1:2, 3:-1:2]
+    ) / 16
+    return c
+
+
+def _prolong(c: np.ndarray, shape) -> np.ndarray:
+    """双线性插值到细网格"""
+    u = np.zeros(shape)
+    u[::2, ::2] = c
+    u[1::2, ::2] = 0.5 * (c[:-1] + c[1:])
+    u[::2, 1::2] = 0.5 * (c[:, :-1] + c[:, 1:])
+    u[1::2, 1::2] = 0.25 * (c[:-1, :-1] + c[1:, :-1] + c[:-1, 1:] + c[1:, 1:])
+    return u
+
+
+def _padded_shape(shape) -> tuple:
+    """
+    能粗化到最粗网格的尺寸: 每边补到 m·2^L + 1，L 由较短边决定 (最粗网格每边不超过 8 个间隔)
+    """
+    n_min = min(shape)
+    L = max(0, int(np.ceil(np.log2(max(n_min - 1, 1) / _COARSE_INTERVALS))))
+    step = 2**L
+    return tuple(-(-(n - 1) // step) * step + 1 for n in shape)
+
+
+def _build_levels(free: np.ndarray, h: float):
+    """构建多重网格层级: 每层的自由点掩码、红黑着色与网格间距"""
+    levels = []
+    while True:
+        ny, nx = free.shape
+        free = free.copy()
+        free[[0, -1], :] = False
+        free[:, [0, -1]] = False
+        parity = np.add.outer(np.arange(ny - 2), np.arange(nx - 2)) % 2 == 0
+        inner = free[1:-1, 1:-1]
+        levels.append({"free": free, "red": inner & parity, "black": inner & ~parity, "h": h})
+        if ny % 2 == 0 or nx % 2 == 0 or min(ny, nx) < 5:
+            return levels
+        # 粗网格点周围 3×3 细网格点中有固定点时，粗网格点也固定，
+        # 避免落在奇数行/列上的细电极在粗网格上消失
+        fixed = ~free
+        grown = fixed.copy()
+        grown[1:] |= fixed[:-1]
+        grown[:-1] |= fixed[1:]
+        grown[:, 1:] |= grown[:, :-1].copy()
+        grown[:, :-1] |= grown[:, 1:].copy()
+        free = ~grown[::2, ::2]
+        h = 2 * h
+
+
+def _v_cycle(levels, k: int, u: np.ndarray, f: np.ndarray, n_smooth: int) -> None:
+    """一次对称 V 循环 (原地修改 u)，近似求解 ∇²u = f"""
+    lv = levels[k]
+    if k == len(levels) - 1:
+        _smooth(u, f, lv["red"], lv["black"], lv["h"], _COARSE_SWEEPS)
+        _smooth(u, f, lv["red"], lv["black"], lv["h"], _COARSE_SWEEPS, reverse=True)
+        return
+    _smooth(u, f, lv["red"], lv["black"], lv["h"], n_smooth)
+    r = _laplacian_residual(u, f, lv["free"], lv["h"])
+    rc = _restrict(r)
+    ec = np.zeros_like(rc)
+    _v_cycle(levels, k + 1, ec, rc, n_smooth)
+    u += _prolong(ec, u.shape) * lv["free"]
+    _smooth(u, f, lv["red"], lv["black"], lv["h"], n_smooth, reverse=True)
+
+
+# ============================================
+# 求解器
+# ============================================
+
+def solve_poisson(
+    fixed_mask: np.ndarray,
+    fixed_values: np.ndarray,
+    rho: Optional[np.ndarray] = None,
+    h: float = 1.0,
+    eps0: float = 8.854e-12,
+    V0: Optional[np.ndarray] = None,
+    tol: float = 1e-6,
+    max_cycles: int = 50,
+    n_smooth: int = 2
+) -> Dict[str, np.ndarray]:
+    """
+    多重网格求解 ∇²V = -ρ/ε₀ (Dirichlet 边界)
+
+    以对称 V 循环作预条件子的共轭梯度法 (MGCG)。导体落在任意行列上
+    都能稳定收敛，迭代次数基本不随网格规模增长。
+
+    Args:
+        fixed_mask: 固定电势的格点 (ny, nx) 布尔数组 (导体)，最外圈总是固定
+        fixed_values: 各格点的电势 (ny, nx) 或标量，只在固定点处使用 (V)
+        rho: 电荷密度 (ny, nx) (C/m²)，None 表示拉普拉斯方程
+        h: 格点间距 (m)
+        eps0: 真空介电常数
+        V0: 初始猜测 (ny, nx)，传入上一次的解可以热启动
+            (如拖动滑块移动电极后重新求解)
+        tol: 收敛判据，残差 2-范数相对于零初值残差的比例
+        max_cycles: 最大 V 循环次数
+        n_smooth: 每层前后光滑次数
+
+    Returns:
+        字典，包含:
+            V: 电势 (ny, nx) (V)
+            Ex, Ey: 电场强度 E = -∇V (ny, nx) (V/m)，第 0 维为 y
+            cycles: 迭代次数 (每次迭代一个 V 循环)
+            residual: 最终相对残差
+    """
+    fixed_mask = np.asarray(fixed_mask, dtype=bool)
+    ny, nx = fixed_mask.shape
+    fixed_values = np.broadcast_to(np.asarray(fixed_values, dtype=float), (ny, nx))
+    f = np.zeros((ny, nx)) if rho is None else -np.asarray(rho, dtype=float) / eps0
+
+    # 补齐到可粗化的尺寸: 原网格最外圈固定，补出的格点也固定 (电势 0)，与原问题等价
+    shape = _padded_shape((ny, nx))
+    if shape != (ny, nx):
+        pad = ((0, shape[0] - ny), (0, shape[1] - nx))
+        fixed_mask = np.pad(fixed_mask, pad, constant_values=True)
+        fixed_mask[[0, ny - 1], :nx] = True
+        fixed_mask[:ny, [0, nx - 1]] = True
+        fixed_values = np.pad(fixed_values, pad)
+        f = np.pad(f, pad)
+        if V0 is not None:
+            V0 = np.pad(np.asarray(V0, dtype=float), pad)
+
+    levels = _build_levels(~fixed_mask, h)
+    free = levels[0]["free"]
+
+    # 零初值 (仅固定点有值) 的残差作为收敛判据的参考
+    V = np.where(free, 0.0, fixed_values)
+    r_ref = np.linalg.norm(_laplacian_residual(V, f, free, h)) or 1.0
+
+    if V0 is not None:
+        V = np.where(free, np.asarray(V0, dtype=float), fixed_values)
+
+    # 以 V 循环为预条件子的共轭梯度法，对形状不规则的导体也稳定收敛。
+    # 对正定算子 A = -∇² 求解 A V = -f，残差 g = -f - A V
+    g = -_laplacian_residual(V, f, free, h)
+    residual = np.linalg.norm(g) / r_ref
+    cycles = 0
+    p = gz = None
+    while residual > tol and cycles < max_cycles:
+        # 预条件: z ≈ A⁻¹ g，即 ∇²z = -g
+        z = np.zeros(shape)
+        _v_cycle(levels, 0, z, -g, n_smooth)
+        gz_new = np.sum(g * z)
+        p = z if p is None else z + (gz_new / gz) * p
+        gz = gz_new
+        # Ap = -∇²p (p 在固定点处为 0)
+        Ap = _laplacian_residual(p, np.zeros(shape), free, h)
+        alpha = gz / np.sum(p * Ap)
+        V += alpha * p
+        g -= alpha * Ap
+        residual = np.linalg.norm(g) / r_ref
+        cycles += 1
+
+    V = V[:ny, :nx]
+    dV_dy, dV_dx = np.gradient(V, h)
+    return {
+        "V": V,
+        "Ex": -dV_dx,
+        "Ey": -dV_dy,
+        "cycles": cycles,
+        "residual": residual,
+    }
@@ -0,0 +1,485 @@
+"""
+ QuantPhysics - 几何光学光线追迹
+二维 (xy 平面，x 为光轴) 光线追迹: 大量光线同时在平面、球面、薄透镜、反射镜、
+棱镜之间传播，折射 (斯涅耳定律)、全反射和色散 (各光线按自己的波长取折射率)
+都以数组运算完成。
+
+追迹是非顺序的: 每一步对所有存活光线求与所有光学面的交点，取最近的一个，
+因此棱镜内的全反射、反射镜往返光路都能自然处理。
+结果打包成以 NaN 分隔的折线，直接作为一条 Plotly 曲线绘制。
+
+每个光学面有一个单位法向，法向所指一侧为"前方" (n_front)，另一侧为"后方" (n_back)。
+光轴上的透镜面、竖直的平面，前方都是左侧 (-x)，即光线从左向右入射。
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+# 柯西色散公式 n(λ) = A + B / λ² 的系数 (λ 以 nm 为单位)
+MATERIALS = {
+    "air": (1.000293, 0.0),
+    "water": (1.3240, 3046.0),
+    "crown": (1.5046, 4200.0),       # 冕牌玻璃 (近似 BK7)
+    "flint": (1.6700, 7430.0),       # 火石玻璃
+    "diamond": (2.3820, 12100.0),
+}
+
+Material = Union[float, str, Tuple[float, float]]
+
+# 求交时忽略过近的交点，避免光线与刚离开的面再次相交
+_EPS = 1e-9
+
+
+def refractive_index(material: Material, wavelength: np.ndarray) -> np.ndarray:
+    """
+    材料在给定波长下的折射率
+
+    Args:
+        material: 常数折射率、MATERIALS 中的名称或柯西系数 (A, B)
+        wavelength: 真空中的波长 (nm)
+
+    Returns:
+        折射率，形状同 wavelength
+    """
+    wavelength = np.asarray(wavelength, dtype=float)
+    if isinstance(material, str):
+        material = MATERIALS[material]
+    if np.ndim(material) == 0:
+        return np.full(wavelength.shape, float(material))
+    A, B = material
+    return A + B / wavelength**2
+
+
+# ============================================
+# 光学面
+# ============================================
+
+class OpticalSurface(ABC):
+    """
+    光学面基类 (子类需实现 intersect / normal / center)
+
+    Args:
+        kind: "refract" 折射面，"reflect" 反射镜，"thin_lens" 理想薄透镜，"absorb" 光屏/光阑
+        n_front, n_back: 法向所指一侧与另一侧的材料 (kind="refract" 时使用)
+        focal_length: 薄透镜焦距 (kind="thin_lens" 时使用)，凸透镜为正
+    """
+
+    def __init__(
+        self,
+        kind: str = "refract",
+        n_front: Material = 1.0,
+        n_back: Material = 1.0,
+        focal_length: Optional[float] = None
+    ):
+        if kind not in ("refract", "reflect", "thin_lens", "absorb"):
+            raise ValueError(f"未知的光学面类型: {kind}")
+        self.kind = kind
+        self.n_front = n_front
+        self.n_back = n_back
+        self.focal_length = focal_length
+
+    @abstractmethod
+    def intersect(self, p: np.ndarray, d: np.ndarray) -> np.ndarray:
+        """光线 p + t d 与面的交点参数 t (N,)，不相交为 inf"""
+
+    @abstractmethod
+    def normal(self, x: np.ndarray) -> np.ndarray:
+        """面上各点的单位法向 (N, 2)"""
+
+    @abstractmethod
+    def center(self) -> np.ndarray:
+        """面的中心 (薄透镜的光心)"""
+
+    def interact(self, x: np.ndarray, d: np.ndarray, wavelength: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        光线在面上的出射方向
+
+        Returns:
+            (d_new, stopped): 新方向 (N, 2) 与被吸收的光线掩码 (N,)
+        """
+        stopped = np.zeros(len(x), dtype=bool)
+        if self.kind == "absorb":
+            return d, ~stopped
+        n = self.normal(x)
+        cos_n = np.einsum("ij,ij->i", d, n)
+        if self.kind == "reflect":
+            return d - 2 * cos_n[:, None] * n, stopped
+        if self.kind == "thin_lens":
+            # 理想薄透镜: 相对透镜面的斜率 u' = u - s / f，s 为到光心的距离
+            tangent = np.stack([n[:, 1], -n[:, 0]], axis=1)
+            s = np.einsum("ij,ij->i", x - self.center(), tangent)
+            dt = np.einsum("ij,ij->i", d, tangent)
+            u = dt / np.abs(cos_n) - s / self.focal_length
+            d_new = np.sign(cos_n)[:, None] * n + u[:, None] * tangent
+            return d_new / np.linalg.norm(d_new, axis=1, keepdims=True), stopped
+
+        # 折射: m 为迎着入射光的法向
+        from_front = cos_n < 0
+        n1 = np.where(from_front, refractive_index(self.n_front, wavelength),
+                      refractive_index(self.n_back, wavelength))
+        n2 = np.where(from_front, refractive_index(self.n_back, wavelength),
+                      refractive_index(self.n_front, wavelength))
+        m = np.where(from_front[:, None], n, -n)
+        cos_i = np.abs(cos_n)
+        eta = n1 / n2
+        k = 1 - eta**2 * (1 - cos_i**2)
+        tir = k < 0
+        refracted = eta[:, None] * d + (eta * cos_i - np.sqrt(np.maximum(k, 0)))[:, None] * m
+        reflected = d + 2 * cos_i[:, None] * m
+        return np.where(tir[:, None], reflected, refracted), stopped
+
+
+class PlaneSurface(OpticalSurface):
+    """
+    平面 (线段 p0 → p1)，法向为线段方向逆时针转 90°
+
+    竖直线段自下而上 (p0 在下) 时法向指向 -x，前方为左侧。
+    """
+
+    def __init__(self, p0: Sequence[float], p1: Sequence[float], **kwargs):
+        super().__init__(**kwargs)
+        self.p0 = np.asarray(p0, dtype=float)
+        self.p1 = np.asarray(p1, dtype=float)
+        e = self.p1 - self.p0
+        self._n = np.array([-e[1], e[0]]) / np.linalg.norm(e)
+
+    def intersect(self, p: np.ndarray, d: np.ndarray) -> np.ndarray:
+        e = self.p1 - self.p0
+        w = self.p0 - p
+        # p + t d = p0 + s e，用二维叉积求 t、s
+        denom = d[:, 0] * e[1] - d[:, 1] * e[0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (w[:, 0] * e[1] - w[:, 1] * e[0]) / denom
+            s = (w[:, 0] * d[:, 1] - w[:, 1] * d[:, 0]) / denom
+        ok = (t > _EPS) & (s >= 0) & (s <= 1)
+        return np.where(ok, t, np.inf)
+
+    def normal(self, x: np.ndarray) -> np.ndarray:
+        return np.broadcast_to(self._n, x.shape)
+
+    def center(self) -> np.ndarray:
+        return 0.5 * (self.p0 + self.p1)
+
+
+class SphericalSurface(OpticalSurface):
+    """
+    光轴上的球面 (圆弧)
+
+    Args:
+        x_vertex: 顶点在光轴上的位置
+        R: 曲率半径，球心在顶点右侧为正
+        height: 通光半高度 (|y| ≤ height)
+        y_axis: 光轴的 y 坐标
+    """
+
+    def __init__(self, x_vertex: float, R: float, height: float, y_axis: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        if abs(R) < height:
+            raise ValueError("球面的曲率半径不能小于通光半高度")
+        self.x_vertex = x_vertex
+        self.R = R
+        self.height = height
+        self._c = np.array([x_vertex + R, y_axis])
+
+    def intersect(self, p: np.ndarray, d: np.ndarray) -> np.ndarray:
+        pc = p - self._c
+        b = np.einsum("ij,ij->i", d, pc)
+        disc = b**2 - (np.einsum("ij,ij->i", pc, pc) - self.R**2)
+        root = np.sqrt(np.maximum(disc, 0))
+        best = np.full(len(p), np.inf)
+        for t in (-b + root, -b - root):
+            x = p + t[:, None] * d
+            # 只取顶点一侧、通光孔径内的圆弧
+            on_arc = ((disc >= 0) & (t > _EPS)
+                      & (np.abs(x[:, 1] - self._c[1]) <= self.height)
+                      & ((x[:, 0] - self._c[0]) * -self.R > 0))
+            best = np.where(on_arc & (t < best), t, best)
+        return best
+
+    def normal(self, x: np.ndarray) -> np.ndarray:
+        # 顶点处法向指向 -x
+        return (x - self._c) / self.R
+
+    def center(self) -> np.ndarray:
+        return np.array([self.x_vertex, self._c[1]])
+
+
+# ============================================
+# 常用光学元件
+# ============================================
+
+def thin_lens(x: float, f: float, height: float, y_axis: float = 0.0) -> List[OpticalSurface]:
+    """理想薄透镜 (焦距 f，凸透镜为正)"""
+    return [PlaneSurface((x, y_axis - height), (x, y_axis + height), kind="thin_lens", focal_length=f)]
+
+
+def _axial_surface(x: float, R: float, height: float, y_axis: float, **kwargs) -> OpticalSurface:
+    if np.isinf(R):
+        return PlaneSurface((x, y_axis - height), (x, y_axis + height), **kwargs)
+    return SphericalSurface(x, R, height, y_axis, **kwargs)
+
+
+def thick_lens(
+    x: float,
+    thickness: float,
+    R1: float,
+    R2: float,
+    height: float,
+    material: Material = "crown",
+    medium: Material = "air",
+    y_axis: float = 0.0
+) -> List[OpticalSurface]:
+    """
+    厚透镜 (两个球面，np.inf 表示平面)
+
+    Args:
+        x: 第一面顶点位置
+        thickness: 中心厚度
+        R1, R2: 两面的曲率半径 (球心在顶点右侧为正)，如双凸透镜 R1 > 0, R2 < 0
+        height: 通光半高度
+        material: 透镜材料
+        medium: 周围介质
+    """
+    return [
+        _axial_surface(x, R1, height, y_axis, n_front=medium, n_back=material),
+        _axial_surface(x + thickness, R2, height, y_axis, n_front=material, n_back=medium),
+    ]
+
+
+def mirror(p0: Sequence[float], p1: Sequence[float]) -> List[OpticalSurface]:
+    """平面镜 (线段 p0 → p1)"""
+    return [PlaneSurface(p0, p1, kind="reflect")]
+
+
+def spherical_mirror(x_vertex: float, R: float, height: float, y_axis: float = 0.0) -> List[OpticalSurface]:
+    """球面镜: 面向左侧入射光时 R < 0 为凹面镜 (焦距 |R|/2)，R > 0 为凸面镜"""
+    return [SphericalSurface(x_vertex, R, height, y_axis, kind="reflect")]
+
+
+def prism(
+    vertices: Sequence[Sequence[float]],
+    material: Material = "crown",
+    medium: Material = "air"
+) -> List[OpticalSurface]:
+    """
+    棱镜 (任意多边形截面)
+
+    Args:
+        vertices: 截面顶点 (逆时针顺序)
+        material: 棱镜材料
+        medium: 周围介质
+    """
+    v = np.asarray(vertices, dtype=float)
+    # 逆时针多边形的边逆时针转 90° 指向内部，前方为棱镜内
+    return [PlaneSurface(v[i], v[(i + 1) % len(v)], n_front=material, n_back=medium) for i in range(len(v))]
+
+
+def equilateral_prism(
+    center: Sequence[float] = (0.0, 0.0),
+    side: float = 1.0,
+    apex_angle: float = 60.0,
+    material: Material = "crown",
+    medium: Material = "air"
+) -> List[OpticalSurface]:
+    """顶角朝上的等腰三角棱镜 (默认等边)，center 为底边中点，side 为腰长"""
+    half = np.radians(apex_angle) / 2
+    cx, cy = center
+    w = side * np.sin(half)
+    h = side * np.cos(half)
+    return prism([(cx - w, cy), (cx + w, cy), (cx, cy + h)], material, medium)
+
+
+def screen(x: float, height: float, y_axis: float = 0.0) -> List[OpticalSurface]:
+    """光屏 (吸收所有照到的光线)"""
+    return [PlaneSurface((x, y_axis - height), (x, y_axis + height), kind="absorb")]
+
+
+# ============================================
+# 光源
+# ============================================
+
+def _with_wavelengths(origins, directions, wavelengths):
+    """每条光线按每个波长复制一份"""
+    wavelengths = np.atleast_1d(np.asarray(wavelengths, dtype=float))
+    n_w = len(wavelengths)
+    return (np.repeat(origins, n_w, axis=0), np.repeat(directions, n_w, axis=0),
+            np.tile(wavelengths, len(origins)))
+
+
+def parallel_rays(
+    n: int,
+    y_range: Tuple[float, float],
+    x0: float = 0.0,
+    angle: float = 0.0,
+    wavelengths: Union[float, Sequence[float]] = 550.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    平行光束
+
+    Args:
+        n: 光线数
+        y_range: 起点的 y 范围
+        x0: 起点的 x 坐标
+        angle: 与光轴的夹角 (度)
+        wavelengths: 波长 (nm)，多个波长时每条光线按每个波长复制
+
+    Returns:
+        (origins, directions, wavelengths): 可直接传给 trace_rays
+    """
+    y = np.linspace(y_range[0], y_range[1], n)
+    origins = np.column_stack([np.full(n, x0), y])
+    a = np.radians(angle)
+    directions = np.broadcast_to([np.cos(a), np.sin(a)], (n, 2))
+    return _with_wavelengths(origins, directions, wavelengths)
+
+
+def point_source_rays(
+    point: Sequence[float],
+    angles: Union[Sequence[float], np.ndarray],
+    wavelengths: Union[float, Sequence[float]] = 550.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    点光源发出的光线
+
+    Args:
+        point: 光源位置
+        angles: 各光线与 +x 轴的夹角 (度)
+        wavelengths: 波长 (nm)
+
+    Returns:
+        (origins, directions, wavelengths)
+    """
+    a = np.radians(np.asarray(angles, dtype=float))
+    directions = np.column_stack([np.cos(a), np.sin(a)])
+    origins = np.broadcast_to(np.asarray(point, dtype=float), directions.shape)
+    return _with_wavelengths(origins, directions, wavelengths)
+
+
+# ============================================
+# 追迹
+# ============================================
+
+def trace_rays(
+    surfaces: Sequence[OpticalSurface],
+    origins: np.ndarray,
+    directions: np.ndarray,
+    wavelengths: Union[float, np.ndarray] = 550.0,
+    max_interactions: int = 20,
+    max_length: float = 10.0,
+    y_axis: float = 0.0
+) -> Dict[str, np.ndarray]:
+    """
+    批量追迹光线
+
+    Args:
+        surfaces: 光学面列表 (各元件函数返回的列表可直接相加)
+        origins: 起点 (N, 2)
+        directions: 方向 (N, 2)，不必是单位向量
+        wavelengths: 波长 (nm)，标量或 (N,)
+        max_interactions: 每条光线最多与面作用的次数
+        max_length: 不再与任何面相交的光线延长的长度
+        y_axis: 光轴的 y 坐标 (与各元件的 y_axis 相同)，用于计算 axis_crossing
+
+    Returns:
+        字典，包含:
+            x, y: 所有光路拼接成的坐标数组，各条之间以 NaN 分隔
+            paths: 各光线经过的点 (N, max_interactions + 2, 2)，未用到的为 NaN
+            position, direction: 光线最后的位置与方向 (N, 2)
+            wavelength: 各光线波长 (N,)
+            absorbed: 是否停在光屏/光阑上 (N,)
+            axis_crossing: 最后一段光线 (的延长线) 与光轴 y = y_axis 的交点 x 坐标 (N,)，
+                           用于确定像点、焦点和球差
+
+    Usage:
+        system = thick_lens(0, 0.3, 2.0, -2.0, 0.8) + screen(4, 2)
+        rays = parallel_rays(41, (-0.7, 0.7), x0=-1, wavelengths=[450, 650])
+        res = trace_rays(system, *rays)
+        fig.add_trace(go.Scatter(x=res["x"], y=res["y"], mode="lines"))
+    """
+    pos = np.array(origins, dtype=float)
+    d = np.array(directions, dtype=float)
+    d /= np.linalg.norm(d, axis=1, keepdims=True)
+    n = len(pos)
+    wavelengths = np.broadcast_to(np.asarray(wavelengths, dtype=float), (n,))
+
+    paths = np.full((n, max_interactions + 2, 2), np.nan)
+    paths[:, 0] = pos
+    count = np.ones(n, dtype=int)
+    alive = np.ones(n, dtype=bool)
+    absorbed = np.zeros(n, dtype=bool)
+
+    for step in range(max_interactions + 1):
+        idx = np.nonzero(alive)[0]
+        if idx.size == 0:
+            break
+        p, dd = pos[idx], d[idx]
+        if surfaces:
+            T = np.stack([s.intersect(p, dd) for s in surfaces], axis=1)
+            k = np.argmin(T, axis=1)
+            t = T[np.arange(len(idx)), k]
+        else:
+            k = np.zeros(len(idx), dtype=int)
+            t = np.full(len(idx), np.inf)
+        miss = ~np.isfinite(t)
+        # 达到最多作用次数后不再处理新交点，直接延长
+        if step == max_interactions:
+            miss[:] = True
+
+        new_pos = p + np.where(miss, max_length, t)[:, None] * dd
+        pos[idx] = new_pos
+        paths[idx, count[idx]] = new_pos
+        count[idx] += 1
+        alive[idx[miss]] = False
+
+        for j, surface in enumerate(surfaces):
+            sel = (k == j) & ~miss
+            if not sel.any():
+                continue
+            rows = idx[sel]
+            d_new, stopped = surface.interact(new_pos[sel], dd[sel], wavelengths[rows])
+            d[rows] = d_new
+            alive[rows[stopped]] = False
+            absorbed[rows[stopped]] = True
+
+    # 打包: 每条光路的有效点 + NaN 分隔
+    sep = np.full((n, 1, 2), np.nan)
+    pts = np.concatenate([paths, sep], axis=1)
+    keep = np.concatenate([~np.isnan(paths[:, :, 0]), np.ones((n, 1), dtype=bool)], axis=1)
+    packed = pts[keep]
+
+    # 光线终点与最后的方向确定最后一段所在直线，求它与光轴的交点
+    last = paths[np.arange(n), count - 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing = np.where(d[:, 1] != 0, last[:, 0] - (last[:, 1] - y_axis) * d[:, 0] / d[:, 1], np.nan)
+
+    return {
+        "x": packed[:, 0],
+        "y": packed[:, 1],
+        "paths": paths,
+        "position": pos,
+        "direction": d,
+        "wavelength": wavelengths,
+        "absorbed": absorbed,
+        "axis_crossing": crossing,
+    }
+
+
+def wavelength_to_rgb(wavelength: float) -> str:
+    """可见光波长 (380-780 nm) 对应的近似颜色，返回 Plotly 颜色字符串"""
+    w = float(wavelength)
+    if w < 440:
+        r, g, b = (440 - w) / 60, 0.0, 1.0
+    elif w < 490:
+        r, g, b = 0.0, (w - 440) / 50, 1.0
+    elif w < 510:
+        r, g, b = 0.0, 1.0, (510 - w) / 20
+    elif w < 580:
+        r, g, b = (w - 510) / 70, 1.0, 0.0
+    elif w < 645:
+        r, g, b = 1.0, (645 - w) / 65, 0.0
+    else:
+        r, g, b = 1.0, 0.0, 0.0
+    r, g, b = (int(255 * np.clip(c, 0, 1)) for c in (r, g, b))
+    return f"rgb({r}, {g}, {b})"
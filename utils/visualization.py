@@ -98,56 +98,108 @@ def create_trajectory_plot(
     return apply_dark_theme(fig)
 
 
+def _eval_vector_func(vector_func, X: np.ndarray, Y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    在整个网格上一次性求值向量函数
+
+    优先把 X、Y 数组直接传给 vector_func；若函数只支持标量输入
+    (报错或返回形状不符)，退回 np.vectorize 逐点求值。
+    """
+    try:
+        U, V = vector_func(X, Y)
+        U = np.broadcast_to(np.asarray(U, dtype=float), X.shape)
+        V = np.broadcast_to(np.asarray(V, dtype=float), X.shape)
+    except (TypeError, ValueError):
+        U, V = np.vectorize(vector_func, otypes=[float, float])(X, Y)
+    return U, V
+
+
 def create_vector_field(
     x_range: Tuple[float, float],
     y_range: Tuple[float, float],
     vector_func,
     density: int = 15,
     title: str = "向量场",
-    height: int = 500
+    height: int = 500,
+    normalize: bool = True,
+    color: Optional[str] = None,
+    show_magnitude: bool = False
 ) -> go.Figure:
     """
     创建向量场图 (如电场线、磁场线)
     
+    所有箭头合并为一条以 NaN 分隔的折线，只生成一个二维 Scatter 图层。
+    
     Args:
         x_range: x轴范围 (min, max)
         y_range: y轴范围 (min, max)
-        vector_func: 函数 (x, y) -> (vx, vy)
+        vector_func: 函数 (x, y) -> (vx, vy)，最好支持数组输入 (在整个网格上只调用一次)，
+                     只支持标量时自动逐点求值
         density: 箭头密度
+        normalize: True 时箭头等长只表示方向，False 时长度正比于场强大小
+        color: 箭头颜色，默认主题色
+        show_magnitude: 是否在箭头中心叠加按场强着色的散点 (带颜色条)
     """
     x = np.linspace(x_range[0], x_range[1], density)
     y = np.linspace(y_range[0], y_range[1], density)
     X, Y = np.meshgrid(x, y)
+    U, V = _eval_vector_func(vector_func, X, Y)
+    
+    magnitude = np.hypot(U, V)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ux, uy = U / magnitude, V / magnitude
+        scale = 1.0 if normalize else magnitude / np.nanmax(magnitude)
+    
+    # 箭头以格点为中心，最长为格距的 0.8 倍
+    cell = 0.8 * min(np.ptp(x) / max(density - 1, 1), np.ptp(y) / max(density - 1, 1))
+    length = cell * scale
+    dx, dy = 0.5 * length * ux, 0.5 * length * uy
+    tail_x, tail_y = X - dx, Y - dy
+    tip_x, tip_y = X + dx, Y + dy
+    
+    # 箭头两翼: 方向向量旋转 ±150°，长度为箭身的 0.3 倍
+    cos_a, sin_a = np.cos(np.radians(150)), np.sin(np.radians(150))
+    head = 0.3 * length
+    left_x = tip_x + head * (ux * cos_a - uy * sin_a)
+    left_y = tip_y + head * (ux * sin_a + uy * cos_a)
+    right_x = tip_x + head * (ux * cos_a + uy * sin_a)
+    right_y = tip_y + head * (-ux * sin_a + uy * cos_a)
     
-    U = np.zeros_like(X)
-    V = np.zeros_like(Y)
-    
-    for i in range(density):
-        for j in range(density):
-            vx, vy = vector_func(X[i, j], Y[i, j])
-            U[i, j] = vx
-            V[i, j] = vy
-    
-    fig = go.Figure(data=go.Cone(
-        x=X.flatten(),
-        y=Y.flatten(),
-        z=np.zeros_like(X.flatten()),
-        u=U.flatten(),
-        v=V.flatten(),
-        w=np.zeros_like(U.flatten()),
-        colorscale='Blues',
-        sizemode="absolute",
-        sizeref=0.5
+    # 每个箭头: 箭尾 -> 箭头 -> 断开 -> 左翼 -> 箭头 -> 右翼 -> 断开
+    gap = np.full(X.shape, np.nan)
+    arrow_x = np.stack([tail_x, tip_x, gap, left_x, tip_x, right_x, gap], axis=-1).ravel()
+    arrow_y = np.stack([tail_y, tip_y, gap, left_y, tip_y, right_y, gap], axis=-1).ravel()
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=arrow_x, y=arrow_y,
+        mode='lines',
+        name='向量',
+        line=dict(color=color or DARK_THEME["primary_color"], width=1.5),
+        hoverinfo='skip',
+        showlegend=False
     ))
     
+    if show_magnitude:
+        fig.add_trace(go.Scatter(
+            x=X.ravel(), y=Y.ravel(),
+            mode='markers',
+            name='大小',
+            marker=dict(
+                color=magnitude.ravel(),
+                colorscale='Blues',
+                size=5,
+                colorbar=dict(title="|F|")
+            ),
+            showlegend=False
+        ))
+    
     fig.update_layout(
         title=title,
         height=height,
-        scene=dict(
-            xaxis_title="x",
-            yaxis_title="y",
-            zaxis=dict(visible=False)
-        )
+        xaxis_title="x",
+        yaxis_title="y",
+        yaxis=dict(scaleanchor="x", scaleratio=1)
     )
     
     return apply_dark_theme(fig)
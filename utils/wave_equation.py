@@ -0,0 +1,198 @@
+"""
+ QuantPhysics - 一维波动方程
+弦或一维介质上的波: u_tt + γ(x) u_t = c(x)² u_xx，波速 c 与阻尼 γ 可随位置变化
+(不同线密度的弦相接处发生反射与透射)。用于驻波、边界反射、波的叠加等演示。
+
+采用显式蛙跳格式 (时间、空间均为二阶精度)，只保留前一时刻、当前时刻两层网格
+再加一个工作数组，每一步都在这三个预先分配的数组上原地计算，不产生新数组。
+wave_frames 是生成器，每隔 every 步交出一帧，动画再长内存也只与网格点数成正比，
+不会生成整个 (时间 × 空间) 数组。
+
+端点条件:
+    "fixed": 固定端 u = 0 (反射波反相)
+    "free": 自由端 ∂u/∂x = 0 (反射波同相)
+    "absorbing": 吸收端 (一阶 Mur 条件，波从端点出射而几乎不反射，模拟无限长的弦)
+"""
+
+import numpy as np
+from typing import Callable, Iterator, Optional, Tuple
+
+from .physics import ArrayLike
+
+_BOUNDARY_TYPES = ("fixed", "free", "absorbing")
+
+
+def string_wave_speed(tension: ArrayLike, linear_density: ArrayLike) -> ArrayLike:
+    """弦上的波速 v = sqrt(T / μ)"""
+    return np.sqrt(np.asarray(tension, dtype=float) / np.asarray(linear_density, dtype=float))
+
+
+def gaussian_pulse(
+    x: np.ndarray,
+    center: float,
+    width: float,
+    amplitude: float = 1.0,
+    direction: int = 0,
+    c: ArrayLike = 1.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    高斯脉冲的初始位移与速度
+
+    Args:
+        x: 网格坐标 (m)
+        center: 脉冲中心 (m)
+        width: 脉冲宽度 (标准差) (m)
+        amplitude: 振幅 (m)
+        direction: +1 向右传播，-1 向左传播，0 初速度为零 (分裂为左右两个半幅脉冲)
+        c: 波速 (m/s)，标量或与 x 同形
+
+    Returns:
+        (u0, v0)
+    """
+    x = np.asarray(x, dtype=float)
+    u0 = amplitude * np.exp(-0.5 * ((x - center) / width)**2)
+    # 行波 u(x - ct) 满足 u_t = -c u_x
+    v0 = direction * np.asarray(c, dtype=float) * u0 * (x - center) / width**2
+    return u0, v0
+
+
+def wave_frames(
+    u0: np.ndarray,
+    dx: float,
+    c: ArrayLike,
+    t_end: float,
+    dt: Optional[float] = None,
+    v0: Optional[np.ndarray] = None,
+    damping: ArrayLike = 0.0,
+    left: str = "fixed",
+    right: str = "fixed",
+    every: int = 1,
+    left_drive: Optional[Callable[[float], float]] = None,
+    right_drive: Optional[Callable[[float], float]] = None,
+    copy: bool = False
+) -> Iterator[Tuple[float, np.ndarray]]:
+    """
+    一维波动方程的蛙跳格式求解 (生成器，逐帧交出结果)
+
+    u⁺ = [2u - (1 - γΔt/2) u⁻ + (cΔt/Δx)² (u_{i+1} - 2u_i + u_{i-1})] / (1 + γΔt/2)
+
+    Args:
+        u0: 初始位移 (n,)，含两个端点
+        dx: 网格间距 (m)
+        c: 波速 (m/s)，标量或 (n,)
+        t_end: 模拟时长 (s)
+        dt: 时间步长 (s)，默认取稳定性上限 Δx / max(c) 的 0.9 倍
+        v0: 初始速度 (n,)，默认静止
+        damping: 阻尼系数 γ (1/s)，标量或 (n,)
+        left, right: 端点条件，"fixed"、"free" 或 "absorbing"
+        every: 每隔多少步交出一帧
+        left_drive, right_drive: 端点的位移随时间变化的函数 f(t) (m)，给定时覆盖该端的端点条件
+            (如 lambda t: 0.01 * np.sin(2 * np.pi * 5 * t) 激发驻波)
+        copy: 是否交出副本；默认交出内部数组的只读视图，它在下一步会被覆盖，
+            需要保存某一帧时应自行复制
+
+    Yields:
+        (t, u): 时刻与该时刻的位移 (n,)，第一帧为 t = 0
+
+    Usage:
+        x = np.linspace(0, 1, 401)
+        u0, v0 = gaussian_pulse(x, 0.3, 0.02, direction=1)
+        for t, u in wave_frames(u0, x[1] - x[0], 1.0, 2.0, v0=v0, right="free", every=10):
+            ...
+    """
+    for end in (left, right):
+        if end not in _BOUNDARY_TYPES:
+            raise ValueError(f"未知的端点条件 {end!r}，应为 {_BOUNDARY_TYPES} 之一")
+    if every < 1:
+        raise ValueError("every 必须是正整数")
+
+    cur = np.array(u0, dtype=float)
+    n = len(cur)
+    c = np.broadcast_to(np.asarray(c, dtype=float), (n,))
+    gamma = np.broadcast_to(np.asarray(damping, dtype=float), (n,))
+    dt_max = dx / c.max()
+    if dt is None:
+        dt = 0.9 * dt_max
+    elif dt > dt_max:
+        raise ValueError(f"时间步长 {dt:g} s 超过稳定性上限 Δx / c_max = {dt_max:g} s")
+    n_steps = int(round(t_end / dt))
+
+    # 与时间无关的系数
+    r2 = (c * dt / dx)**2
+    a = 1 - 0.5 * gamma * dt
+    inv_b = 1 / (1 + 0.5 * gamma * dt)
+    mur = (c[[0, -1]] * dt - dx) / (c[[0, -1]] * dt + dx)
+
+    prev = np.empty(n)
+    work = np.empty(n)
+
+    def laplacian(u: np.ndarray) -> np.ndarray:
+        """work ← u_{i+1} - 2u_i + u_{i-1} (自由端用镜像点)"""
+        np.add(u[2:], u[:-2], out=work[1:-1])
+        work[1:-1] -= u[1:-1]
+        work[1:-1] -= u[1:-1]
+        work[0] = 2 * (u[1] - u[0])
+        work[-1] = 2 * (u[-2] - u[-1])
+        return work
+
+    def apply_boundaries(new: np.ndarray, old: np.ndarray, t: float) -> None:
+        """端点的新值 (new 为下一时刻，old 为当前时刻)"""
+        for kind, drive, i, j, m in ((left, left_drive, 0, 1, mur[0]),
+                                     (right, right_drive, -1, -2, mur[1])):
+            if drive is not None:
+                new[i] = drive(t)
+            elif kind == "fixed":
+                new[i] = 0.0
+            elif kind == "absorbing":
+                new[i] = old[j] + m * (new[j] - old[i])
+
+    # 第一步: u(-Δt) = u₀ - Δt v₀ + Δt²/2 (c² u_xx - γ v₀) (泰勒展开)
+    v = np.zeros(n) if v0 is None else np.asarray(v0, dtype=float)
+    np.multiply(laplacian(cur), 0.5 * r2, out=prev)
+    prev += cur
+    prev -= dt * (1 + 0.5 * gamma * dt) * v
+    for drive, i in ((left_drive, 0), (right_drive, -1)):
+        if drive is not None:
+            cur[i] = drive(0.0)
+
+    def frame(u: np.ndarray) -> np.ndarray:
+        if copy:
+            return u.copy()
+        view = u.view()
+        view.setflags(write=False)
+        return view
+
+    yield 0.0, frame(cur)
+    for step in range(1, n_steps + 1):
+        lap = laplacian(cur)
+        lap *= r2
+        lap += cur
+        lap += cur
+        # prev ← 下一时刻的位移 (原地覆盖已用完的上一时刻)
+        prev *= a
+        np.subtract(lap, prev, out=prev)
+        prev *= inv_b
+        apply_boundaries(prev, cur, step * dt)
+        prev, cur = cur, prev
+        if step % every == 0:
+            yield step * dt, frame(cur)
+
+
+def string_harmonics(length: float, c: float, n: int = 5, fixed_ends: int = 2) -> np.ndarray:
+    """
+    均匀弦的驻波频率
+
+    Args:
+        length: 弦长 (m)
+        c: 波速 (m/s)
+        n: 谐波个数
+        fixed_ends: 固定端个数，2 (两端固定) 为 f_k = k c / 2L，
+            1 (一端固定一端自由) 为 f_k = (2k - 1) c / 4L，0 (两端自由) 同两端固定
+
+    Returns:
+        频率 (n,) (Hz)
+    """
+    k = np.arange(1, n + 1)
+    if fixed_ends == 1:
+        return (2 * k - 1) * c / (4 * length)
+    return k * c / (2 * length)
@@ -0,0 +1,275 @@
+"""
+ QuantPhysics - 波动光学 (干涉与衍射)
+任意一维/二维孔径 (单缝、双缝、光栅、圆孔等) 的衍射图样:
+    - 夫琅禾费衍射: 远场复振幅是孔径透过率函数的傅里叶变换，一次 FFT 得到整个图样
+    - 角谱法: 任意距离的菲涅耳衍射，FFT → 乘传递函数 → 逆 FFT
+另有多缝干涉、薄膜干涉的解析公式，参数均可为数组 (滑块扫描)。
+
+FFT 的频率网格与角谱传递函数中的 k_z 网格按 (点数, 采样间隔, 波长) 用 lru_cache 缓存，
+拖动滑块重新计算时不重复生成; FFT 本身的旋转因子由 numpy.fft (pocketfft) 内部缓存。
+"""
+
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
+
+from .physics import ArrayLike
+
+
+# ============================================
+# 孔径
+# ============================================
+
+def slit_aperture(
+    x: np.ndarray,
+    width: float,
+    n_slits: int = 1,
+    spacing: float = 0.0,
+    center: float = 0.0
+) -> np.ndarray:
+    """
+    N 缝孔径 (单缝、双缝、光栅) 的透过率
+
+    Args:
+        x: 采样坐标 (m)
+        width: 缝宽 a (m)
+        n_slits: 缝数
+        spacing: 相邻缝中心距 d (m)
+        center: 缝组中心位置 (m)
+
+    Returns:
+        透过率 (0 或 1)，形状同 x
+    """
+    x = np.asarray(x, dtype=float)
+    centers = center + spacing * (np.arange(n_slits) - 0.5 * (n_slits - 1))
+    return (np.abs(x[..., None] - centers) <= 0.5 * width).any(axis=-1).astype(float)
+
+
+def circular_aperture(X: np.ndarray, Y: np.ndarray, radius: float) -> np.ndarray:
+    """圆孔的透过率"""
+    return (X**2 + Y**2 <= radius**2).astype(float)
+
+
+def rect_aperture(X: np.ndarray, Y: np.ndarray, width: float, height: float) -> np.ndarray:
+    """矩形孔的透过率"""
+    return ((np.abs(X) <= 0.5 * width) & (np.abs(Y) <= 0.5 * height)).astype(float)
+
+
+# ============================================
+# 频率网格 (缓存)
+# ============================================
+
+def _frozen(a: np.ndarray) -> np.ndarray:
+    a.setflags(write=False)
+    return a
+
+
+@lru_cache(maxsize=32)
+def _fft_frequencies(n: int, dx: float) -> np.ndarray:
+    """fftshift 之后的空间频率 (1/m)"""
+    return _frozen(np.fft.fftshift(np.fft.fftfreq(n, dx)))
+
+
+@lru_cache(maxsize=16)
+def _kz_grid(shape: Tuple[int, ...], dx: float, wavelength: float) -> np.ndarray:
+    """
+    角谱法的纵向波数 k_z = sqrt(k² - kx² - ky²) (未移频的 FFT 顺序)
+
+    倏逝波 (k_z 为虚数) 用负数标记，传播时置零。
+    """
+    k2 = (2 * np.pi / wavelength)**2
+    kt2 = sum(np.meshgrid(*[(2 * np.pi * np.fft.fftfreq(n, dx))**2 for n in shape],
+                          indexing="ij", sparse=True))
+    kz2 = k2 - kt2
+    return _frozen(np.where(kz2 >= 0, np.sqrt(np.abs(kz2)), -1.0))
+
+
+# ============================================
+# 衍射
+# ============================================
+
+def fraunhofer_pattern(
+    aperture: np.ndarray,
+    dx: float,
+    wavelength: float,
+    distance: Optional[float] = None,
+    pad: int = 4,
+    normalize: bool = True
+) -> Tuple[Union[np.ndarray, Tuple[np.ndarray, ...]], np.ndarray]:
+    """
+    夫琅禾费 (远场) 衍射图样
+
+    Args:
+        aperture: 孔径透过率 (n,) 或 (ny, nx)，可为复数 (相位板)
+        dx: 孔径采样间隔 (m)
+        wavelength: 波长 (m)
+        distance: 屏到孔径的距离 (m)；None 时坐标为 sinθ
+        pad: 补零倍数，越大图样采样越细
+        normalize: 是否把最大光强归一化为 1
+
+    Returns:
+        (coords, intensity):
+            coords: 一维时为屏上坐标 (或 sinθ) (m_pad,)；二维时为 (y, x) 两个一维坐标
+            intensity: 光强，只保留 |sinθ| ≤ 1 的部分
+    """
+    aperture = np.asarray(aperture)
+    shape = tuple(pad * n for n in aperture.shape)
+    field = np.fft.fftshift(np.fft.fftn(aperture, s=shape))
+    intensity = np.abs(field)**2
+    if normalize and intensity.max() > 0:
+        intensity /= intensity.max()
+
+    scale = wavelength if distance is None else wavelength * distance
+    coords, keep = [], []
+    for n in shape:
+        f = _fft_frequencies(n, dx)
+        ok = np.abs(wavelength * f) <= 1
+        coords.append(scale * f[ok])
+        keep.append(np.nonzero(ok)[0])
+    intensity = intensity[np.ix_(*keep)]
+    return (coords[0] if len(coords) == 1 else tuple(coords)), intensity
+
+
+def angular_spectrum(
+    field: np.ndarray,
+    dx: float,
+    wavelength: float,
+    z: ArrayLike,
+    pad: int = 2
+) -> np.ndarray:
+    """
+    角谱法衍射传播 (菲涅耳衍射，任意传播距离的近场图样)
+
+    U(z) = IFFT[ FFT[U(0)] · exp(i k_z z) ]，一次计算多个距离。
+    计算前四周补零，并滤去传播后会越出计算区域的高频分量 (限带角谱法)，
+    以抑制周期边界造成的混叠，结果裁回原网格。距离很远时图样可能超出网格，
+    应改用 fraunhofer_pattern。
+
+    Args:
+        field: 孔径平面的复振幅 (n,) 或 (ny, nx)
+        dx: 采样间隔 (m)
+        wavelength: 波长 (m)
+        z: 传播距离 (m)，标量或 (n_z,)
+        pad: 补零后的尺寸倍数
+
+    Returns:
+        复振幅，形状为 field.shape (z 为标量) 或 (n_z,) + field.shape
+
+    Usage:
+        x = np.linspace(-2e-3, 2e-3, 2048)
+        U = angular_spectrum(slit_aperture(x, 2e-4), x[1] - x[0], 632.8e-9, [0.01, 0.05, 0.2])
+        I = np.abs(U)**2
+    """
+    field = np.asarray(field, dtype=complex)
+    shape = field.shape
+    padded_shape = tuple(pad * n for n in shape)
+    offsets = tuple((p - n) // 2 for p, n in zip(padded_shape, shape))
+    padded = np.zeros(padded_shape, dtype=complex)
+    crop = tuple(slice(o, o + n) for o, n in zip(offsets, shape))
+    padded[crop] = field
+
+    kz = _kz_grid(padded_shape, float(dx), float(wavelength))
+    spectrum = np.fft.fftn(padded)
+    z_arr = np.asarray(z, dtype=float)
+    zz = z_arr.reshape(z_arr.shape + (1,) * len(shape))
+    H = np.where(kz >= 0, np.exp(1j * kz * zz), 0)
+    # 限带角谱: 传播到 z 处会超出计算区域 (经周期边界混叠回来) 的高频分量置零，
+    # 频率上限 f = 1 / (λ sqrt((2z / L)² + 1))，L 为补零后的区域宽度
+    for axis, n in enumerate(padded_shape):
+        f = np.fft.fftfreq(n, dx).reshape((-1,) + (1,) * (len(shape) - 1 - axis))
+        f_max = 1 / (wavelength * np.sqrt((2 * zz / (n * dx))**2 + 1))
+        H = H * (np.abs(f) <= f_max)
+    out = np.fft.ifftn(spectrum * H, axes=tuple(range(-len(shape), 0)))
+    return out[(Ellipsis,) + crop]
+
+
+# ============================================
+# 解析公式
+# ============================================
+
+def multi_slit_intensity(
+    sin_theta: ArrayLike,
+    wavelength: ArrayLike,
+    width: ArrayLike,
+    spacing: ArrayLike = 0.0,
+    n_slits: int = 1
+) -> ArrayLike:
+    """
+    N 缝夫琅禾费衍射的相对光强 (单缝衍射因子 × 多缝干涉因子)
+
+    I / I₀ = [sin α / α]² · [sin(Nβ) / (N sin β)]²，
+    α = π a sinθ / λ，β = π d sinθ / λ
+
+    Args:
+        sin_theta: 衍射角的正弦
+        wavelength: 波长 (m)
+        width: 缝宽 a (m)
+        spacing: 缝间距 d (m)，单缝时不用
+        n_slits: 缝数
+
+    Returns:
+        相对光强 (中央极大为 1)，各参数按 NumPy 规则广播
+    """
+    sin_theta = np.asarray(sin_theta, dtype=float)
+    alpha = np.pi * np.asarray(width, dtype=float) * sin_theta / wavelength
+    envelope = np.sinc(alpha / np.pi)**2
+    if n_slits == 1:
+        return envelope
+    beta = np.pi * np.asarray(spacing, dtype=float) * sin_theta / wavelength
+    num = np.sin(n_slits * beta)
+    den = n_slits * np.sin(beta)
+    # 主极大处 (sin β = 0) 干涉因子为 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = np.where(np.abs(den) > 1e-12, num / den, 1.0)
+    return envelope * factor**2
+
+
+def thin_film_reflectance(
+    wavelength: ArrayLike,
+    thickness: ArrayLike,
+    n_film: ArrayLike,
+    n_incident: ArrayLike = 1.0,
+    n_substrate: ArrayLike = 1.52,
+    angle: ArrayLike = 0.0
+) -> Dict[str, ArrayLike]:
+    """
+    薄膜干涉的反射率 (计入多次反射的精确公式，自然光取 s、p 偏振平均)
+
+    Args:
+        wavelength: 真空中的波长 (m)
+        thickness: 膜厚 (m)，可为数组 (劈尖、牛顿环的空气膜厚度分布)
+        n_film: 薄膜折射率
+        n_incident: 入射介质折射率
+        n_substrate: 基底折射率
+        angle: 入射角 (度)
+
+    Returns:
+        字典，包含:
+            R: 反射率 (自然光)
+            R_s, R_p: s、p 偏振的反射率
+            phase: 膜内往返的相位差 δ = 4π n d cos θ_t / λ
+    """
+    n0 = np.asarray(n_incident, dtype=complex)
+    n1 = np.asarray(n_film, dtype=complex)
+    n2 = np.asarray(n_substrate, dtype=complex)
+    s0 = np.sin(np.radians(angle))
+    cos0 = np.sqrt(1 - s0**2 + 0j)
+    cos1 = np.sqrt(1 - (n0 * s0 / n1)**2)
+    cos2 = np.sqrt(1 - (n0 * s0 / n2)**2)
+    delta = 4 * np.pi * n1 * np.asarray(thickness, dtype=float) * cos1 / wavelength
+
+    def airy(r01, r12):
+        r = (r01 + r12 * np.exp(1j * delta)) / (1 + r01 * r12 * np.exp(1j * delta))
+        return np.abs(r)**2
+
+    # 菲涅耳反射系数
+    R_s = airy((n0 * cos0 - n1 * cos1) / (n0 * cos0 + n1 * cos1),
+               (n1 * cos1 - n2 * cos2) / (n1 * cos1 + n2 * cos2))
+    R_p = airy((n1 * cos0 - n0 * cos1) / (n1 * cos0 + n0 * cos1),
+               (n2 * cos1 - n1 * cos2) / (n2 * cos1 + n1 * cos2))
+    return {
+        "R": 0.5 * (R_s + R_p),
+        "R_s": R_s,
+        "R_p": R_p,
+        "phase": np.real(delta),
+    }